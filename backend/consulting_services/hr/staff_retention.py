@@ -3,8 +3,96 @@ HR Staff Retention Analysis Task
 Analyzes turnover rates and provides retention strategies with comprehensive business report.
 """
 
+import bisect
+from datetime import datetime
+from string import Template
+
+import numpy as np
+
 from backend.shared.utils.common import success_payload, error_payload, require, validate_positive_numbers
 
+# Turnover rate upper bounds (inclusive) for each performance bucket, best to worst
+_TURNOVER_THRESHOLDS = (30.0, 50.0, 70.0)
+_TURNOVER_BUCKETS = (("Excellent", "green"), ("Good", "blue"), ("Acceptable", "yellow"), ("Needs Improvement", "red"))
+_BUCKET_LABELS_NP = np.array([label for label, _ in _TURNOVER_BUCKETS], dtype=object)
+_BUCKET_COLORS_NP = np.array([color for _, color in _TURNOVER_BUCKETS], dtype=object)
+
+# Cost model: replacing an employee costs 1.5x an assumed $30,000 annual salary, for a 25-person staff
+_REPLACEMENT_COST_PER_EMPLOYEE = 30000 * 1.5
+_ASSUMED_HEADCOUNT = 25
+
+# Recommendation sets, picked by turnover vs industry average and by absolute turnover
+_REC_REDUCE_TURNOVER = "Reduce turnover rate by {:.1f}% to match industry average"
+_REC_ABOVE_INDUSTRY = (
+    "Implement stay interviews to understand exit reasons",
+    "Launch peer recognition and reward programs",
+    "Offer quarterly professional development workshops",
+)
+_REC_AT_OR_BELOW_INDUSTRY = (
+    "Maintain current retention strategies - performance is above industry average",
+    "Continue investing in employee development programs",
+)
+_REC_HIGH_TURNOVER = (
+    "Conduct exit interviews to identify systemic issues",
+    "Review compensation and benefits packages",
+    "Improve onboarding and training processes",
+)
+
+# Benchmark thresholds are fixed, so their report strings are formatted once at import
+_BENCHMARK_CTX = {
+    name: f"{threshold:.1f}"
+    for name, threshold in zip(("excellent_threshold", "good_threshold", "acceptable_threshold"), _TURNOVER_THRESHOLDS)
+}
+
+# Report templates, compiled once at import and filled per request with pre-formatted strings
+_HTML_T = Template(
+    '<section class="report"><header class="report__header"><h2>Staff Retention Analysis</h2>'
+    '<div class="report__meta">Generated: ${generated}</div><div class="badge badge--${badge}">${performance}</div></header>'
+    '<article class="report__body"><p class="lead">This staff retention analysis reveals <strong>${performance_lower}</strong> '
+    'turnover metrics with <strong>${risk_level_lower}</strong> risk level compared to industry standards.</p>'
+    '<h3>Key Performance Metrics</h3><ul><li>Turnover Rate: ${turnover_rate}%</li><li>Retention Rate: ${retention_rate}%</li>'
+    '<li>Industry Average: ${industry_average}%</li><li>vs Industry: ${vs_industry}%</li>'
+    '<li>Estimated Annual Cost: $$${estimated_annual_cost}</li></ul>'
+    '<h3>Industry Benchmarks</h3><ul><li>Excellent Threshold: ${excellent_threshold}%</li>'
+    '<li>Good Threshold: ${good_threshold}%</li><li>Acceptable Threshold: ${acceptable_threshold}%</li>'
+    '<li>Industry Average: ${industry_average}%</li></ul>'
+    '<h3>Additional Insights</h3><ul><li>Risk Level: ${risk_level}</li>'
+    '<li>Replacement Cost per Employee: $$${replacement_cost_per_employee}</li>'
+    '<li>Cost Savings Potential: $$${cost_savings_potential}</li><li>Strategy Priority: ${retention_strategy_priority}</li></ul>'
+    '<h3>Strategic Recommendations</h3><ol>${recs_html}</ol></article></section>'
+)
+
+_TEXT_T = Template("""RESTAURANT CONSULTING REPORT — STAFF RETENTION ANALYSIS
+Generated: ${generated}
+
+PERFORMANCE RATING: ${performance_upper}
+
+This staff retention analysis reveals ${performance_lower} turnover metrics with ${risk_level_lower} risk level compared to industry standards.
+
+KEY PERFORMANCE METRICS
+• Turnover Rate: ${turnover_rate}%
+• Retention Rate: ${retention_rate}%
+• Industry Average: ${industry_average}%
+• vs Industry: ${vs_industry}%
+• Estimated Annual Cost: $$${estimated_annual_cost}
+
+INDUSTRY BENCHMARKS
+• Excellent Threshold: ${excellent_threshold}%
+• Good Threshold: ${good_threshold}%
+• Acceptable Threshold: ${acceptable_threshold}%
+• Industry Average: ${industry_average}%
+
+ADDITIONAL INSIGHTS
+• Risk Level: ${risk_level}
+• Replacement Cost per Employee: $$${replacement_cost_per_employee}
+• Cost Savings Potential: $$${cost_savings_potential}
+• Strategy Priority: ${retention_strategy_priority}
+
+STRATEGIC RECOMMENDATIONS
+${recs_text}
+
+END OF REPORT""")
+
 
 def run(params: dict, file_bytes: bytes | None = None) -> tuple[dict, int]:
     """
@@ -39,18 +127,7 @@ def run(params: dict, file_bytes: bytes | None = None) -> tuple[dict, int]:
         vs_industry = turnover_rate - industry_average
 
         # Performance assessment
-        if turnover_rate <= 30:
-            performance = "Excellent"
-            performance_color = "green"
-        elif turnover_rate <= 50:
-            performance = "Good"
-            performance_color = "blue"
-        elif turnover_rate <= 70:
-            performance = "Acceptable"
-            performance_color = "yellow"
-        else:
-            performance = "Needs Improvement"
-            performance_color = "red"
+        performance, performance_color = _TURNOVER_BUCKETS[bisect.bisect_left(_TURNOVER_THRESHOLDS, turnover_rate)]
 
         # Risk assessment
         if turnover_rate > industry_average + 20:
@@ -61,93 +138,43 @@ def run(params: dict, file_bytes: bytes | None = None) -> tuple[dict, int]:
             risk_level = "Low"
 
         # Calculate cost impact (estimated)
-        # Average cost to replace an employee is 1.5x their annual salary
-        # Assuming average restaurant worker makes $30,000 annually
-        avg_annual_salary = 30000
-        replacement_cost_per_employee = avg_annual_salary * 1.5
-        estimated_annual_turnover_cost = (turnover_rate / 100) * 25 * replacement_cost_per_employee  # Assuming 25 employees
+        replacement_cost_per_employee = _REPLACEMENT_COST_PER_EMPLOYEE
+        estimated_annual_turnover_cost = (turnover_rate / 100) * _ASSUMED_HEADCOUNT * replacement_cost_per_employee
 
         # Generate recommendations
-        recommendations = []
         if turnover_rate > industry_average:
-            recommendations.append(f"Reduce turnover rate by {vs_industry:.1f}% to match industry average")
-            recommendations.append("Implement stay interviews to understand exit reasons")
-            recommendations.append("Launch peer recognition and reward programs")
-            recommendations.append("Offer quarterly professional development workshops")
+            recommendations = [_REC_REDUCE_TURNOVER.format(vs_industry), *_REC_ABOVE_INDUSTRY]
         else:
-            recommendations.append("Maintain current retention strategies - performance is above industry average")
-            recommendations.append("Continue investing in employee development programs")
-
+            recommendations = list(_REC_AT_OR_BELOW_INDUSTRY)
         if turnover_rate > 50:
-            recommendations.append("Conduct exit interviews to identify systemic issues")
-            recommendations.append("Review compensation and benefits packages")
-            recommendations.append("Improve onboarding and training processes")
-
-        # Prepare data for business report
-        metrics = {
-            "turnover_rate": round(turnover_rate, 2),
-            "retention_rate": round(retention_rate, 2),
-            "industry_average": industry_average,
-            "vs_industry": round(vs_industry, 2),
-            "estimated_annual_cost": round(estimated_annual_turnover_cost, 2)
-        }
-
-        performance_data = {
-            "rating": performance,
-            "color": performance_color,
-            "risk_level": risk_level
-        }
-
-        benchmarks = {
-            "excellent_threshold": 30.0,
-            "good_threshold": 50.0,
-            "acceptable_threshold": 70.0,
-            "industry_average": industry_average
-        }
-
-        additional_insights = {
-            "replacement_cost_per_employee": replacement_cost_per_employee,
-            "cost_savings_potential": round(estimated_annual_turnover_cost * 0.3, 2),  # 30% reduction potential
-            "retention_strategy_priority": "High" if turnover_rate > 70 else "Medium" if turnover_rate > 50 else "Low",
-            "employee_satisfaction_focus": "Critical" if turnover_rate > industry_average else "Maintain"
+            recommendations.extend(_REC_HIGH_TURNOVER)
+
+        cost_savings_potential = round(estimated_annual_turnover_cost * 0.3, 2)  # 30% reduction potential
+        retention_strategy_priority = "High" if turnover_rate > 70 else "Medium" if turnover_rate > 50 else "Low"
+
+        # Generate business reports from the prebuilt templates; numbers are formatted once for both
+        ctx = {
+            **_BENCHMARK_CTX,
+            "generated": datetime.now().strftime("%B %d, %Y"),
+            "badge": performance.lower().replace(" ", "-"),
+            "performance": performance,
+            "performance_lower": performance.lower(),
+            "performance_upper": performance.upper(),
+            "risk_level": risk_level,
+            "risk_level_lower": risk_level.lower(),
+            "turnover_rate": f"{turnover_rate:.1f}",
+            "retention_rate": f"{retention_rate:.1f}",
+            "industry_average": f"{industry_average:.1f}",
+            "vs_industry": f"{vs_industry:+.1f}",
+            "estimated_annual_cost": f"{estimated_annual_turnover_cost:,.0f}",
+            "replacement_cost_per_employee": f"{replacement_cost_per_employee:,.0f}",
+            "cost_savings_potential": f"{cost_savings_potential:,.0f}",
+            "retention_strategy_priority": retention_strategy_priority,
+            "recs_html": "".join(f"<li>{rec}</li>" for rec in recommendations),
+            "recs_text": "\n".join(f"{i}. {rec}" for i, rec in enumerate(recommendations, 1)),
         }
-
-        # Generate business report HTML
-        business_report_html = f"""<section class="report"><header class="report__header"><h2>Staff Retention Analysis</h2><div class="report__meta">Generated: {__import__('datetime').datetime.now().strftime('%B %d, %Y')}</div><div class="badge badge--{performance.lower().replace(' ', '-')}">{performance}</div></header><article class="report__body"><p class="lead">This staff retention analysis reveals <strong>{performance.lower()}</strong> turnover metrics with <strong>{risk_level.lower()}</strong> risk level compared to industry standards.</p><h3>Key Performance Metrics</h3><ul><li>Turnover Rate: {turnover_rate:.1f}%</li><li>Retention Rate: {retention_rate:.1f}%</li><li>Industry Average: {industry_average:.1f}%</li><li>vs Industry: {vs_industry:+.1f}%</li><li>Estimated Annual Cost: ${estimated_annual_turnover_cost:,.0f}</li></ul><h3>Industry Benchmarks</h3><ul><li>Excellent Threshold: {benchmarks['excellent_threshold']:.1f}%</li><li>Good Threshold: {benchmarks['good_threshold']:.1f}%</li><li>Acceptable Threshold: {benchmarks['acceptable_threshold']:.1f}%</li><li>Industry Average: {benchmarks['industry_average']:.1f}%</li></ul><h3>Additional Insights</h3><ul><li>Risk Level: {risk_level}</li><li>Replacement Cost per Employee: ${replacement_cost_per_employee:,.0f}</li><li>Cost Savings Potential: ${additional_insights['cost_savings_potential']:,.0f}</li><li>Strategy Priority: {additional_insights['retention_strategy_priority']}</li></ul><h3>Strategic Recommendations</h3><ol>{''.join([f'<li>{rec}</li>' for rec in recommendations])}</ol></article></section>"""
-
-        # Generate text business report
-        business_report = f"""
-RESTAURANT CONSULTING REPORT — STAFF RETENTION ANALYSIS
-Generated: {__import__('datetime').datetime.now().strftime('%B %d, %Y')}
-
-PERFORMANCE RATING: {performance.upper()}
-
-This staff retention analysis reveals {performance.lower()} turnover metrics with {risk_level.lower()} risk level compared to industry standards.
-
-KEY PERFORMANCE METRICS
-• Turnover Rate: {turnover_rate:.1f}%
-• Retention Rate: {retention_rate:.1f}%
-• Industry Average: {industry_average:.1f}%
-• vs Industry: {vs_industry:+.1f}%
-• Estimated Annual Cost: ${estimated_annual_turnover_cost:,.0f}
-
-INDUSTRY BENCHMARKS
-• Excellent Threshold: {benchmarks['excellent_threshold']:.1f}%
-• Good Threshold: {benchmarks['good_threshold']:.1f}%
-• Acceptable Threshold: {benchmarks['acceptable_threshold']:.1f}%
-• Industry Average: {benchmarks['industry_average']:.1f}%
-
-ADDITIONAL INSIGHTS
-• Risk Level: {risk_level}
-• Replacement Cost per Employee: ${replacement_cost_per_employee:,.0f}
-• Cost Savings Potential: ${additional_insights['cost_savings_potential']:,.0f}
-• Strategy Priority: {additional_insights['retention_strategy_priority']}
-
-STRATEGIC RECOMMENDATIONS
-{chr(10).join([f'{i+1}. {rec}' for i, rec in enumerate(recommendations)])}
-
-END OF REPORT
-        """.strip()
+        business_report_html = _HTML_T.substitute(ctx)
+        business_report = _TEXT_T.substitute(ctx)
 
         # Prepare response data
         data = {
@@ -170,3 +197,65 @@ END OF REPORT
         return error_payload(service, subtask, str(e))
     except Exception as e:
         return error_payload(service, subtask, f"Internal error: {str(e)}", 500)
+
+
+def run_batch(turnover_rates, industry_averages=70.0, include_reports: bool = False) -> dict:
+    """
+    Calculate staff retention metrics for many locations in one vectorized pass.
+
+    Each field is computed as one contiguous NumPy array, so portfolio-level callers avoid
+    running the full single-location analysis per row.
+
+    Args:
+        turnover_rates: Array-like of turnover rates (0-200%), one per location
+        industry_averages: Array-like of industry averages per location, or a single value for all
+        include_reports: Also render the per-location business reports via run() (slower)
+
+    Returns:
+        Dictionary of per-location arrays
+
+    Raises:
+        ValueError: If any turnover rate is missing, negative or above 200%
+    """
+    try:
+        rates = np.asarray(turnover_rates, dtype=np.float64)
+        averages = np.asarray(industry_averages, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError("turnover_rates and industry_averages must contain only numbers")
+    try:
+        averages = np.broadcast_to(averages, rates.shape).copy()
+    except ValueError:
+        raise ValueError("industry_averages must be a single value or match the length of turnover_rates")
+
+    if np.any(np.isnan(rates)):
+        raise ValueError("turnover_rate must be a valid number")
+    if np.any(rates < 0):
+        raise ValueError("turnover_rate must be >= 0")
+    if np.any(rates > 200):
+        raise ValueError("Turnover rate cannot exceed 200%")
+
+    vs_industry = rates - averages
+    # side="left" keeps the inclusive upper bounds used by run()
+    bucket = np.searchsorted(_TURNOVER_THRESHOLDS, rates, side="left")
+    risk_level = np.select([rates > averages + 20, rates > averages], ["High", "Moderate"], default="Low").astype(object)
+
+    result = {
+        "turnover_rate": rates,
+        "retention_rate": 100.0 - rates,
+        "industry_average": averages,
+        "vs_industry": vs_industry,
+        "performance_rating": _BUCKET_LABELS_NP[bucket],
+        "performance_color": _BUCKET_COLORS_NP[bucket],
+        "risk_level": risk_level,
+        "estimated_annual_cost": (rates / 100.0) * _ASSUMED_HEADCOUNT * _REPLACEMENT_COST_PER_EMPLOYEE,
+    }
+
+    if include_reports:
+        reports = [
+            run({"turnover_rate": float(rate), "industry_average": float(avg)})[0]["data"]
+            for rate, avg in zip(rates.flat, averages.flat)
+        ]
+        result["business_report_html"] = [report["business_report_html"] for report in reports]
+        result["business_report"] = [report["business_report"] for report in reports]
+
+    return result
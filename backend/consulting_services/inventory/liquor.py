@@ -3,9 +3,24 @@ Liquor Cost Module
 Handles liquor inventory, cost tracking, and bar management
 """
 
+import numpy as np
+
+from backend.consulting_services.inventory.variance_kernel import scalar_variance, variance_arrays
+
+# Static error responses for invalid variance inputs. They are shared between calls,
+# so callers must treat them as read-only.
+_ERR_EXPECTED_NULL = {"status": "error", "message": "expected_oz cannot be null"}
+_ERR_ACTUAL_NULL = {"status": "error", "message": "actual_oz cannot be null"}
+_ERR_EXPECTED_NEGATIVE = {"status": "error", "message": "expected_oz cannot be negative"}
+_ERR_ACTUAL_NEGATIVE = {"status": "error", "message": "actual_oz cannot be negative"}
+_ERR_EXPECTED_ZERO = {"status": "error", "message": "expected_oz cannot be zero"}
+
+# Placeholder response for run(); shared between calls and read-only like the errors above
+_RUN_RESPONSE = {"tool": "Liquor Management", "status": "OK — logic not implemented yet"}
+
 
 def run():
-    return {"tool": "Liquor Management", "status": "OK — logic not implemented yet"}
+    return _RUN_RESPONSE
 
 
 def calculate_liquor_variance(expected_oz, actual_oz):
@@ -19,36 +34,81 @@ def calculate_liquor_variance(expected_oz, actual_oz):
     Returns:
         dict: Variance calculations or error response
     """
-    # Input validation
+    error = _validate_variance_inputs(expected_oz, actual_oz)
+    if error is not None:
+        return error
+
+    # Perform calculations
+    result = scalar_variance(expected_oz, actual_oz)
+
+    return {
+        "status": "success",
+        "expected_oz": result.expected,
+        "actual_oz": result.actual,
+        "variance_oz": result.variance,
+        "variance_percent": result.variance_percent,
+    }
+
+
+def _validate_variance_inputs(expected_oz, actual_oz):
+    """Return the error response for invalid variance inputs, or None if they are usable"""
     if expected_oz is None:
-        return {"status": "error", "message": "expected_oz cannot be null"}
+        return _ERR_EXPECTED_NULL
     if actual_oz is None:
-        return {"status": "error", "message": "actual_oz cannot be null"}
+        return _ERR_ACTUAL_NULL
 
-    # Check for numeric types
-    if not isinstance(expected_oz, (int, float)):
-        return {"status": "error", "message": f"expected_oz must be a number, got {type(expected_oz).__name__}"}
-    if not isinstance(actual_oz, (int, float)):
-        return {"status": "error", "message": f"actual_oz must be a number, got {type(actual_oz).__name__}"}
+    # Exact int/float is the common case and skips the isinstance walk; bool is an int
+    # subclass but never a valid quantity. Type errors name the offending type, so they
+    # cannot be static.
+    t = type(expected_oz)
+    if t is not float and t is not int and (t is bool or not isinstance(expected_oz, (int, float))):
+        return {"status": "error", "message": f"expected_oz must be a number, got {t.__name__}"}
+    t = type(actual_oz)
+    if t is not float and t is not int and (t is bool or not isinstance(actual_oz, (int, float))):
+        return {"status": "error", "message": f"actual_oz must be a number, got {t.__name__}"}
 
-    # Check for negative values
     if expected_oz < 0:
-        return {"status": "error", "message": "expected_oz cannot be negative"}
+        return _ERR_EXPECTED_NEGATIVE
     if actual_oz < 0:
-        return {"status": "error", "message": "actual_oz cannot be negative"}
+        return _ERR_ACTUAL_NEGATIVE
 
-    # Check for zero expected_oz (division by zero)
+    # Zero expected usage would divide by zero
     if expected_oz == 0:
-        return {"status": "error", "message": "expected_oz cannot be zero"}
+        return _ERR_EXPECTED_ZERO
+    return None
 
-    # Perform calculations
-    variance = actual_oz - expected_oz
-    variance_percent = (variance / expected_oz) * 100
+
+def calculate_liquor_variance_batch(expected_oz, actual_oz):
+    """
+    Calculate liquor variance for many items in one vectorized pass
+
+    Args:
+        expected_oz (array-like): Expected liquor usage in ounces, one entry per item
+        actual_oz (array-like): Actual liquor usage in ounces, one entry per item
+
+    Returns:
+        dict: Arrays of variance calculations or error response. Items with a zero
+        expected_oz get a NaN variance_percent instead of failing the whole batch.
+    """
+    try:
+        expected = np.asarray(expected_oz, dtype=np.float64)
+        actual = np.asarray(actual_oz, dtype=np.float64)
+    except (TypeError, ValueError):
+        return {"status": "error", "message": "expected_oz and actual_oz must contain only numbers"}
+
+    if expected.shape != actual.shape:
+        return {"status": "error", "message": "expected_oz and actual_oz must have the same length"}
+    if np.any(expected < 0):
+        return {"status": "error", "message": "expected_oz cannot be negative"}
+    if np.any(actual < 0):
+        return {"status": "error", "message": "actual_oz cannot be negative"}
+
+    variance, variance_percent = variance_arrays(expected, actual)
 
     return {
         "status": "success",
-        "expected_oz": expected_oz,
-        "actual_oz": actual_oz,
-        "variance_oz": round(variance, 2),
-        "variance_percent": round(variance_percent, 2),
+        "expected_oz": expected,
+        "actual_oz": actual,
+        "variance_oz": variance,
+        "variance_percent": variance_percent,
     }
@@ -3,11 +3,54 @@ Inventory Management Module
 Handles stock tracking, ordering, and inventory optimization
 """
 
-from backend.shared.utils.business_report import format_business_insight, format_comprehensive_analysis
+import bisect
+
+import numpy as np
+
+from backend.consulting_services.inventory.variance_kernel import scalar_variance, variance_arrays
+
+# Absolute variance % upper bounds (inclusive) for each bucket, with the matching canned text
+_VARIANCE_THRESHOLDS = (5.0, 10.0)
+_VARIANCE_INTERPRETATIONS = (
+    "A variance of {:.1f}% is within acceptable range (±5%). This indicates good inventory control and accurate forecasting.",
+    "A variance of {:.1f}% is moderate and requires attention. This suggests some forecasting inaccuracies or operational issues.",
+    "A variance of {:.1f}% is significant and requires immediate action. This indicates major forecasting errors or operational problems.",
+)
+_VARIANCE_RECOMMENDATIONS = (
+    (
+        "Maintain current inventory management practices",
+        "Continue monitoring variance trends",
+        "Consider implementing automated reordering systems",
+    ),
+    (
+        "Review forecasting methods and historical data",
+        "Improve communication between kitchen and management",
+        "Implement daily inventory tracking",
+        "Train staff on proper portion control",
+    ),
+    (
+        "Conduct immediate inventory audit",
+        "Review and update forecasting algorithms",
+        "Implement stricter inventory controls",
+        "Investigate potential theft or waste issues",
+        "Consider hiring inventory management specialist",
+    ),
+)
+
+# Static error responses for invalid variance inputs. They are shared between calls,
+# so callers must treat them as read-only.
+_ERR_EXPECTED_NULL = {"status": "error", "message": "expected_usage cannot be null"}
+_ERR_ACTUAL_NULL = {"status": "error", "message": "actual_usage cannot be null"}
+_ERR_EXPECTED_NEGATIVE = {"status": "error", "message": "expected_usage cannot be negative"}
+_ERR_ACTUAL_NEGATIVE = {"status": "error", "message": "actual_usage cannot be negative"}
+_ERR_EXPECTED_ZERO = {"status": "error", "message": "expected_usage cannot be zero"}
+
+# Placeholder response for run(); shared between calls and read-only like the errors above
+_RUN_RESPONSE = {"tool": "Inventory Management", "status": "OK — logic not implemented yet"}
 
 
 def run():
-    return {"tool": "Inventory Management", "status": "OK — logic not implemented yet"}
+    return _RUN_RESPONSE
 
 
 def calculate_inventory_variance(expected_usage, actual_usage):
@@ -21,31 +64,15 @@ def calculate_inventory_variance(expected_usage, actual_usage):
     Returns:
         dict: Variance calculations or error response
     """
-    # Input validation
-    if expected_usage is None:
-        return {"status": "error", "message": "expected_usage cannot be null"}
-    if actual_usage is None:
-        return {"status": "error", "message": "actual_usage cannot be null"}
-
-    # Check for numeric types
-    if not isinstance(expected_usage, (int, float)):
-        return {"status": "error", "message": f"expected_usage must be a number, got {type(expected_usage).__name__}"}
-    if not isinstance(actual_usage, (int, float)):
-        return {"status": "error", "message": f"actual_usage must be a number, got {type(actual_usage).__name__}"}
-
-    # Check for negative values
-    if expected_usage < 0:
-        return {"status": "error", "message": "expected_usage cannot be negative"}
-    if actual_usage < 0:
-        return {"status": "error", "message": "actual_usage cannot be negative"}
-
-    # Check for zero expected_usage (division by zero)
-    if expected_usage == 0:
-        return {"status": "error", "message": "expected_usage cannot be zero"}
+    error = _validate_variance_inputs(expected_usage, actual_usage)
+    if error is not None:
+        return error
 
     # Perform calculations
-    variance = actual_usage - expected_usage
-    variance_percent = (variance / expected_usage) * 100
+    expected_usage, actual_usage, variance, variance_percent = scalar_variance(expected_usage, actual_usage)
+
+    # Imported on first use so that importing this module (e.g. for run()) stays cheap
+    from backend.shared.utils.business_report import format_business_insight
 
     # Generate business report (now returns dict with text and html)
     report_result = format_business_insight(
@@ -60,47 +87,90 @@ def calculate_inventory_variance(expected_usage, actual_usage):
         "status": "success",
         "expected_usage": expected_usage,
         "actual_usage": actual_usage,
-        "variance": round(variance, 2),
-        "variance_percent": round(variance_percent, 2),
+        "variance": variance,
+        "variance_percent": variance_percent,
         "business_report": report_result.get("text", "") if isinstance(report_result, dict) else report_result,
         "business_report_html": report_result.get("html", "") if isinstance(report_result, dict) else ""
     }
 
 
+def _validate_variance_inputs(expected_usage, actual_usage):
+    """Return the error response for invalid variance inputs, or None if they are usable"""
+    if expected_usage is None:
+        return _ERR_EXPECTED_NULL
+    if actual_usage is None:
+        return _ERR_ACTUAL_NULL
+
+    # Exact int/float is the common case and skips the isinstance walk; bool is an int
+    # subclass but never a valid quantity. Type errors name the offending type, so they
+    # cannot be static.
+    t = type(expected_usage)
+    if t is not float and t is not int and (t is bool or not isinstance(expected_usage, (int, float))):
+        return {"status": "error", "message": f"expected_usage must be a number, got {t.__name__}"}
+    t = type(actual_usage)
+    if t is not float and t is not int and (t is bool or not isinstance(actual_usage, (int, float))):
+        return {"status": "error", "message": f"actual_usage must be a number, got {t.__name__}"}
+
+    if expected_usage < 0:
+        return _ERR_EXPECTED_NEGATIVE
+    if actual_usage < 0:
+        return _ERR_ACTUAL_NEGATIVE
+
+    # Zero expected usage would divide by zero
+    if expected_usage == 0:
+        return _ERR_EXPECTED_ZERO
+    return None
+
+
+def calculate_inventory_variance_batch(expected_usage, actual_usage):
+    """
+    Calculate inventory variance for many items in one vectorized pass
+
+    Unlike calculate_inventory_variance, no business report is generated; this is
+    intended for bulk scans where only the numbers are needed.
+
+    Args:
+        expected_usage (array-like): Expected inventory usage, one entry per item
+        actual_usage (array-like): Actual inventory usage, one entry per item
+
+    Returns:
+        dict: Arrays of variance calculations or error response. Items with a zero
+        expected_usage get a NaN variance_percent instead of failing the whole batch.
+    """
+    try:
+        expected = np.asarray(expected_usage, dtype=np.float64)
+        actual = np.asarray(actual_usage, dtype=np.float64)
+    except (TypeError, ValueError):
+        return {"status": "error", "message": "expected_usage and actual_usage must contain only numbers"}
+
+    if expected.shape != actual.shape:
+        return {"status": "error", "message": "expected_usage and actual_usage must have the same length"}
+    if np.any(expected < 0):
+        return {"status": "error", "message": "expected_usage cannot be negative"}
+    if np.any(actual < 0):
+        return {"status": "error", "message": "actual_usage cannot be negative"}
+
+    variance, variance_percent = variance_arrays(expected, actual)
+
+    return {
+        "status": "success",
+        "expected_usage": expected,
+        "actual_usage": actual,
+        "variance": variance,
+        "variance_percent": variance_percent,
+    }
+
+
+def _variance_bucket(variance_percent):
+    """Map a variance percentage to its bucket: 0 (within ±5%), 1 (within ±10%) or 2 (beyond)"""
+    return bisect.bisect_left(_VARIANCE_THRESHOLDS, abs(variance_percent))
+
+
 def _interpret_variance(variance_percent):
     """Interpret inventory variance percentage"""
-    if abs(variance_percent) <= 5:
-        return f"A variance of {variance_percent:.1f}% is within acceptable range (±5%). This indicates good inventory control and accurate forecasting."
-    elif abs(variance_percent) <= 10:
-        return f"A variance of {variance_percent:.1f}% is moderate and requires attention. This suggests some forecasting inaccuracies or operational issues."
-    else:
-        return f"A variance of {variance_percent:.1f}% is significant and requires immediate action. This indicates major forecasting errors or operational problems."
+    return _VARIANCE_INTERPRETATIONS[_variance_bucket(variance_percent)].format(variance_percent)
 
 
 def _get_variance_recommendations(variance_percent):
     """Get recommendations based on variance percentage"""
-    recommendations = []
-
-    if abs(variance_percent) <= 5:
-        recommendations.extend([
-            "Maintain current inventory management practices",
-            "Continue monitoring variance trends",
-            "Consider implementing automated reordering systems"
-        ])
-    elif abs(variance_percent) <= 10:
-        recommendations.extend([
-            "Review forecasting methods and historical data",
-            "Improve communication between kitchen and management",
-            "Implement daily inventory tracking",
-            "Train staff on proper portion control"
-        ])
-    else:
-        recommendations.extend([
-            "Conduct immediate inventory audit",
-            "Review and update forecasting algorithms",
-            "Implement stricter inventory controls",
-            "Investigate potential theft or waste issues",
-            "Consider hiring inventory management specialist"
-        ])
-
-    return recommendations
+    return list(_VARIANCE_RECOMMENDATIONS[_variance_bucket(variance_percent)])
@@ -0,0 +1,97 @@
+"""
+Variance Kernel
+Numeric core shared by the inventory and liquor variance calculations
+"""
+
+import functools
+from typing import NamedTuple
+
+import numpy as np
+
+# Below this many items the NumPy ufunc path is already fast and the JIT dispatch is not worth it
+NUMBA_MIN_BATCH = 1024
+
+# Flattened contiguous float64 inputs and outputs, as variance_arrays always passes them
+_VARIANCE_SIGNATURE = "void(float64[::1], float64[::1], float64[::1], float64[::1])"
+
+
+class VarianceResult(NamedTuple):
+    """Variance figures for a single item; lighter than a dict for callers processing many items"""
+
+    expected: float
+    actual: float
+    variance: float
+    variance_percent: float
+
+
+def scalar_variance(expected, actual):
+    """
+    Compute variance for one validated pair
+
+    Args:
+        expected (float): Expected usage, non-zero
+        actual (float): Actual usage
+
+    Returns:
+        VarianceResult: The inputs with their variance and variance percent
+    """
+    variance = actual - expected
+    return VarianceResult(expected, actual, variance, (variance / expected) * 100)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_numba_kernel():
+    """
+    Compile the variance loop with Numba on first use
+
+    numba is an optional dependency and costs hundreds of milliseconds to import, so
+    it is only loaded once a large batch actually needs it.
+
+    Returns:
+        Compiled kernel, or None when numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # fastmath is left off so that zero-expected items keep their NaN percent. The explicit
+    # signature compiles (or loads from the on-disk cache) here, once, instead of
+    # type-inferring and dispatching on the first call
+    @numba.njit(_VARIANCE_SIGNATURE, cache=True, parallel=True)
+    def _variance_kernel(expected, actual, out_var, out_pct):
+        for i in numba.prange(expected.shape[0]):
+            v = actual[i] - expected[i]
+            out_var[i] = v
+            if expected[i] == 0.0:
+                out_pct[i] = np.nan
+            else:
+                out_pct[i] = v / expected[i] * 100.0
+
+    return _variance_kernel
+
+
+def variance_arrays(expected, actual):
+    """
+    Compute variance and variance percent for validated float64 arrays
+
+    Args:
+        expected (np.ndarray): Expected usage, non-negative
+        actual (np.ndarray): Actual usage, same shape as expected
+
+    Returns:
+        tuple: (variance, variance_percent) arrays; variance_percent is NaN where expected is zero
+    """
+    kernel = _get_numba_kernel() if expected.size >= NUMBA_MIN_BATCH else None
+    if kernel is not None:
+        flat_expected = np.ascontiguousarray(expected).ravel()
+        flat_actual = np.ascontiguousarray(actual).ravel()
+        variance = np.empty_like(flat_expected)
+        variance_percent = np.empty_like(flat_expected)
+        kernel(flat_expected, flat_actual, variance, variance_percent)
+        return variance.reshape(expected.shape), variance_percent.reshape(expected.shape)
+
+    variance = actual - expected
+    zero_expected = expected == 0
+    variance_percent = np.where(zero_expected, np.nan, variance / np.where(zero_expected, 1.0, expected) * 100)
+    return variance, variance_percent
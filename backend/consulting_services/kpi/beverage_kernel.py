@@ -0,0 +1,309 @@
+"""
+Beverage Kernel
+Numeric core for the batch liquor cost, inventory and pricing analyses
+"""
+
+import functools
+from typing import NamedTuple
+
+import numpy as np
+
+# Below this many rows the NumPy ufunc path is already fast and the JIT dispatch is not worth it
+NUMBA_MIN_ROWS = 1024
+
+# Number of bounds in each liquor variance and cost band ladder
+_BANDS = np.int8(3)
+
+
+class _Kernels(NamedTuple):
+    liquor: object
+    inventory: object
+    pricing: object
+
+
+@functools.lru_cache(maxsize=None)
+def _get_numba_kernels():
+    """
+    Compile the beverage row loops with Numba on first use
+
+    numba is an optional dependency and costs hundreds of milliseconds to import, so
+    it is only loaded once a large batch actually needs it. Each loop fuses the whole
+    analysis into one pass per row, with the rows spread across cores.
+
+    Returns:
+        Compiled kernels, or None when numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # fastmath is left off so results match the NumPy path bit for bit
+    @numba.njit(cache=True, nogil=True)
+    def _ratio(numerator, denominator):
+        return numerator / denominator if denominator > 0 else 0.0
+
+    @numba.njit(cache=True, parallel=True)
+    def _liquor_kernel(expected_oz, actual_oz, liquor_cost, total_sales, target, out, codes):
+        for i in numba.prange(expected_oz.shape[0]):
+            variance_oz = actual_oz[i] - expected_oz[i]
+            variance_percent = _ratio(variance_oz, expected_oz[i]) * 100
+            cost_per_oz = _ratio(liquor_cost[i], actual_oz[i])
+            cost_percentage = _ratio(liquor_cost[i], total_sales[i]) * 100
+            waste_cost = liquor_cost[i] - expected_oz[i] * cost_per_oz
+            out[0, i] = variance_oz
+            out[1, i] = variance_percent
+            out[2, i] = cost_per_oz
+            out[3, i] = cost_percentage
+            out[4, i] = waste_cost
+            out[5, i] = _ratio(waste_cost, liquor_cost[i]) * 100
+
+            abs_variance = abs(variance_percent)
+            target_i = target[i]
+            variance_band = 3 - ((abs_variance <= 5) + (abs_variance <= 10) + (abs_variance <= 15))
+            cost_band = 3 - ((cost_percentage <= target_i) + (cost_percentage <= target_i + 2) + (cost_percentage <= target_i + 5))
+            codes[0, i] = max(variance_band, cost_band)
+            codes[1, i] = min(variance_band, 2)
+            codes[2, i] = min(cost_band, 2)
+
+    @numba.njit(cache=True, parallel=True)
+    def _inventory_kernel(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days, safety_stock,
+                          target_turnover, out, codes):
+        for i in numba.prange(current_stock.shape[0]):
+            turnover_rate = _ratio(monthly_usage[i] * 12, current_stock[i])
+            out[0, i] = _ratio(current_stock[i], monthly_usage[i]) * 30
+            out[1, i] = (monthly_usage[i] / 30 * lead_time_days[i]) + safety_stock[i]
+            out[2, i] = turnover_rate
+            out[3, i] = inventory_value[i] * (25.0 / 100)
+
+            target = target_turnover[i]
+            stock = current_stock[i]
+            reorder = reorder_point[i]
+            if turnover_rate >= target and stock > reorder:
+                codes[0, i] = 0
+            elif turnover_rate >= target * 0.8 and stock > reorder * 0.8:
+                codes[0, i] = 1
+            elif turnover_rate >= target * 0.6 and stock > reorder * 0.6:
+                codes[0, i] = 2
+            else:
+                codes[0, i] = 3
+            codes[1, i] = 1 if stock > reorder else 0
+            codes[2, i] = 0 if turnover_rate >= target else 1 if turnover_rate >= target * 0.8 else 2
+
+    @numba.njit(cache=True, parallel=True)
+    def _pricing_kernel(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin, elasticity_factor,
+                        out, codes):
+        for i in numba.prange(drink_price.shape[0]):
+            price = drink_price[i]
+            cost = cost_per_drink[i]
+            target = target_margin[i]
+            current_margin = _ratio(price - cost, price) * 100
+            if target < 100:
+                optimal_price = _ratio(cost, 1 - target / 100)
+            else:
+                optimal_price = cost * 2
+            price_vs_competitor = _ratio(price - competitor_price[i], competitor_price[i]) * 100
+            price_change_percent = _ratio(optimal_price - price, price) * 100
+            volume_change_percent = -price_change_percent * elasticity_factor[i]
+            out[0, i] = current_margin
+            out[1, i] = current_margin - target
+            out[2, i] = optimal_price
+            out[3, i] = price_vs_competitor
+            out[4, i] = price * sales_volume[i]
+            out[5, i] = optimal_price * sales_volume[i]
+            out[6, i] = optimal_price * (sales_volume[i] * (1 + volume_change_percent / 100))
+
+            abs_price_gap = abs(price_vs_competitor)
+            if current_margin >= target and abs_price_gap <= 10:
+                codes[0, i] = 0
+            elif current_margin >= target * 0.9 and abs_price_gap <= 20:
+                codes[0, i] = 1
+            elif current_margin >= target * 0.8 and abs_price_gap <= 30:
+                codes[0, i] = 2
+            else:
+                codes[0, i] = 3
+            codes[1, i] = 0 if current_margin >= target else 1 if current_margin >= target * 0.8 else 2
+            codes[2, i] = 0 if abs_price_gap <= 10 else 1 if price_vs_competitor > 10 else 2
+
+    return _Kernels(_liquor_kernel, _inventory_kernel, _pricing_kernel)
+
+
+def _kernels_for(column):
+    """Compiled kernels for a large float64 batch; None sends smaller or single-precision batches to NumPy."""
+    if column.size < NUMBA_MIN_ROWS or column.dtype != np.float64:
+        return None
+    return _get_numba_kernels()
+
+
+def _run_kernel(kernel, columns, n_floats):
+    """Run a compiled row kernel, returning its float output rows and its three code rows."""
+    columns = [np.ascontiguousarray(column) for column in columns]
+    out = np.empty((n_floats, columns[0].shape[0]))
+    codes = np.empty((3, columns[0].shape[0]), dtype=np.intp)
+    kernel(*columns, out, codes)
+    return (*out, *codes)
+
+
+def _guarded_ratio(numerator, denominator, scale=None):
+    """
+    Return numerator / denominator, times scale, where the denominator is positive and 0.0 elsewhere.
+
+    Every lane is divided and the guarded lanes zeroed afterwards, which is cheaper than a
+    masked divide; the scale is applied in place rather than through another temporary.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = numerator / denominator
+    ratio[~(denominator > 0)] = 0.0
+    if scale is not None:
+        ratio *= scale
+    return ratio
+
+
+def _ladder_codes(*conditions):
+    """
+    Index of the first true condition in each row, or len(conditions) where none holds.
+
+    Matches np.select(conditions, range(len(conditions)), len(conditions)) but is built
+    from in-place integer arithmetic on the boolean masks instead of masked selects,
+    so the rating ladders cost one add and one multiply per rung.
+    """
+    codes = np.zeros(conditions[0].shape, dtype=np.intp)
+    for condition in reversed(conditions):
+        codes += 1
+        codes *= ~condition
+    return codes
+
+
+def liquor_cost_arrays(expected_oz, actual_oz, liquor_cost, total_sales, target_cost_percentage):
+    """
+    Compute liquor cost figures for validated, equal-length float arrays
+
+    Returns:
+        tuple: (variance_oz, variance_percent, cost_per_oz, liquor_cost_percentage, waste_cost,
+        waste_percentage, rating_code, variance_status_code, cost_status_code) arrays
+    """
+    kernels = _kernels_for(expected_oz)
+    if kernels is not None:
+        return _run_kernel(kernels.liquor, (expected_oz, actual_oz, liquor_cost, total_sales, target_cost_percentage), 6)
+
+    variance_oz = actual_oz - expected_oz
+    variance_percent = _guarded_ratio(variance_oz, expected_oz, 100)
+    cost_per_oz = _guarded_ratio(liquor_cost, actual_oz)
+    liquor_cost_percentage = _guarded_ratio(liquor_cost, total_sales, 100)
+    theoretical_cost = expected_oz * cost_per_oz
+    waste_cost = liquor_cost - theoretical_cost
+    waste_percentage = _guarded_ratio(waste_cost, liquor_cost, 100)
+
+    # Each band (0-3) counts the variance and cost bounds a row misses, so NaN misses all of
+    # them. The scalar ladder's rating is then the worse band and each status its own band
+    # capped at 2. Bands are int8 views of the comparison masks to keep the arithmetic narrow
+    abs_variance = np.abs(variance_percent)
+    variance_band = _BANDS - (
+        (abs_variance <= 5).view(np.int8) + (abs_variance <= 10).view(np.int8) + (abs_variance <= 15).view(np.int8)
+    )
+    cost_band = _BANDS - (
+        (liquor_cost_percentage <= target_cost_percentage).view(np.int8)
+        + (liquor_cost_percentage <= target_cost_percentage + 2).view(np.int8)
+        + (liquor_cost_percentage <= target_cost_percentage + 5).view(np.int8)
+    )
+    rating_code = np.maximum(variance_band, cost_band)
+    variance_status_code = np.minimum(variance_band, 2)
+    cost_status_code = np.minimum(cost_band, 2)
+    return (
+        variance_oz,
+        variance_percent,
+        cost_per_oz,
+        liquor_cost_percentage,
+        waste_cost,
+        waste_percentage,
+        rating_code,
+        variance_status_code,
+        cost_status_code,
+    )
+
+
+def inventory_arrays(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days, safety_stock, target_turnover):
+    """
+    Compute inventory figures for validated, equal-length float arrays
+
+    Returns:
+        tuple: (days_of_stock, optimal_reorder_point, turnover_rate, annual_carrying_cost,
+        rating_code, stock_status_code, turnover_status_code) arrays
+    """
+    kernels = _kernels_for(current_stock)
+    if kernels is not None:
+        return _run_kernel(
+            kernels.inventory,
+            (current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days, safety_stock, target_turnover),
+            4,
+        )
+
+    days_of_stock = _guarded_ratio(current_stock, monthly_usage, 30)
+    optimal_reorder_point = (monthly_usage / 30 * lead_time_days) + safety_stock
+    turnover_rate = _guarded_ratio(monthly_usage * 12, current_stock)
+    annual_carrying_cost = inventory_value * (25.0 / 100)
+
+    rating_code = _ladder_codes(
+        (turnover_rate >= target_turnover) & (current_stock > reorder_point),
+        (turnover_rate >= target_turnover * 0.8) & (current_stock > reorder_point * 0.8),
+        (turnover_rate >= target_turnover * 0.6) & (current_stock > reorder_point * 0.6),
+    )
+    stock_status_code = (current_stock > reorder_point).astype(np.intp)
+    turnover_status_code = _ladder_codes(turnover_rate >= target_turnover, turnover_rate >= target_turnover * 0.8)
+    return (
+        days_of_stock,
+        optimal_reorder_point,
+        turnover_rate,
+        annual_carrying_cost,
+        rating_code,
+        stock_status_code,
+        turnover_status_code,
+    )
+
+
+def pricing_arrays(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin, elasticity_factor):
+    """
+    Compute beverage pricing figures for validated, equal-length float arrays
+
+    Returns:
+        tuple: (current_margin, margin_difference, optimal_price, price_vs_competitor, current_revenue,
+        optimal_revenue, elasticity_revenue, rating_code, margin_status_code, competitive_status_code) arrays
+    """
+    kernels = _kernels_for(drink_price)
+    if kernels is not None:
+        return _run_kernel(
+            kernels.pricing,
+            (drink_price, cost_per_drink, sales_volume, competitor_price, target_margin, elasticity_factor),
+            7,
+        )
+
+    current_margin = _guarded_ratio(drink_price - cost_per_drink, drink_price, 100)
+    margin_difference = current_margin - target_margin
+    optimal_price = np.where(target_margin < 100, _guarded_ratio(cost_per_drink, 1 - target_margin / 100), cost_per_drink * 2)
+    price_vs_competitor = _guarded_ratio(drink_price - competitor_price, competitor_price, 100)
+    current_revenue = drink_price * sales_volume
+    optimal_revenue = optimal_price * sales_volume
+    price_change_percent = _guarded_ratio(optimal_price - drink_price, drink_price, 100)
+    volume_change_percent = -price_change_percent * elasticity_factor
+    elasticity_revenue = optimal_price * (sales_volume * (1 + volume_change_percent / 100))
+
+    abs_price_gap = np.abs(price_vs_competitor)
+    rating_code = _ladder_codes(
+        (current_margin >= target_margin) & (abs_price_gap <= 10),
+        (current_margin >= target_margin * 0.9) & (abs_price_gap <= 20),
+        (current_margin >= target_margin * 0.8) & (abs_price_gap <= 30),
+    )
+    margin_status_code = _ladder_codes(current_margin >= target_margin, current_margin >= target_margin * 0.8)
+    competitive_status_code = _ladder_codes(abs_price_gap <= 10, price_vs_competitor > 10)
+    return (
+        current_margin,
+        margin_difference,
+        optimal_price,
+        price_vs_competitor,
+        current_revenue,
+        optimal_revenue,
+        elasticity_revenue,
+        rating_code,
+        margin_status_code,
+        competitive_status_code,
+    )
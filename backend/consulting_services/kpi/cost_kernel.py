@@ -0,0 +1,144 @@
+"""
+Cost Kernel
+Numeric core for the batch labor and food cost analyses
+"""
+
+import functools
+from typing import NamedTuple
+
+import numpy as np
+
+# Below this many rows the NumPy ufunc path is already fast and the JIT dispatch is not worth it
+NUMBA_MIN_ROWS = 1024
+
+
+class _Kernels(NamedTuple):
+    labor: object
+    food: object
+
+
+@functools.lru_cache(maxsize=None)
+def _get_numba_kernels():
+    """
+    Compile the labor and food cost row loops with Numba on first use
+
+    numba is an optional dependency and costs hundreds of milliseconds to import, so
+    it is only loaded once a large batch actually needs it. Each loop fuses the whole
+    analysis into one pass per row, with the rows spread across cores.
+
+    Returns:
+        Compiled kernels, or None when numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # fastmath is left off so results and band edges match the NumPy path bit for bit
+    @numba.njit(cache=True, nogil=True)
+    def _band(percent, bands):
+        return 3 - ((percent <= bands[0]) + (percent <= bands[1]) + (percent <= bands[2]))
+
+    @numba.njit(cache=True, parallel=True)
+    def _labor_kernel(total_sales, labor_cost, hours_worked, target, bands, out, band):
+        for i in numba.prange(total_sales.shape[0]):
+            sales = total_sales[i]
+            cost = labor_cost[i]
+            labor_percent = cost / sales * 100
+            sales_per_labor_hour = sales / hours_worked[i]
+            out[0, i] = labor_percent
+            out[1, i] = sales_per_labor_hour
+            out[2, i] = cost / hours_worked[i]
+            out[3, i] = min(sales_per_labor_hour / 50 * 100, 150.0)
+            out[4, i] = sales / cost
+            out[5, i] = cost - target[i] / 100 * sales
+            out[6, i] = labor_percent - target[i]
+            band[i] = _band(labor_percent, bands)
+
+    @numba.njit(cache=True, parallel=True)
+    def _food_kernel(total_sales, food_cost, target, bands, out, band):
+        for i in numba.prange(total_sales.shape[0]):
+            sales = total_sales[i]
+            cost = food_cost[i]
+            food_percent = cost / sales * 100
+            gross_profit = sales - cost
+            out[0, i] = food_percent
+            out[1, i] = gross_profit
+            out[2, i] = gross_profit / sales * 100
+            out[3, i] = cost - target[i] / 100 * sales
+            out[4, i] = food_percent - target[i]
+            band[i] = _band(food_percent, bands)
+
+    return _Kernels(_labor_kernel, _food_kernel)
+
+
+def _kernels_for(column):
+    """Compiled kernels for a large float64 batch; None sends smaller or single-precision batches to NumPy."""
+    if column.size < NUMBA_MIN_ROWS or column.dtype != np.float64:
+        return None
+    return _get_numba_kernels()
+
+
+def _run_kernel(kernel, columns, bands, n_floats):
+    """Run a compiled row kernel, returning its float output rows and its rating band row."""
+    columns = [np.ascontiguousarray(column) for column in columns]
+    out = np.empty((n_floats, columns[0].shape[0]))
+    band = np.empty(columns[0].shape[0], dtype=np.intp)
+    kernel(*columns, np.asarray(bands, dtype=np.float64), out, band)
+    return (*out, band)
+
+
+def labor_cost_arrays(total_sales, labor_cost, hours_worked, target_labor_percent, bands):
+    """
+    Compute labor cost figures for validated, equal-length, positive float arrays
+
+    Args:
+        bands: Inclusive upper edges of the Excellent, Good and Acceptable labor percents
+
+    Returns:
+        tuple: (labor_percent, sales_per_labor_hour, cost_per_labor_hour, productivity_score,
+        labor_efficiency_ratio, potential_savings, vs_target, band) arrays
+    """
+    kernels = _kernels_for(total_sales)
+    if kernels is not None:
+        return _run_kernel(kernels.labor, (total_sales, labor_cost, hours_worked, target_labor_percent), bands, 7)
+
+    labor_percent = labor_cost / total_sales * 100
+    sales_per_labor_hour = total_sales / hours_worked
+    return (
+        labor_percent,
+        sales_per_labor_hour,
+        labor_cost / hours_worked,
+        np.minimum(sales_per_labor_hour / 50 * 100, 150),
+        total_sales / labor_cost,
+        labor_cost - target_labor_percent / 100 * total_sales,
+        labor_percent - target_labor_percent,
+        # side="left" keeps each band's upper edge inclusive, as bisect_left does for one value
+        np.searchsorted(bands, labor_percent, side="left"),
+    )
+
+
+def food_cost_arrays(total_sales, food_cost, target_food_percent, bands):
+    """
+    Compute food cost figures for validated, equal-length, positive float arrays
+
+    Args:
+        bands: Inclusive upper edges of the Excellent, Good and Acceptable food percents
+
+    Returns:
+        tuple: (food_percent, gross_profit, gross_profit_margin, potential_savings, vs_target, band) arrays
+    """
+    kernels = _kernels_for(total_sales)
+    if kernels is not None:
+        return _run_kernel(kernels.food, (total_sales, food_cost, target_food_percent), bands, 5)
+
+    food_percent = food_cost / total_sales * 100
+    gross_profit = total_sales - food_cost
+    return (
+        food_percent,
+        gross_profit,
+        gross_profit / total_sales * 100,
+        food_cost - target_food_percent / 100 * total_sales,
+        food_percent - target_food_percent,
+        np.searchsorted(bands, food_percent, side="left"),
+    )
@@ -3,12 +3,135 @@ KPI Dashboard Analysis Functions
 Contains the core business logic for KPI dashboard analysis.
 """
 
+import bisect
+
+import numpy as np
+
 from backend.consulting_services.kpi.kpi_utils import format_business_report
 
 
-def calculate_comprehensive_analysis(total_sales, labor_cost, food_cost, prime_cost, hours_worked=0.0, hourly_rate=0.0, previous_sales=0.0, target_margin=70.0):
-    """Calculate comprehensive analysis with multi-metric analysis and industry benchmarking."""
-    # Calculate key metrics
+# Performance rating labels, indexed by the rating codes the numeric cores return
+_RATINGS = ("Excellent", "Good", "Acceptable", "Needs Improvement")
+_RATINGS_NP = np.array(_RATINGS, dtype=object)
+
+# Status bands: each label tuple has one more entry than its thresholds and is indexed by bisect.
+# Prime cost bounds are inclusive upper limits (bisect_left); the rest are inclusive lower limits (bisect_right).
+_PRIME_COST_THRESHOLDS = (60, 65)
+_COST_STATUS_LABELS = ("Optimal", "Good", "Needs Review")
+_SCORE_THRESHOLDS = (70, 80)
+_GROWTH_THRESHOLDS = (5, 10)
+_OPTIMIZATION_THRESHOLDS = (75, 85)
+_GOAL_THRESHOLDS = (70, 90)
+_LEVEL_LABELS = ("Low", "Medium", "High")
+_PRIORITY_LABELS = ("High", "Medium", "Low")
+_TREND_LABELS = ("Declining", "Stable", "Improving")
+_BENCHMARK_COMPARISON_LABELS = ("Below Industry", "Industry Average", "Above Industry")
+_GOAL_STATUS_LABELS = ("At Risk", "Behind", "On Track")
+_COST_STATUS_NP = np.array(_COST_STATUS_LABELS, dtype=object)
+_LEVEL_NP = np.array(_LEVEL_LABELS, dtype=object)
+_GOAL_STATUS_NP = np.array(_GOAL_STATUS_LABELS, dtype=object)
+
+# Static recommendation pairs and industry benchmarks. The tuples are shared between calls;
+# the benchmark dicts are copied into each result, so callers may modify what they receive.
+_CA_REC_PRIME_COST = (
+    "Optimize prime cost structure to improve profitability",
+    "Review labor and food cost management strategies",
+)
+_CA_REC_LABOR = (
+    "Improve labor efficiency and scheduling",
+    "Consider automation and process optimization",
+)
+_CA_REC_FOOD = (
+    "Optimize food cost through better purchasing and portion control",
+    "Review menu pricing and ingredient costs",
+)
+_CA_REC_SALES_VELOCITY = (
+    "Increase sales velocity through better marketing and service",
+    "Optimize operational efficiency",
+)
+_CA_REC_GROWTH = (
+    "Develop growth strategies to increase revenue",
+    "Focus on customer acquisition and retention",
+)
+_CA_REC_PERFORMANCE = (
+    "Implement performance improvement initiatives",
+    "Set specific targets and track progress regularly",
+)
+_CA_REC_MAINTAIN = (
+    "Maintain current performance levels",
+    "Continue monitoring key performance indicators",
+)
+
+_PO_REC_OPTIMIZATION = (
+    "Implement comprehensive performance optimization strategy",
+    "Focus on efficiency improvements and process optimization",
+)
+_PO_REC_GOALS = (
+    "Review and adjust performance goals",
+    "Implement targeted improvement initiatives",
+)
+_PO_REC_OPPORTUNITIES = (
+    "Identify new optimization opportunities",
+    "Explore innovative approaches to performance enhancement",
+)
+_PO_REC_EFFICIENCY = (
+    "Improve operational efficiency through better processes",
+    "Invest in training and development programs",
+)
+_PO_REC_TRACKING = (
+    "Implement robust progress tracking systems",
+    "Establish regular performance review cycles",
+)
+_PO_REC_GAP = (
+    "Develop action plan to close performance gap",
+    "Set intermediate milestones for goal achievement",
+)
+_PO_REC_MAINTAIN = (
+    "Maintain current optimization strategies",
+    "Continue monitoring performance improvements",
+)
+
+_CA_BENCHMARKS = {
+    "optimal_prime_cost": "≤60%",
+    "target_labor_cost": "≤30%",
+    "target_food_cost": "≤30%",
+    "sales_growth_target": "≥10%",
+}
+_PO_BENCHMARKS = {
+    "target_optimization_score": "≥85%",
+    "goal_achievement_threshold": "≥90%",
+    "improvement_potential_target": "≥15%",
+}
+
+
+# Result keys that require rendering the business report
+_REPORT_FIELDS = frozenset({"business_report_html", "business_report"})
+
+
+def _select_fields(fields, result):
+    """
+    Pick the requested fields from an analysis result as one flat dict.
+
+    Names are looked up among the top-level result keys, then the metrics and performance entries.
+
+    Raises:
+        ValueError: If a requested field is not part of the result
+    """
+    flat = {**result["metrics"], **result["performance"], **result}
+    unknown = [name for name in fields if name not in flat]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return {name: flat[name] for name in fields}
+
+
+def _comprehensive_core(total_sales, labor_cost, food_cost, hours_worked, previous_sales, target_margin):
+    """
+    Numeric core of the comprehensive analysis, kept free of report building.
+
+    Returns:
+        tuple: (total_costs, prime_cost_percentage, labor_percentage, food_percentage, sales_per_hour,
+        labor_efficiency, cost_efficiency, sales_growth, performance_score, rating_code)
+    """
     total_costs = labor_cost + food_cost
     prime_cost_percentage = (total_costs / total_sales * 100) if total_sales > 0 else 0
     labor_percentage = (labor_cost / total_sales * 100) if total_sales > 0 else 0
@@ -23,15 +146,48 @@ def calculate_comprehensive_analysis(total_sales, labor_cost, food_cost, prime_c
     sales_growth = ((total_sales - previous_sales) / previous_sales * 100) if previous_sales > 0 else 0
     performance_score = (target_margin - prime_cost_percentage) / target_margin * 100 if target_margin > 0 else 0
 
-    # Performance assessment
-    if prime_cost_percentage <= 60 and performance_score >= 80 and sales_growth >= 10:
-        rating = "Excellent"
-    elif prime_cost_percentage <= 65 and performance_score >= 70 and sales_growth >= 5:
-        rating = "Good"
-    elif prime_cost_percentage <= 70 and performance_score >= 60 and sales_growth >= 0:
-        rating = "Acceptable"
-    else:
-        rating = "Needs Improvement"
+    # Performance assessment, as an index into _RATINGS. Meeting a tier implies meeting every
+    # tier below it, so counting the tiers met replaces the if/elif ladder.
+    rating_code = 3 - (
+        (prime_cost_percentage <= 60 and performance_score >= 80 and sales_growth >= 10)
+        + (prime_cost_percentage <= 65 and performance_score >= 70 and sales_growth >= 5)
+        + (prime_cost_percentage <= 70 and performance_score >= 60 and sales_growth >= 0)
+    )
+    return (
+        total_costs,
+        prime_cost_percentage,
+        labor_percentage,
+        food_percentage,
+        sales_per_hour,
+        labor_efficiency,
+        cost_efficiency,
+        sales_growth,
+        performance_score,
+        rating_code,
+    )
+
+
+def calculate_comprehensive_analysis(total_sales, labor_cost, food_cost, prime_cost, hours_worked=0.0, hourly_rate=0.0, previous_sales=0.0, target_margin=70.0, fields=None):
+    """
+    Calculate comprehensive analysis with multi-metric analysis and industry benchmarking.
+
+    Pass fields (a set of metric, performance or result key names) to get only those values as a
+    flat dict; the business report is then only built if one of its keys is requested.
+    """
+    # Calculate key metrics
+    (
+        total_costs,
+        prime_cost_percentage,
+        labor_percentage,
+        food_percentage,
+        sales_per_hour,
+        labor_efficiency,
+        cost_efficiency,
+        sales_growth,
+        performance_score,
+        rating_code,
+    ) = _comprehensive_core(total_sales, labor_cost, food_cost, hours_worked, previous_sales, target_margin)
+    rating = _RATINGS[rating_code]
 
     # Metrics dictionary
     metrics = {
@@ -55,61 +211,59 @@ def calculate_comprehensive_analysis(total_sales, labor_cost, food_cost, prime_c
     }
 
     # Performance dictionary
+    score_band = bisect.bisect_right(_SCORE_THRESHOLDS, performance_score)
     performance = {
         "rating": rating,
-        "cost_status": "Optimal" if prime_cost_percentage <= 60 else "Good" if prime_cost_percentage <= 65 else "Needs Review",
-        "efficiency_status": "High" if performance_score >= 80 else "Medium" if performance_score >= 70 else "Low"
+        "cost_status": _COST_STATUS_LABELS[bisect.bisect_left(_PRIME_COST_THRESHOLDS, prime_cost_percentage)],
+        "efficiency_status": _LEVEL_LABELS[score_band]
     }
 
     # Generate recommendations
     recommendations = []
 
     if prime_cost_percentage > 65:
-        recommendations.append("Optimize prime cost structure to improve profitability")
-        recommendations.append("Review labor and food cost management strategies")
+        recommendations.extend(_CA_REC_PRIME_COST)
 
     if labor_percentage > 35:
-        recommendations.append("Improve labor efficiency and scheduling")
-        recommendations.append("Consider automation and process optimization")
+        recommendations.extend(_CA_REC_LABOR)
 
     if food_percentage > 35:
-        recommendations.append("Optimize food cost through better purchasing and portion control")
-        recommendations.append("Review menu pricing and ingredient costs")
+        recommendations.extend(_CA_REC_FOOD)
 
     if sales_per_hour < 100:
-        recommendations.append("Increase sales velocity through better marketing and service")
-        recommendations.append("Optimize operational efficiency")
+        recommendations.extend(_CA_REC_SALES_VELOCITY)
 
     if sales_growth < 5:
-        recommendations.append("Develop growth strategies to increase revenue")
-        recommendations.append("Focus on customer acquisition and retention")
+        recommendations.extend(_CA_REC_GROWTH)
 
     if performance_score < 70:
-        recommendations.append("Implement performance improvement initiatives")
-        recommendations.append("Set specific targets and track progress regularly")
+        recommendations.extend(_CA_REC_PERFORMANCE)
 
     if not recommendations:
-        recommendations.append("Maintain current performance levels")
-        recommendations.append("Continue monitoring key performance indicators")
+        recommendations.extend(_CA_REC_MAINTAIN)
 
     # Industry benchmarks
-    benchmarks = {
-        "optimal_prime_cost": "≤60%",
-        "target_labor_cost": "≤30%",
-        "target_food_cost": "≤30%",
-        "sales_growth_target": "≥10%"
-    }
+    benchmarks = dict(_CA_BENCHMARKS)
+
+    # Callers that only need figures skip report construction entirely
+    if fields is not None and _REPORT_FIELDS.isdisjoint(fields):
+        return _select_fields(fields, {
+            "metrics": metrics,
+            "performance": performance,
+            "recommendations": recommendations,
+            "industry_benchmarks": benchmarks,
+        })
 
     # Additional insights
     additional_data = {
         "comprehensive_insights": {
             "overall_score": f"{performance_score:.1f}/100",
             "cost_optimization_potential": f"${total_costs * 0.1:.2f}",
-            "efficiency_rating": "High" if performance_score >= 80 else "Medium" if performance_score >= 70 else "Low"
+            "efficiency_rating": _LEVEL_LABELS[score_band]
         },
         "performance_insights": {
-            "trend_direction": "Improving" if sales_growth >= 10 else "Stable" if sales_growth >= 5 else "Declining",
-            "benchmark_comparison": "Above Industry" if performance_score >= 80 else "Industry Average" if performance_score >= 70 else "Below Industry",
+            "trend_direction": _TREND_LABELS[bisect.bisect_right(_GROWTH_THRESHOLDS, sales_growth)],
+            "benchmark_comparison": _BENCHMARK_COMPARISON_LABELS[score_band],
             "next_review": "30 days"
         }
     }
@@ -127,7 +281,7 @@ def calculate_comprehensive_analysis(total_sales, labor_cost, food_cost, prime_c
     business_report_html = business_report_result.get("business_report_html", "")
     business_report = business_report_result.get("business_report", "")
 
-    return {
+    result = {
         "metrics": metrics,
         "performance": performance,
         "recommendations": recommendations,
@@ -135,11 +289,17 @@ def calculate_comprehensive_analysis(total_sales, labor_cost, food_cost, prime_c
         "business_report_html": business_report_html,
         "business_report": business_report
     }
+    return result if fields is None else _select_fields(fields, result)
 
 
-def calculate_performance_optimization(current_performance, target_performance, optimization_potential, efficiency_score, baseline_metrics=0.0, improvement_rate=10.0, goal_timeframe=90.0, progress_tracking=8.0):
-    """Calculate performance optimization with actionable recommendations and goal setting."""
-    # Calculate key metrics
+def _performance_optimization_core(current_performance, target_performance, optimization_potential, efficiency_score, progress_tracking):
+    """
+    Numeric core of the performance optimization analysis, kept free of report building.
+
+    Returns:
+        tuple: (performance_gap, optimization_score, improvement_potential, goal_achievement_rate,
+        efficiency_rating, progress_score, overall_optimization_score, rating_code)
+    """
     performance_gap = target_performance - current_performance
     optimization_score = (optimization_potential / 100) * (efficiency_score / 10)
     improvement_potential = (performance_gap / current_performance * 100) if current_performance > 0 else 0
@@ -150,15 +310,43 @@ def calculate_performance_optimization(current_performance, target_performance,
     progress_score = (progress_tracking / 10) * 100
     overall_optimization_score = (optimization_score + efficiency_rating + progress_score) / 3
 
-    # Performance assessment
-    if overall_optimization_score >= 85 and goal_achievement_rate >= 90 and improvement_potential >= 15:
-        rating = "Excellent"
-    elif overall_optimization_score >= 75 and goal_achievement_rate >= 80 and improvement_potential >= 10:
-        rating = "Good"
-    elif overall_optimization_score >= 65 and goal_achievement_rate >= 70 and improvement_potential >= 5:
-        rating = "Acceptable"
-    else:
-        rating = "Needs Improvement"
+    # Performance assessment, as an index into _RATINGS; tiers are nested as in _comprehensive_core
+    rating_code = 3 - (
+        (overall_optimization_score >= 85 and goal_achievement_rate >= 90 and improvement_potential >= 15)
+        + (overall_optimization_score >= 75 and goal_achievement_rate >= 80 and improvement_potential >= 10)
+        + (overall_optimization_score >= 65 and goal_achievement_rate >= 70 and improvement_potential >= 5)
+    )
+    return (
+        performance_gap,
+        optimization_score,
+        improvement_potential,
+        goal_achievement_rate,
+        efficiency_rating,
+        progress_score,
+        overall_optimization_score,
+        rating_code,
+    )
+
+
+def calculate_performance_optimization(current_performance, target_performance, optimization_potential, efficiency_score, baseline_metrics=0.0, improvement_rate=10.0, goal_timeframe=90.0, progress_tracking=8.0, fields=None):
+    """
+    Calculate performance optimization with actionable recommendations and goal setting.
+
+    Pass fields (a set of metric, performance or result key names) to get only those values as a
+    flat dict; the business report is then only built if one of its keys is requested.
+    """
+    # Calculate key metrics
+    (
+        performance_gap,
+        optimization_score,
+        improvement_potential,
+        goal_achievement_rate,
+        efficiency_rating,
+        progress_score,
+        overall_optimization_score,
+        rating_code,
+    ) = _performance_optimization_core(current_performance, target_performance, optimization_potential, efficiency_score, progress_tracking)
+    rating = _RATINGS[rating_code]
 
     # Metrics dictionary
     metrics = {
@@ -180,60 +368,60 @@ def calculate_performance_optimization(current_performance, target_performance,
     }
 
     # Performance dictionary
+    optimization_band = bisect.bisect_right(_OPTIMIZATION_THRESHOLDS, overall_optimization_score)
+    goal_band = bisect.bisect_right(_GOAL_THRESHOLDS, goal_achievement_rate)
     performance = {
         "rating": rating,
-        "optimization_status": "High" if overall_optimization_score >= 85 else "Medium" if overall_optimization_score >= 75 else "Low",
-        "goal_status": "On Track" if goal_achievement_rate >= 90 else "Behind" if goal_achievement_rate >= 70 else "At Risk"
+        "optimization_status": _LEVEL_LABELS[optimization_band],
+        "goal_status": _GOAL_STATUS_LABELS[goal_band]
     }
 
     # Generate recommendations
     recommendations = []
 
     if overall_optimization_score < 75:
-        recommendations.append("Implement comprehensive performance optimization strategy")
-        recommendations.append("Focus on efficiency improvements and process optimization")
+        recommendations.extend(_PO_REC_OPTIMIZATION)
 
     if goal_achievement_rate < 80:
-        recommendations.append("Review and adjust performance goals")
-        recommendations.append("Implement targeted improvement initiatives")
+        recommendations.extend(_PO_REC_GOALS)
 
     if improvement_potential < 10:
-        recommendations.append("Identify new optimization opportunities")
-        recommendations.append("Explore innovative approaches to performance enhancement")
+        recommendations.extend(_PO_REC_OPPORTUNITIES)
 
     if efficiency_rating < 70:
-        recommendations.append("Improve operational efficiency through better processes")
-        recommendations.append("Invest in training and development programs")
+        recommendations.extend(_PO_REC_EFFICIENCY)
 
     if progress_tracking < 7:
-        recommendations.append("Implement robust progress tracking systems")
-        recommendations.append("Establish regular performance review cycles")
+        recommendations.extend(_PO_REC_TRACKING)
 
     if performance_gap > current_performance * 0.2:
-        recommendations.append("Develop action plan to close performance gap")
-        recommendations.append("Set intermediate milestones for goal achievement")
+        recommendations.extend(_PO_REC_GAP)
 
     if not recommendations:
-        recommendations.append("Maintain current optimization strategies")
-        recommendations.append("Continue monitoring performance improvements")
+        recommendations.extend(_PO_REC_MAINTAIN)
 
     # Industry benchmarks
-    benchmarks = {
-        "target_optimization_score": "≥85%",
-        "goal_achievement_threshold": "≥90%",
-        "improvement_potential_target": "≥15%"
-    }
+    benchmarks = dict(_PO_BENCHMARKS)
+
+    # Callers that only need figures skip report construction entirely
+    if fields is not None and _REPORT_FIELDS.isdisjoint(fields):
+        return _select_fields(fields, {
+            "metrics": metrics,
+            "performance": performance,
+            "recommendations": recommendations,
+            "industry_benchmarks": benchmarks,
+        })
 
     # Additional insights
     additional_data = {
         "optimization_insights": {
             "improvement_timeline": f"{goal_timeframe:.0f} days",
             "potential_gain": f"{improvement_potential:.1f}%",
-            "optimization_priority": "High" if overall_optimization_score < 75 else "Medium" if overall_optimization_score < 85 else "Low"
+            "optimization_priority": _PRIORITY_LABELS[optimization_band]
         },
         "performance_insights": {
-            "optimization_trend": "Improving" if overall_optimization_score >= 85 else "Stable" if overall_optimization_score >= 75 else "Declining",
-            "goal_progress": "On Track" if goal_achievement_rate >= 90 else "Behind" if goal_achievement_rate >= 70 else "At Risk",
+            "optimization_trend": _TREND_LABELS[optimization_band],
+            "goal_progress": _GOAL_STATUS_LABELS[goal_band],
             "next_review": "30 days"
         }
     }
@@ -251,7 +439,7 @@ def calculate_performance_optimization(current_performance, target_performance,
     business_report_html = business_report_result.get("business_report_html", "")
     business_report = business_report_result.get("business_report", "")
 
-    return {
+    result = {
         "metrics": metrics,
         "performance": performance,
         "recommendations": recommendations,
@@ -259,3 +447,188 @@ def calculate_performance_optimization(current_performance, target_performance,
         "business_report_html": business_report_html,
         "business_report": business_report
     }
+    return result if fields is None else _select_fields(fields, result)
+
+
+def _as_columns(*columns):
+    """
+    Convert batch inputs to equal-length float64 columns.
+
+    Scalars broadcast against the array inputs, so a shared value such as a target
+    margin can be passed once for every period.
+
+    Raises:
+        ValueError: If an input is not numeric or the array lengths differ
+    """
+    try:
+        arrays = [np.asarray(column, dtype=np.float64) for column in columns]
+    except (TypeError, ValueError):
+        raise ValueError("KPI inputs must contain only numbers")
+    try:
+        return [array.copy() for array in np.broadcast_arrays(*arrays)]
+    except ValueError:
+        raise ValueError("KPI inputs must be single values or arrays of the same length")
+
+
+def _guarded_ratio(numerator, denominator):
+    """Return numerator / denominator where the denominator is positive and 0.0 elsewhere."""
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+
+
+def _guarded_percent(numerator, denominator):
+    """
+    Return numerator / denominator * 100 where the denominator is positive and 0.0 elsewhere.
+
+    Divides before scaling, in the same order as the per-period functions, so values that
+    land exactly on a status threshold are rated the same way in both paths.
+    """
+    return _guarded_ratio(numerator, denominator) * 100
+
+
+def calculate_comprehensive_analysis_batch(total_sales, labor_cost, food_cost, prime_cost, hours_worked=0.0, hourly_rate=0.0, previous_sales=0.0, target_margin=70.0):
+    """
+    Calculate comprehensive analysis metrics for many periods in one vectorized pass.
+
+    Mirrors the metrics and performance fields of calculate_comprehensive_analysis, one
+    array per field, without building per-period recommendations or reports.
+
+    Args:
+        total_sales, labor_cost, food_cost, prime_cost: Array-likes with one value per period
+        hours_worked, hourly_rate, previous_sales, target_margin: Array-likes or single values
+
+    Returns:
+        Dictionary of per-period arrays
+
+    Raises:
+        ValueError: If an input is not numeric or the array lengths differ
+    """
+    (
+        total_sales,
+        labor_cost,
+        food_cost,
+        prime_cost,
+        hours_worked,
+        hourly_rate,
+        previous_sales,
+        target_margin,
+    ) = _as_columns(total_sales, labor_cost, food_cost, prime_cost, hours_worked, hourly_rate, previous_sales, target_margin)
+
+    total_costs = labor_cost + food_cost
+    prime_cost_percentage = _guarded_percent(total_costs, total_sales)
+    labor_percentage = _guarded_percent(labor_cost, total_sales)
+    food_percentage = _guarded_percent(food_cost, total_sales)
+
+    sales_per_hour = _guarded_ratio(total_sales, hours_worked)
+    labor_efficiency = _guarded_ratio(total_sales, labor_cost)
+    cost_efficiency = _guarded_ratio(total_sales, total_costs)
+
+    sales_growth = _guarded_percent(total_sales - previous_sales, previous_sales)
+    performance_score = _guarded_percent(target_margin - prime_cost_percentage, target_margin)
+
+    rating = _RATINGS_NP[
+        3
+        - ((prime_cost_percentage <= 60) & (performance_score >= 80) & (sales_growth >= 10)).astype(np.intp)
+        - ((prime_cost_percentage <= 65) & (performance_score >= 70) & (sales_growth >= 5))
+        - ((prime_cost_percentage <= 70) & (performance_score >= 60) & (sales_growth >= 0))
+    ]
+    cost_status = _COST_STATUS_NP[np.searchsorted(_PRIME_COST_THRESHOLDS, prime_cost_percentage, side="left")]
+    efficiency_status = _LEVEL_NP[np.searchsorted(_SCORE_THRESHOLDS, performance_score, side="right")]
+
+    return {
+        "total_sales": total_sales,
+        "labor_cost": labor_cost,
+        "food_cost": food_cost,
+        "prime_cost": prime_cost,
+        "hours_worked": hours_worked,
+        "hourly_rate": hourly_rate,
+        "previous_sales": previous_sales,
+        "target_margin": target_margin,
+        "total_costs": total_costs,
+        "prime_cost_percentage": prime_cost_percentage,
+        "labor_percentage": labor_percentage,
+        "food_percentage": food_percentage,
+        "sales_per_hour": sales_per_hour,
+        "labor_efficiency": labor_efficiency,
+        "cost_efficiency": cost_efficiency,
+        "sales_growth": sales_growth,
+        "performance_score": performance_score,
+        "rating": rating,
+        "cost_status": cost_status,
+        "efficiency_status": efficiency_status,
+    }
+
+
+def calculate_performance_optimization_batch(current_performance, target_performance, optimization_potential, efficiency_score, baseline_metrics=0.0, improvement_rate=10.0, goal_timeframe=90.0, progress_tracking=8.0):
+    """
+    Calculate performance optimization metrics for many periods in one vectorized pass.
+
+    Mirrors the metrics and performance fields of calculate_performance_optimization, one
+    array per field, without building per-period recommendations or reports.
+
+    Args:
+        current_performance, target_performance, optimization_potential, efficiency_score: Array-likes
+        baseline_metrics, improvement_rate, goal_timeframe, progress_tracking: Array-likes or single values
+
+    Returns:
+        Dictionary of per-period arrays
+
+    Raises:
+        ValueError: If an input is not numeric or the array lengths differ
+    """
+    (
+        current_performance,
+        target_performance,
+        optimization_potential,
+        efficiency_score,
+        baseline_metrics,
+        improvement_rate,
+        goal_timeframe,
+        progress_tracking,
+    ) = _as_columns(
+        current_performance,
+        target_performance,
+        optimization_potential,
+        efficiency_score,
+        baseline_metrics,
+        improvement_rate,
+        goal_timeframe,
+        progress_tracking,
+    )
+
+    performance_gap = target_performance - current_performance
+    optimization_score = (optimization_potential / 100) * (efficiency_score / 10)
+    improvement_potential = _guarded_percent(performance_gap, current_performance)
+    goal_achievement_rate = _guarded_percent(current_performance, target_performance)
+    efficiency_rating = (efficiency_score / 10) * 100
+    progress_score = (progress_tracking / 10) * 100
+    overall_optimization_score = (optimization_score + efficiency_rating + progress_score) / 3
+
+    rating = _RATINGS_NP[
+        3
+        - ((overall_optimization_score >= 85) & (goal_achievement_rate >= 90) & (improvement_potential >= 15)).astype(np.intp)
+        - ((overall_optimization_score >= 75) & (goal_achievement_rate >= 80) & (improvement_potential >= 10))
+        - ((overall_optimization_score >= 65) & (goal_achievement_rate >= 70) & (improvement_potential >= 5))
+    ]
+    optimization_status = _LEVEL_NP[np.searchsorted(_OPTIMIZATION_THRESHOLDS, overall_optimization_score, side="right")]
+    goal_status = _GOAL_STATUS_NP[np.searchsorted(_GOAL_THRESHOLDS, goal_achievement_rate, side="right")]
+
+    return {
+        "current_performance": current_performance,
+        "target_performance": target_performance,
+        "optimization_potential": optimization_potential,
+        "efficiency_score": efficiency_score,
+        "baseline_metrics": baseline_metrics,
+        "improvement_rate": improvement_rate,
+        "goal_timeframe": goal_timeframe,
+        "progress_tracking": progress_tracking,
+        "performance_gap": performance_gap,
+        "optimization_score": optimization_score,
+        "improvement_potential": improvement_potential,
+        "goal_achievement_rate": goal_achievement_rate,
+        "efficiency_rating": efficiency_rating,
+        "progress_score": progress_score,
+        "overall_optimization_score": overall_optimization_score,
+        "rating": rating,
+        "optimization_status": optimization_status,
+        "goal_status": goal_status,
+    }
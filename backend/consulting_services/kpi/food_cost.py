@@ -3,9 +3,22 @@ KPI Food Cost Analysis Task
 Calculates food cost percentage and provides comprehensive business report.
 """
 
-from backend.shared.utils.common import success_payload, error_payload, require, validate_positive_numbers
+from backend.shared.utils.common import success_payload, error_payload, require
 from backend.consulting_services.kpi.kpi_utils import calculate_food_cost_analysis
 
+# Accepted inputs as (name, type, default), in calculate_food_cost_analysis() argument order.
+# Required fields have no default and must be non-negative numbers.
+_FC_REQUIRED = ("total_sales", "food_cost")
+_FC_FIELDS = (
+    ("total_sales", float, None),
+    ("food_cost", float, None),
+    ("target_food_percent", float, 30.0),
+    ("waste_cost", float, None),
+    ("covers", int, None),
+    ("beginning_inventory", float, None),
+    ("ending_inventory", float, None),
+)
+
 
 def run(params: dict, file_bytes: bytes | None = None) -> tuple[dict, int]:
     """
@@ -22,47 +35,44 @@ def run(params: dict, file_bytes: bytes | None = None) -> tuple[dict, int]:
 
     try:
         # Validate required fields
-        require(params, ["total_sales", "food_cost"])
-
-        # Validate positive numbers
-        validate_positive_numbers(params, ["total_sales", "food_cost"])
+        require(params, _FC_REQUIRED)
 
-        # Extract and convert values
-        total_sales = float(params["total_sales"])
-        food_cost = float(params["food_cost"])
-        target_food_percent = float(params.get("target_food_percent", 30.0))
-        
-        # Extract optional parameters
-        waste_cost = float(params["waste_cost"]) if params.get("waste_cost") is not None else None
-        covers = int(params["covers"]) if params.get("covers") is not None else None
-        beginning_inventory = float(params["beginning_inventory"]) if params.get("beginning_inventory") is not None else None
-        ending_inventory = float(params["ending_inventory"]) if params.get("ending_inventory") is not None else None
+        # Extract and convert values with defaults in a single pass
+        values = {}
+        for name, cast, default in _FC_FIELDS:
+            value = params.get(name)
+            if name in _FC_REQUIRED:
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    raise ValueError(f"{name} must be a valid number")
+                if value < 0:
+                    raise ValueError(f"{name} must be >= 0")
+            elif value is None:
+                value = default
+            else:
+                value = cast(value)
+            values[name] = value
+        total_sales, food_cost = values["total_sales"], values["food_cost"]
 
         # Use comprehensive analysis function
-        analysis_result = calculate_food_cost_analysis(
-            total_sales=total_sales,
-            food_cost=food_cost,
-            target_food_percent=target_food_percent,
-            waste_cost=waste_cost,
-            covers=covers,
-            beginning_inventory=beginning_inventory,
-            ending_inventory=ending_inventory
-        )
+        analysis_result = calculate_food_cost_analysis(**values)
 
         # Check if analysis was successful
         if analysis_result.get("status") == "error":
             return error_payload(service, subtask, analysis_result.get("message", "Analysis failed"))
 
-        # Extract insights from the business report
-        insights = analysis_result.get("recommendations", [])
+        # Extract insights and metrics from the business report; success results always carry these keys
+        insights = analysis_result["recommendations"]
+        km = analysis_result["key_metrics"]
 
         # Prepare response data
         data = {
-            "food_percent": analysis_result["key_metrics"]["food_percent"],
+            "food_percent": km["food_percent"],
             "total_sales": total_sales,
             "food_cost": food_cost,
-            "gross_profit": analysis_result["key_metrics"]["gross_profit"],
-            "gross_profit_margin": analysis_result["key_metrics"]["gross_profit_margin"],
+            "gross_profit": km["gross_profit"],
+            "gross_profit_margin": km["gross_profit_margin"],
             "food_efficiency": analysis_result["performance_rating"],
             "business_report_html": analysis_result["business_report_html"],
             "business_report": analysis_result["business_report"]
@@ -0,0 +1,84 @@
+"""
+KPI Kernel
+Numeric core for per-day KPI columns computed from uploaded CSV data
+"""
+
+import functools
+
+import numpy as np
+
+# Below this many rows the NumPy ufunc path is already fast and the JIT dispatch is not worth it
+NUMBA_MIN_ROWS = 1024
+
+# Contiguous float64 inputs and outputs, as daily_kpi_arrays always passes them
+_DAILY_KPI_SIGNATURE = "void(" + ", ".join(["float64[::1]"] * 8) + ")"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_numba_kernel():
+    """
+    Compile the daily KPI loop with Numba on first use
+
+    numba is an optional dependency and costs hundreds of milliseconds to import, so
+    it is only loaded once a large upload actually needs it.
+
+    Returns:
+        Compiled kernel, or None when numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # fastmath is left off so results match the NumPy path bit for bit. The explicit
+    # signature compiles (or loads from the on-disk cache) here, once, instead of
+    # type-inferring and dispatching on the first call
+    @numba.njit(_DAILY_KPI_SIGNATURE, cache=True, parallel=True)
+    def _daily_kpi_kernel(sales, labor_cost, food_cost, labor_hours, out_labor, out_food, out_prime, out_sph):
+        for i in numba.prange(sales.shape[0]):
+            out_labor[i] = labor_cost[i] / sales[i] * 100.0
+            out_food[i] = food_cost[i] / sales[i] * 100.0
+            out_prime[i] = (labor_cost[i] + food_cost[i]) / sales[i] * 100.0
+            out_sph[i] = sales[i] / labor_hours[i]
+
+    return _daily_kpi_kernel
+
+
+def daily_kpi_arrays(sales, labor_cost, food_cost, labor_hours):
+    """
+    Compute daily KPI percentages and sales per hour for validated float64 arrays
+
+    Args:
+        sales (np.ndarray): Daily sales, positive
+        labor_cost (np.ndarray): Daily labor cost, non-negative
+        food_cost (np.ndarray): Daily food cost, non-negative
+        labor_hours (np.ndarray): Daily labor hours, positive
+
+    Returns:
+        tuple: (labor_percent, food_percent, prime_percent, sales_per_hour) arrays, unrounded
+    """
+    kernel = _get_numba_kernel() if sales.size >= NUMBA_MIN_ROWS else None
+    if kernel is not None:
+        sales = np.ascontiguousarray(sales)
+        labor_percent = np.empty_like(sales)
+        food_percent = np.empty_like(sales)
+        prime_percent = np.empty_like(sales)
+        sales_per_hour = np.empty_like(sales)
+        kernel(
+            sales,
+            np.ascontiguousarray(labor_cost),
+            np.ascontiguousarray(food_cost),
+            np.ascontiguousarray(labor_hours),
+            labor_percent,
+            food_percent,
+            prime_percent,
+            sales_per_hour,
+        )
+        return labor_percent, food_percent, prime_percent, sales_per_hour
+
+    return (
+        labor_cost / sales * 100,
+        food_cost / sales * 100,
+        (labor_cost + food_cost) / sales * 100,
+        sales / labor_hours,
+    )
@@ -3,12 +3,487 @@ Performance Management Module
 Handles KPI tracking, analytics, and performance reporting
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Union
+import asyncio
+import bisect
+import functools
+import logging
+import math
 import os
+import re
+from string import Template
 
-import pandas as pd
-from datetime import datetime
+import numpy as np
+from datetime import date, datetime
 from backend.shared.utils.business_report import format_comprehensive_analysis
+from backend.consulting_services.kpi.beverage_kernel import inventory_arrays, liquor_cost_arrays, pricing_arrays
+from backend.consulting_services.kpi.cost_kernel import food_cost_arrays, labor_cost_arrays
+from backend.consulting_services.kpi.kpi_kernel import daily_kpi_arrays
+
+logger = logging.getLogger(__name__)
+
+# Static benchmark tables. They are shared between calls and only handed out as copies.
+_KPI_SUMMARY_BENCHMARKS = {
+    "labor_percent": {"excellent": 25, "good": 30, "needs_improvement": 35},
+    "food_percent": {"excellent": 28, "good": 32, "needs_improvement": 38},
+    "prime_percent": {"excellent": 55, "good": 60, "needs_improvement": 65},
+}
+_PRIME_SEGMENT_BENCHMARKS = {
+    "fine_dining": {"target": 65, "labor": 35, "food": 30},
+    "casual_dining": {"target": 60, "labor": 30, "food": 30},
+    "fast_casual": {"target": 55, "labor": 25, "food": 30},
+    "quick_service": {"target": 50, "labor": 22, "food": 28}
+}
+
+# generate_kpi_recommendations entries as (recommendation, impact format), in output order
+# for the labor, food, sales per hour and prime cost checks. The recommendation dicts are
+# built once and copied per call, so they must be treated as read-only; where an impact
+# format is given, its "{:.0f}" is filled with the excess over the threshold.
+_KPI_SAVINGS_IMPACT = "Could save ${:.0f} per $10k in sales"
+_KPI_REC_TEMPLATES = (
+    (
+        {
+            "category": "Labor Optimization",
+            "priority": "High",
+            "action": "Review staff scheduling and reduce overtime",
+            "impact": None,
+        },
+        _KPI_SAVINGS_IMPACT,
+    ),
+    (
+        {
+            "category": "Food Cost Control",
+            "priority": "High",
+            "action": "Audit portion sizes and supplier pricing",
+            "impact": None,
+        },
+        _KPI_SAVINGS_IMPACT,
+    ),
+    (
+        {
+            "category": "Sales Performance",
+            "priority": "Medium",
+            "action": "Improve staff training and upselling techniques",
+            "impact": "Could increase revenue by 15-20%",
+        },
+        None,
+    ),
+    (
+        {
+            "category": "Overall Efficiency",
+            "priority": "Critical",
+            "action": "Focus on both labor and food cost optimization",
+            "impact": "Essential for profitability",
+        },
+        None,
+    ),
+)
+_KPI_REC_ON_TARGET = (
+    {
+        "category": "Performance",
+        "priority": "Maintain",
+        "action": "Keep up the excellent work!",
+        "impact": "Your KPIs are within industry standards",
+    },
+    None,
+)
+
+# Labels for the rating and status codes returned by the beverage analysis cores
+_RATING_LABELS = ("Excellent", "Good", "Acceptable", "Needs Improvement")
+_RATING_COLORS = ("green", "blue", "yellow", "red")
+_VARIANCE_STATUS_LABELS = ("Within Target", "Needs Attention", "Critical")
+_COST_STATUS_LABELS = ("Optimal", "High", "Critical")
+_LEVEL_STATUS_LABELS = ("Optimal", "Low", "Critical")
+_STOCK_STATUS_LABELS = ("Order Now", "Adequate Stock")
+_COMPETITIVE_STATUS_LABELS = ("Competitive", "Premium", "Value")
+_RATING_LABELS_NP = np.array(_RATING_LABELS, dtype=object)
+_RATING_COLORS_NP = np.array(_RATING_COLORS, dtype=object)
+_VARIANCE_STATUS_LABELS_NP = np.array(_VARIANCE_STATUS_LABELS, dtype=object)
+_COST_STATUS_LABELS_NP = np.array(_COST_STATUS_LABELS, dtype=object)
+_LEVEL_STATUS_LABELS_NP = np.array(_LEVEL_STATUS_LABELS, dtype=object)
+_STOCK_STATUS_LABELS_NP = np.array(_STOCK_STATUS_LABELS, dtype=object)
+_COMPETITIVE_STATUS_LABELS_NP = np.array(_COMPETITIVE_STATUS_LABELS, dtype=object)
+
+# Upper bounds (inclusive) of the Excellent, Good and Acceptable cost percent bands; bisecting
+# a percent into them gives its _RATING_LABELS / _RATING_COLORS index
+_LABOR_PERCENT_BANDS = (25.0, 30.0, 35.0)
+_FOOD_PERCENT_BANDS = (25.0, 30.0, 35.0)
+_PRIME_PERCENT_BANDS = (55.0, 60.0, 65.0)
+
+# calculate_kpi_summary inputs that are used as divisors and so must be non-zero
+_KPI_SUMMARY_DIVISORS = frozenset({"total_sales", "hours_worked"})
+
+# Keywords that file a KPI summary recommendation under each report section
+_KPI_REC_SECTION_WORDS = {
+    "labor_percent": ("labor", "staff", "scheduling"),
+    "food_percent": ("food", "menu", "pricing"),
+    "prime_percent": ("prime", "cost"),
+    "sales_per_labor_hour": ("productivity", "sales", "training"),
+}
+
+# Flexible CSV column mapping, compiled once into one case-insensitive alternation per target
+_KPI_COLUMN_VARIATIONS = {
+    "sales": ["sales", "revenue", "total_sales", "daily_sales"],
+    "labor_cost": ["labor_cost", "labor", "wages", "payroll"],
+    "food_cost": ["food_cost", "cogs", "cost_of_goods", "food"],
+    "labor_hours": ["labor_hours", "hours", "hours_worked", "staff_hours", "labor_hour"],
+}
+_KPI_COLUMN_PATTERNS = {
+    target: re.compile("|".join(map(re.escape, variations)), re.IGNORECASE)
+    for target, variations in _KPI_COLUMN_VARIATIONS.items()
+}
+
+# Rows parsed per read_csv chunk when streaming an uploaded KPI CSV
+_KPI_CSV_CHUNK_ROWS = 100_000
+
+
+@functools.lru_cache(maxsize=2)
+def _report_date(ordinal: int) -> str:
+    """Format a report date once per day; two entries cover the midnight rollover."""
+    return date.fromordinal(ordinal).strftime("%B %d, %Y")
+
+
+def _report_day():
+    """Cache stamp for reports that show the generated date."""
+    return date.today().toordinal()
+
+
+def _report_minute():
+    """Cache stamp for reports that also show the generated time to the minute."""
+    return datetime.now().replace(second=0, microsecond=0)
+
+
+def _memoize_report(report_stamp):
+    """
+    Memoize a pure analysis that ends in a business report, keyed on its exact arguments
+
+    The key carries each argument's type as well as its value, so 1, 1.0 and True never
+    share an entry, and the analysis always runs on the caller's own values. report_stamp()
+    is part of the cache key only, so a cached report never carries a stale generated date
+    or time. Each call gets its own top-level dict; nested containers are shared between
+    calls and must not be mutated.
+    """
+    def decorator(func):
+        @functools.lru_cache(maxsize=256)
+        def cached(key, stamp):
+            args, kwargs, _ = key
+            return func(*args, **dict(kwargs))
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            items = tuple(sorted(kwargs.items()))
+            key = (args, items, tuple(type(v) for v in (*args, *(v for _, v in items))))
+            try:
+                hash(key)
+            except TypeError:
+                return func(*args, **kwargs)
+            return dict(cached(key, report_stamp()))
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
+# CSS for the tracking sections, prepended to every HTML business report
+_TRACKING_STYLES = '''<style>
+    .tracking-section { margin: 1.5rem 0; }
+    .tracking-section h3 { color: #1e293b; margin-bottom: 1rem; font-size: 1.1rem; }
+    .tracking-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 1rem; }
+    .tracking-card { background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%); border-radius: 12px; border: 1px solid rgba(102, 126, 234, 0.15); overflow: hidden; }
+    .tracking-header { display: flex; align-items: center; gap: 0.5rem; padding: 0.75rem 1rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; }
+    .tracking-icon { font-size: 1.2rem; }
+    .tracking-title { font-weight: 600; flex: 1; }
+    .tracking-body { padding: 1rem; display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem; }
+    .tracking-metric { display: flex; flex-direction: column; padding: 0.5rem; background: white; border-radius: 8px; border: 1px solid #e2e8f0; }
+    .tracking-label { font-size: 0.75rem; color: #64748b; text-transform: uppercase; letter-spacing: 0.5px; }
+    .tracking-value { font-size: 1.1rem; font-weight: 600; color: #1e293b; }
+    </style>'''
+
+# Executive summary tone and benchmark comparison for each performance rating
+_RATING_META = {
+    "Excellent": ("excellent", "exceed"),
+    "Good": ("good", "exceed"),
+    "Acceptable": ("acceptable", "meet"),
+}
+_DEFAULT_RATING_META = ("concerning", "fall below")
+
+# Badge CSS modifiers for the common ratings; other ratings are normalized on the fly
+_BADGE_CLASS = {
+    "Excellent": "excellent",
+    "Good": "good",
+    "Acceptable": "acceptable",
+    "Needs Improvement": "needs-improvement",
+}
+
+# Report representations rendered by format_business_report unless the caller asks for fewer
+_REPORT_FORMATS = frozenset({"text", "html"})
+
+# HTML business report, compiled once; the CSS contains no "$" so it needs no escaping
+_REPORT_HTML_T = Template(
+    _TRACKING_STYLES
+    + '<section class="report"><header class="report__header"><h2>${analysis_type}</h2>'
+    '<div class="report__meta">Generated: ${current_date}</div><div class="badge badge--${badge_class}">${rating}</div></header>'
+    '<article class="report__body"><p class="lead">This ${analysis_type_lower} reveals <strong>${tone}</strong> performance metrics '
+    'that <strong>${comp}</strong> industry standards.</p><h3>Key Performance Metrics</h3><ul>${key_metrics}</ul>'
+    '${benchmarks_section}${tracking_html}${other_insights_html}'
+    '<h3>Strategic Recommendations</h3><ol>${recommendations}</ol></article></section>'
+)
+
+
+def _text_bullet(line):
+    """Bullet a text report line; lines indented by two spaces become sub-items."""
+    return "  • " + line.strip() if line.startswith("  ") else "• " + line
+
+
+# Float formats for report values as (key words, format) rules; the first rule with a word
+# in the key name wins. Key metrics, tracking cards and other insights each have their own
+# rules, and a key with no matching word uses the fallback format.
+_PCT_MARKS = ("percent", "%")
+_CURRENCY_WORDS = ("cost", "sales", "revenue", "profit", "savings", "price")
+_METRIC_FLOAT_RULES = ((_PCT_MARKS, "{:.1f}%"), (_CURRENCY_WORDS, "${:,.2f}"))
+_TRACKING_FLOAT_RULES = ((("percent",), "{:.1f}%"), (("cost", "check", "price"), "${:,.2f}"), (("ratio",), "{:.2f}"))
+_INSIGHT_FLOAT_RULES = ((("percent",), "{:.1f}%"), (("cost", "savings", "price"), "${:,.2f}"))
+
+
+@functools.lru_cache(maxsize=512)
+def _value_format(key, rules=_METRIC_FLOAT_RULES, fallback="{:.2f}"):
+    """Resolve a key to its display label and float format; keys repeat across reports."""
+    key_lower = key.lower()
+    for words, float_fmt in rules:
+        if any(word in key_lower for word in words):
+            return key.replace('_', ' ').title(), float_fmt
+    return key.replace('_', ' ').title(), fallback
+
+
+def _li_items(lines):
+    """Render lines as <li> items with a single join."""
+    return "<li>" + "</li><li>".join(lines) + "</li>" if lines else ""
+
+
+# Tracking section titles and icons, matched in order against the additional_data key;
+# the first substring found wins, so "cost_breakdown" only applies when no earlier word matches
+_TRACKING_SECTIONS = (
+    ("savings", "💰 Savings Opportunities", "💵"),
+    ("overtime", "Overtime Tracking", "⏰"),
+    ("productivity", "Productivity Metrics", "📈"),
+    ("efficiency", "Efficiency Metrics", "⚡"),
+    ("revenue", "Revenue Analysis", "💰"),
+    ("waste", "Waste Tracking", "🗑️"),
+    ("inventory", "Inventory Analysis", "📦"),
+    ("growth", "Growth Analysis", "🚀"),
+    ("benchmark", "Benchmark Comparison", "🎯"),
+    ("cover", "Per-Cover Metrics", "👥"),
+    ("menu", "Menu Costing", "📋"),
+    ("cost_breakdown", "Cost Breakdown", "📊"),
+    ("trend", "Trend Analysis", "📉"),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _tracking_heading(key):
+    """Resolve an additional_data key to its tracking section title and icon; keys repeat across reports."""
+    key_lower = key.lower()
+    for word, title, icon in _TRACKING_SECTIONS:
+        if word in key_lower:
+            return title, icon
+    return key.replace('_', ' ').title(), "📊"
+
+
+def _format_tracking_section(title, data, icon="📊"):
+    """Format a tracking section with proper HTML styling"""
+    if not data or not isinstance(data, dict):
+        return ""
+
+    # Determine status color based on data_source or status
+    data_source = data.get('data_source', data.get('Data Source', 'Estimated'))
+    status = data.get('status', data.get('Status', ''))
+
+    if data_source == 'Actual':
+        source_badge = '<span class="badge badge--excellent" style="font-size: 0.7rem; padding: 2px 8px;">✓ Actual Data</span>'
+    else:
+        source_badge = '<span class="badge badge--needs-improvement" style="font-size: 0.7rem; padding: 2px 8px;">⚠ Estimated</span>'
+
+    # Build metric items
+    metric_items = []
+    for k, v in data.items():
+        if k.lower() in ('data_source', 'status', 'rating'):
+            continue  # Skip meta fields, we'll show them separately
+        label, float_fmt = _value_format(k, _TRACKING_FLOAT_RULES, "{:,.1f}")
+        if isinstance(v, float):
+            formatted_value = float_fmt.format(v)
+        elif isinstance(v, int):
+            formatted_value = f"{v:,}"
+        else:
+            formatted_value = str(v)
+        metric_items.append(f'<div class="tracking-metric"><span class="tracking-label">{label}</span><span class="tracking-value">{formatted_value}</span></div>')
+
+    # Add rating if present
+    rating = data.get('rating', data.get('Rating', ''))
+    if rating:
+        rating_class = rating.lower().replace(' ', '-')
+        metric_items.append(f'<div class="tracking-metric"><span class="tracking-label">Rating</span><span class="badge badge--{rating_class}" style="font-size: 0.75rem;">{rating}</span></div>')
+
+    return f'''
+        <div class="tracking-card">
+            <div class="tracking-header">
+                <span class="tracking-icon">{icon}</span>
+                <span class="tracking-title">{title}</span>
+                {source_badge}
+            </div>
+            <div class="tracking-body">
+                {''.join(metric_items)}
+            </div>
+        </div>'''
+
+
+# System prompt for the KPI analysis requests
+_KPI_AI_SYSTEM_PROMPT = """You are an expert restaurant consultant with 20+ years of experience in hospitality operations. You specialize in KPI analysis, cost control, operational efficiency, and strategic business optimization.
+
+CRITICAL FORMATTING RULES - YOU MUST FOLLOW THESE:
+1. NEVER use markdown formatting (no asterisks, no bold markers like **, no hash symbols like ##)
+2. NEVER use LaTeX or mathematical notation (no \\text{}, no \\frac{}, no \\left, no \\right, no backslash commands)
+3. Write in plain, natural English like a friendly conversation
+4. For formulas, write them as plain words: "Labor Cost Percentage equals Labor Cost divided by Sales, times 100"
+5. Use simple numbered lists (1. 2. 3.) or dashes (-) for lists
+
+Your Response Style:
+- Write like you're having a conversation with a restaurant owner
+- Break down complex metrics into easy-to-understand explanations
+- Show your calculations in plain English with actual numbers
+- Compare results to industry benchmarks naturally in the text
+- Provide specific dollar amounts and percentages
+
+When Analyzing Data:
+- Acknowledge the specific numbers provided
+- Explain calculations conversationally with actual values
+- Mention industry benchmarks in a natural way
+- Explain if performance is above or below standard
+- Provide 3-5 specific action items
+- Quantify potential impact when possible
+
+Industry Benchmarks to Reference:
+- Food Cost: 28-32% (ideal around 30%)
+- Labor Cost: 25-30% (ideal around 28%)
+- Prime Cost: 55-65% (ideal around 60%)
+- Beverage Cost: 18-24% (ideal around 20%)
+- Sales Per Labor Hour: $35-50 or higher
+
+Write naturally and conversationally. No special formatting or markup."""
+
+
+# Static opening of every KPI analysis request. It stays byte-identical and ahead of the
+# per-request figures, so the provider's prompt cache can reuse the whole shared prefix
+_KPI_AI_PROMPT_PREFIX = """As a restaurant business consultant, analyze the KPIs listed at the end of this message and provide strategic insights.
+
+IMPORTANT FORMATTING RULES:
+- Write in plain, natural English without any markdown or special formatting
+- Do NOT use asterisks, bold markers, or hash symbols
+- Do NOT use LaTeX or mathematical notation like backslash commands
+- Write formulas in plain words: "Labor Cost Percentage equals Labor Cost divided by Total Sales, times 100"
+- Use simple numbered lists (1. 2. 3.) or dashes (-) for lists
+- Write like you're having a friendly conversation with a restaurant owner
+
+Provide a helpful analysis including:
+1. Executive Summary - overall performance and key findings
+2. Critical Issues - metrics outside industry benchmarks
+3. Quick Wins - immediate actions to improve performance
+4. Strategic Recommendations - longer term improvements
+5. Projected Impact - estimated savings if recommendations are implemented
+
+Keep the response practical and conversational for restaurant operators.
+
+KPIs:"""
+
+# Routine analyses use the smaller model with a completion cap sized to the five requested
+# sections; OPENAI_KPI_MODEL and OPENAI_KPI_MAX_TOKENS override them. Deep analyses keep gpt-4o
+_KPI_AI_MODEL = "gpt-4o-mini"
+_KPI_AI_MAX_TOKENS = 1200
+_KPI_AI_DEEP_MODEL = "gpt-4o"
+_KPI_AI_DEEP_MAX_TOKENS = 2000
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Read .env into the environment once per process rather than on every AI request."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_client(api_key: str):
+    """
+    Build the OpenAI client once per API key
+
+    Reusing the client keeps its HTTP connection pool, so later requests skip the TCP and
+    TLS handshakes. Keying on the key means a rotated OPENAI_API_KEY gets a fresh client.
+    """
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
+def _kpi_ai_settings(deep_analysis: bool) -> tuple:
+    """Model and completion token cap for a KPI analysis request"""
+    if deep_analysis:
+        return _KPI_AI_DEEP_MODEL, _KPI_AI_DEEP_MAX_TOKENS
+    return os.getenv("OPENAI_KPI_MODEL", _KPI_AI_MODEL), int(os.getenv("OPENAI_KPI_MAX_TOKENS", _KPI_AI_MAX_TOKENS))
+
+
+def _kpi_ai_request(api_key: str, prompt: str, model: str, max_tokens: int, stream: bool = False):
+    """Send a KPI analysis request, returning the completion or its chunk stream"""
+    return _openai_client(api_key).chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": _KPI_AI_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.7,
+        max_tokens=max_tokens,
+        stream=stream,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _kpi_ai_completion(api_key: str, prompt: str, model: str, max_tokens: int) -> str:
+    """
+    Ask the model for a KPI analysis, memoized on the exact prompt and model settings
+
+    The prompt carries the figures at the precision they are shown to the model, so a
+    dashboard re-rendering the same period gets the earlier analysis back instead of
+    waiting seconds and paying for a new completion. Failed requests raise and are not cached.
+    An analysis cut off at max_tokens is requested once more with twice the cap, so the
+    truncated text is neither cached nor left for the caller to re-request.
+    """
+    response = _kpi_ai_request(api_key, prompt, model, max_tokens)
+    choice = response.choices[0]
+    if choice.finish_reason == "length":
+        logger.warning(f"KPI analysis hit max_tokens={max_tokens} on {model}; retrying with {max_tokens * 2}")
+        max_tokens *= 2
+        response = _kpi_ai_request(api_key, prompt, model, max_tokens)
+        choice = response.choices[0]
+    if response.usage is not None:
+        # Token counts for sizing OPENAI_KPI_MAX_TOKENS against real analyses
+        logger.info(
+            f"KPI analysis on {model}: {response.usage.prompt_tokens} prompt tokens, "
+            f"{response.usage.completion_tokens} of {max_tokens} completion tokens"
+        )
+    return (choice.message.content or "").strip()
+
+
+def _kpi_ai_stream(api_key: str, prompt: str, model: str, max_tokens: int) -> Iterator[str]:
+    """
+    Yield a KPI analysis as text fragments while it is generated
+
+    The request is only sent once the first fragment is asked for. Errors are yielded as
+    the same "AI analysis unavailable" message the blocking call returns.
+    """
+    try:
+        for chunk in _kpi_ai_request(api_key, prompt, model, max_tokens, stream=True):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    except Exception as e:
+        yield f"AI analysis unavailable: {str(e)}"
 
 
 def generate_ai_kpi_analysis(
@@ -19,8 +494,10 @@ def generate_ai_kpi_analysis(
     avg_sales_per_hour: float,
     trend: str,
     num_days: int,
-    daily_data: List[Dict] = None
-) -> Optional[str]:
+    daily_data: List[Dict] = None,
+    stream: bool = False,
+    deep_analysis: bool = False
+) -> Optional[Union[str, Iterator[str]]]:
     """
     Generate AI-powered KPI analysis using OpenAI GPT-4.
     
@@ -33,29 +510,29 @@ def generate_ai_kpi_analysis(
         trend: Performance trend (improving, declining, stable)
         num_days: Number of days analyzed
         daily_data: Sample of daily KPI data for pattern analysis
+        stream: Return an iterator of text fragments as they are generated instead of
+            waiting for the whole analysis; streamed analyses are not memoized
+        deep_analysis: Use gpt-4o with a longer completion instead of the routine model
         
     Returns:
-        AI-generated analysis string or None if unavailable
+        AI-generated analysis string (or fragment iterator when streaming) or None if unavailable
     """
     try:
-        from openai import OpenAI
-        from dotenv import load_dotenv
-        load_dotenv()
+        _load_env()
         
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             return None
             
-        client = OpenAI(api_key=api_key)
-        
         # Build context for AI analysis
         daily_summary = ""
         if daily_data:
-            daily_summary = "\nDaily Data Sample:\n"
-            for day in daily_data[:5]:
-                daily_summary += f"- {day.get('date', 'N/A')}: Sales ${day.get('sales', 0):,.0f}, Labor {day.get('labor_percent', 0):.1f}%, Food {day.get('food_percent', 0):.1f}%\n"
+            daily_summary = "\nDaily Data Sample:\n" + "".join(
+                f"- {day.get('date', 'N/A')}: Sales ${day.get('sales', 0):,.0f}, Labor {day.get('labor_percent', 0):.1f}%, Food {day.get('food_percent', 0):.1f}%\n"
+                for day in daily_data[:5]
+            )
         
-        prompt = f"""As a restaurant business consultant, analyze these KPIs and provide strategic insights:
+        prompt = f"""{_KPI_AI_PROMPT_PREFIX}
 
 Period Analyzed: {num_days} days
 Total Sales: ${total_sales:,.2f}
@@ -64,290 +541,260 @@ Average Food Cost: {avg_food_percent:.1f}% (industry benchmark is 28-32%)
 Average Prime Cost: {avg_prime_percent:.1f}% (industry benchmark is 55-60%)
 Sales per Labor Hour: ${avg_sales_per_hour:.2f} (industry benchmark is $50+)
 Performance Trend: {trend}
-{daily_summary}
+{daily_summary}"""
 
-IMPORTANT FORMATTING RULES:
-- Write in plain, natural English without any markdown or special formatting
-- Do NOT use asterisks, bold markers, or hash symbols
-- Do NOT use LaTeX or mathematical notation like backslash commands
-- Write formulas in plain words: "Labor Cost Percentage equals Labor Cost divided by Total Sales, times 100"
-- Use simple numbered lists (1. 2. 3.) or dashes (-) for lists
-- Write like you're having a friendly conversation with a restaurant owner
+        model, max_tokens = _kpi_ai_settings(deep_analysis)
+        if stream:
+            return _kpi_ai_stream(api_key, prompt, model, max_tokens)
+        return _kpi_ai_completion(api_key, prompt, model, max_tokens)
+        
+    except Exception as e:
+        return f"AI analysis unavailable: {str(e)}"
 
-Provide a helpful analysis including:
-1. Executive Summary - overall performance and key findings
-2. Critical Issues - metrics outside industry benchmarks
-3. Quick Wins - immediate actions to improve performance
-4. Strategic Recommendations - longer term improvements
-5. Projected Impact - estimated savings if recommendations are implemented
 
-Keep the response practical and conversational for restaurant operators."""
+async def generate_ai_kpi_analysis_async(
+    total_sales: float,
+    avg_labor_percent: float,
+    avg_food_percent: float,
+    avg_prime_percent: float,
+    avg_sales_per_hour: float,
+    trend: str,
+    num_days: int,
+    daily_data: List[Dict] = None,
+    deep_analysis: bool = False
+) -> Optional[str]:
+    """
+    Awaitable form of generate_ai_kpi_analysis for callers running several analyses at once.
 
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are an expert restaurant consultant with 20+ years of experience in hospitality operations. You specialize in KPI analysis, cost control, operational efficiency, and strategic business optimization.
+    The request is network-bound, so asyncio.gather over several of these overlaps their
+    waits. Each runs the blocking call in a worker thread, which keeps the memoized
+    completions and the pooled client that the synchronous path uses.
 
-CRITICAL FORMATTING RULES - YOU MUST FOLLOW THESE:
-1. NEVER use markdown formatting (no asterisks, no bold markers like **, no hash symbols like ##)
-2. NEVER use LaTeX or mathematical notation (no \\text{}, no \\frac{}, no \\left, no \\right, no backslash commands)
-3. Write in plain, natural English like a friendly conversation
-4. For formulas, write them as plain words: "Labor Cost Percentage equals Labor Cost divided by Sales, times 100"
-5. Use simple numbered lists (1. 2. 3.) or dashes (-) for lists
+    Returns:
+        AI-generated analysis string or None if unavailable
+    """
+    return await asyncio.to_thread(
+        generate_ai_kpi_analysis,
+        total_sales, avg_labor_percent, avg_food_percent, avg_prime_percent, avg_sales_per_hour, trend, num_days, daily_data,
+        deep_analysis=deep_analysis,
+    )
 
-Your Response Style:
-- Write like you're having a conversation with a restaurant owner
-- Break down complex metrics into easy-to-understand explanations
-- Show your calculations in plain English with actual numbers
-- Compare results to industry benchmarks naturally in the text
-- Provide specific dollar amounts and percentages
 
-When Analyzing Data:
-- Acknowledge the specific numbers provided
-- Explain calculations conversationally with actual values
-- Mention industry benchmarks in a natural way
-- Explain if performance is above or below standard
-- Provide 3-5 specific action items
-- Quantify potential impact when possible
+def _freeze(value):
+    """
+    Convert report inputs to a hashable cache key that _thaw can rebuild.
 
-Industry Benchmarks to Reference:
-- Food Cost: 28-32% (ideal around 30%)
-- Labor Cost: 25-30% (ideal around 28%)
-- Prime Cost: 55-65% (ideal around 60%)
-- Beverage Cost: 18-24% (ideal around 20%)
-- Sales Per Labor Hour: $35-50 or higher
+    Types are kept alongside values so that 1, 1.0 and True, which hash alike but are
+    formatted differently, never share a cached report. Dict order is kept because it is
+    the order the report lists items in. Only plain dicts, lists and tuples are unpacked;
+    subclasses such as NamedTuples could not be rebuilt by _thaw, so they raise TypeError
+    and the caller renders without the cache.
+    """
+    kind = type(value)
+    if kind is dict:
+        return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+    if kind is list or kind is tuple:
+        return (kind, tuple(_freeze(v) for v in value))
+    if isinstance(value, (dict, list, tuple)):
+        raise TypeError(f"cannot freeze {kind.__name__} report inputs")
+    return (kind, value)
+
+
+def _thaw(frozen):
+    """Rebuild report inputs from a _freeze key."""
+    kind, value = frozen
+    if kind is dict:
+        return {k: _thaw(v) for k, v in value}
+    if kind is list or kind is tuple:
+        return kind(_thaw(v) for v in value)
+    return value
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_business_report(key, report_day):
+    """
+    Memoized _render_business_report over a _freeze key of its arguments.
 
-Write naturally and conversationally. No special formatting or markup."""
-                },
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=2000,
-        )
-        
-        return response.choices[0].message.content
-        
-    except Exception as e:
-        return f"AI analysis unavailable: {str(e)}"
+    report_day is part of the cache key only, so cached reports never carry a stale
+    generated date; it is None for reports with an explicit report_date. The returned
+    dict is shared between calls and must not be mutated.
+    """
+    return _render_business_report(*_thaw(key))
 
 
-def format_business_report(analysis_type, metrics, performance, recommendations, benchmarks=None, additional_data=None):
-    current_date = datetime.now().strftime("%B %d, %Y")
+def format_business_report(analysis_type, metrics, performance, recommendations, benchmarks=None, additional_data=None, output_formats=_REPORT_FORMATS, report_date=None):
+    """
+    Build the text and HTML business report for an analysis
 
-    rating = performance['rating']
-    tone = (
-        "excellent" if rating == "Excellent"
-        else "good" if rating == "Good"
-        else "acceptable" if rating == "Acceptable"
-        else "concerning"
-    )
-    comp = (
-        "exceed" if rating in ["Excellent", "Good"]
-        else "meet" if rating == "Acceptable"
-        else "fall below"
+    Reports are memoized on the exact inputs, so dashboards re-rendering the same figures
+    skip the rendering; format_business_report.cache_info() reports hits and misses. The
+    returned dict still echoes the caller's own metrics, benchmarks, recommendations and
+    additional data.
+
+    report_date replaces today's date in the report, so a batch of reports can share one
+    formatted date and their cache entries do not expire at midnight.
+    """
+    args = (analysis_type, metrics, performance, recommendations, benchmarks, additional_data, output_formats, report_date)
+    try:
+        key = _freeze(args)
+        hash(key)
+    except TypeError:
+        return _render_business_report(*args)
+
+    report = dict(_cached_business_report(key, _report_day() if report_date is None else None))
+    report["key_metrics"] = metrics
+    report["benchmarks"] = benchmarks or {}
+    report["recommendations"] = recommendations
+    report["additional_insights"] = additional_data or {}
+    return report
+
+
+format_business_report.cache_info = _cached_business_report.cache_info
+format_business_report.cache_clear = _cached_business_report.cache_clear
+
+
+def render_business_report(report, output_formats=_REPORT_FORMATS):
+    """
+    Render the reports for an analysis result that was built without them
+
+    Lets JSON-only callers run an analysis with output_formats=frozenset() and render the
+    text or HTML later, only if it is actually displayed. Works on any result returned by
+    format_business_report, dated as the original analysis; the beverage analyses skip their
+    insight figures along with the report, so they should be rerun with output_formats instead.
+
+    Returns:
+        A copy of report with business_report and business_report_html filled in
+    """
+    rendered = format_business_report(
+        report["analysis_type"],
+        report["key_metrics"],
+        {"rating": report["performance_rating"], "color": report["performance_color"]},
+        report["recommendations"],
+        report["benchmarks"],
+        report["additional_insights"],
+        output_formats=output_formats,
+        report_date=report["report_date"],
     )
+    return {
+        **report,
+        "business_report": rendered["business_report"],
+        "business_report_html": rendered["business_report_html"],
+    }
+
+
+def _render_business_report(analysis_type, metrics, performance, recommendations, benchmarks=None, additional_data=None, output_formats=_REPORT_FORMATS, report_date=None):
+    # Only the formats in output_formats are rendered; the others come back as None
+    current_date = report_date or _report_date(date.today().toordinal())
+
+    rating = performance['rating']
+    tone, comp = _RATING_META.get(rating, _DEFAULT_RATING_META)
 
     # Text (keep for file export)
     exec_summary_text = (
         f"PERFORMANCE RATING: {rating.upper()}\n\n"
         f"This {analysis_type.lower()} reveals {tone} performance metrics that {comp} industry standards."
     )
+    # Plain lines feed the HTML list items, bulleted ones the text report
     key_metrics_lines = []
+    key_metrics_text = []
     for k, v in metrics.items():
-        label = k.replace('_', ' ').title()
-        key_lower = k.lower()
+        label, float_fmt = _value_format(k)
         if isinstance(v, float):
-            if 'percent' in key_lower or '%' in k:
-                key_metrics_lines.append(f"{label}: {v:.1f}%")
-            elif any(w in key_lower for w in ['cost', 'sales', 'revenue', 'profit', 'savings', 'price']):
-                key_metrics_lines.append(f"{label}: ${v:,.2f}")
-            else:
-                key_metrics_lines.append(f"{label}: {v:.2f}")
+            line = f"{label}: " + float_fmt.format(v)
+        # Only apply numeric grouping if value is an int
+        elif isinstance(v, int):
+            line = f"{label}: {v:,}"
         else:
-            # Only apply numeric grouping if value is an int
-            if isinstance(v, int):
-                key_metrics_lines.append(f"{label}: {v:,}")
-            else:
-                key_metrics_lines.append(f"{label}: {v}")
+            line = f"{label}: {v}"
+        key_metrics_lines.append(line)
+        key_metrics_text.append("• " + line)
 
     bench_lines = []
+    bench_text = []
     if benchmarks:
         for k, v in benchmarks.items():
+            label = _value_format(k)[0]
             if isinstance(v, (int, float)):
-                bench_lines.append(f"{k.replace('_', ' ').title()}: {v:.1f}%")
-            else:
-                bench_lines.append(f"{k.replace('_', ' ').title()}: {v}")
-
-    rec_lines = [f"{i}. {r}" for i, r in enumerate(recommendations, 1)]
-
-    add_lines = []
-    if additional_data:
-        for k, v in additional_data.items():
-            if isinstance(v, dict):
-                add_lines.append(f"{k.replace('_',' ').title()}:")
-                for sk, sv in v.items():
-                    add_lines.append(f"  {sk.replace('_',' ').title()}: {sv}")
+                line = f"{label}: {v:.1f}%"
             else:
-                add_lines.append(f"{k.replace('_',' ').title()}: {v}")
+                line = f"{label}: {v}"
+            bench_lines.append(line)
+            bench_text.append("• " + line)
 
-    # Add bullets back for text version
-    key_metrics_text = ["• " + line for line in key_metrics_lines]
-    bench_text = ["• " + line for line in bench_lines] if bench_lines else []
+    # One pass over the additional data feeds both the text lines and the HTML sections
+    want_text = "text" in output_formats
+    want_html = "html" in output_formats
     add_text = []
-    for line in add_lines:
-        if line.startswith("  "):  # Indented sub-item
-            add_text.append("  • " + line.strip())
-        else:
-            add_text.append("• " + line)
-    
-    business_report_text = (
-        f"RESTAURANT CONSULTING REPORT — {analysis_type.upper()}\n"
-        f"Generated: {current_date}\n\n"
-        f"{exec_summary_text}\n\n"
-        "KEY PERFORMANCE METRICS\n"
-        + "\n".join(key_metrics_text) + ("\n\nINDUSTRY BENCHMARKS\n" + "\n".join(bench_text) if bench_text else "")
-        + ("\n\nADDITIONAL INSIGHTS\n" + "\n".join(add_text) if add_text else "")
-        + "\n\nSTRATEGIC RECOMMENDATIONS\n"
-        + "\n".join(rec_lines)
-        + "\n\nEND OF REPORT"
-    ).strip()
-
-    # HTML (for on-screen display)
-    def li_items(lines):  # helper for <ul>
-        return "".join(f"<li>{line}</li>" for line in lines)
-    
-    def format_tracking_section(title, data, icon="📊"):
-        """Format a tracking section with proper HTML styling"""
-        if not data or not isinstance(data, dict):
-            return ""
-        
-        # Determine status color based on data_source or status
-        data_source = data.get('data_source', data.get('Data Source', 'Estimated'))
-        status = data.get('status', data.get('Status', ''))
-        
-        if data_source == 'Actual':
-            source_badge = '<span class="badge badge--excellent" style="font-size: 0.7rem; padding: 2px 8px;">✓ Actual Data</span>'
-        else:
-            source_badge = '<span class="badge badge--needs-improvement" style="font-size: 0.7rem; padding: 2px 8px;">⚠ Estimated</span>'
-        
-        # Build metric items
-        metric_items = []
-        for k, v in data.items():
-            if k.lower() in ['data_source', 'status', 'rating']:
-                continue  # Skip meta fields, we'll show them separately
-            label = k.replace('_', ' ').title()
-            if isinstance(v, float):
-                if 'percent' in k.lower():
-                    formatted_value = f"{v:.1f}%"
-                elif any(w in k.lower() for w in ['cost', 'check', 'price']):
-                    formatted_value = f"${v:,.2f}"
-                elif 'ratio' in k.lower():
-                    formatted_value = f"{v:.2f}"
-                else:
-                    formatted_value = f"{v:,.1f}"
-            elif isinstance(v, int):
-                formatted_value = f"{v:,}"
-            else:
-                formatted_value = str(v)
-            metric_items.append(f'<div class="tracking-metric"><span class="tracking-label">{label}</span><span class="tracking-value">{formatted_value}</span></div>')
-        
-        # Add rating if present
-        rating = data.get('rating', data.get('Rating', ''))
-        if rating:
-            rating_class = rating.lower().replace(' ', '-')
-            metric_items.append(f'<div class="tracking-metric"><span class="tracking-label">Rating</span><span class="badge badge--{rating_class}" style="font-size: 0.75rem;">{rating}</span></div>')
-        
-        return f'''
-        <div class="tracking-card">
-            <div class="tracking-header">
-                <span class="tracking-icon">{icon}</span>
-                <span class="tracking-title">{title}</span>
-                {source_badge}
-            </div>
-            <div class="tracking-body">
-                {''.join(metric_items)}
-            </div>
-        </div>'''
-    
-    # Build tracking sections HTML
-    tracking_html = ""
+    tracking_cards = []
     other_insights = []
-    
-    if additional_data:
+    if additional_data and (want_text or want_html):
         for k, v in additional_data.items():
+            label, float_fmt = _value_format(k, _INSIGHT_FLOAT_RULES)
             if isinstance(v, dict):
                 # This is a tracking section
-                if 'savings' in k.lower():
-                    tracking_html += format_tracking_section("💰 Savings Opportunities", v, "💵")
-                elif 'overtime' in k.lower():
-                    tracking_html += format_tracking_section("Overtime Tracking", v, "⏰")
-                elif 'productivity' in k.lower():
-                    tracking_html += format_tracking_section("Productivity Metrics", v, "📈")
-                elif 'efficiency' in k.lower():
-                    tracking_html += format_tracking_section("Efficiency Metrics", v, "⚡")
-                elif 'revenue' in k.lower():
-                    tracking_html += format_tracking_section("Revenue Analysis", v, "💰")
-                elif 'waste' in k.lower():
-                    tracking_html += format_tracking_section("Waste Tracking", v, "🗑️")
-                elif 'inventory' in k.lower():
-                    tracking_html += format_tracking_section("Inventory Analysis", v, "📦")
-                elif 'growth' in k.lower():
-                    tracking_html += format_tracking_section("Growth Analysis", v, "🚀")
-                elif 'benchmark' in k.lower():
-                    tracking_html += format_tracking_section("Benchmark Comparison", v, "🎯")
-                elif 'cover' in k.lower():
-                    tracking_html += format_tracking_section("Per-Cover Metrics", v, "👥")
-                elif 'menu' in k.lower():
-                    tracking_html += format_tracking_section("Menu Costing", v, "📋")
-                elif 'cost_breakdown' in k.lower():
-                    tracking_html += format_tracking_section("Cost Breakdown", v, "📊")
-                elif 'trend' in k.lower():
-                    tracking_html += format_tracking_section("Trend Analysis", v, "📉")
-                else:
-                    tracking_html += format_tracking_section(k.replace('_', ' ').title(), v, "📊")
+                if want_text:
+                    add_text.append(_text_bullet(f"{label}:"))
+                    for sk, sv in v.items():
+                        add_text.append(_text_bullet(f"  {_value_format(sk)[0]}: {sv}"))
+                if want_html:
+                    title, icon = _tracking_heading(k)
+                    tracking_cards.append(_format_tracking_section(title, v, icon))
             else:
                 # Regular insight item
-                label = k.replace('_', ' ').title()
-                if isinstance(v, float):
-                    if 'percent' in k.lower():
-                        other_insights.append(f"{label}: {v:.1f}%")
-                    elif any(w in k.lower() for w in ['cost', 'savings', 'price']):
-                        other_insights.append(f"{label}: ${v:,.2f}")
+                if want_text:
+                    add_text.append(_text_bullet(f"{label}: {v}"))
+                if want_html:
+                    if isinstance(v, float):
+                        other_insights.append(f"{label}: " + float_fmt.format(v))
                     else:
-                        other_insights.append(f"{label}: {v:.2f}")
-                else:
-                    other_insights.append(f"{label}: {v}")
-    
-    # Wrap tracking sections if any exist
-    if tracking_html:
-        tracking_html = f'<div class="tracking-section"><h3>📊 Detailed Tracking & Analytics</h3><div class="tracking-grid">{tracking_html}</div></div>'
-    
-    # Other insights section
-    other_insights_html = ""
-    if other_insights:
-        other_insights_html = f"<h3>Additional Insights</h3><ul>{li_items(other_insights)}</ul>"
-
-    # Normalize badge class name
-    badge_class = rating.lower().replace(' ', '-').replace('_', '-')
-
-    # Add CSS styles for tracking sections
-    tracking_styles = '''<style>
-    .tracking-section { margin: 1.5rem 0; }
-    .tracking-section h3 { color: #1e293b; margin-bottom: 1rem; font-size: 1.1rem; }
-    .tracking-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 1rem; }
-    .tracking-card { background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%); border-radius: 12px; border: 1px solid rgba(102, 126, 234, 0.15); overflow: hidden; }
-    .tracking-header { display: flex; align-items: center; gap: 0.5rem; padding: 0.75rem 1rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; }
-    .tracking-icon { font-size: 1.2rem; }
-    .tracking-title { font-weight: 600; flex: 1; }
-    .tracking-body { padding: 1rem; display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem; }
-    .tracking-metric { display: flex; flex-direction: column; padding: 0.5rem; background: white; border-radius: 8px; border: 1px solid #e2e8f0; }
-    .tracking-label { font-size: 0.75rem; color: #64748b; text-transform: uppercase; letter-spacing: 0.5px; }
-    .tracking-value { font-size: 1.1rem; font-weight: 600; color: #1e293b; }
-    </style>'''
-    
-    business_report_html = f"""{tracking_styles}<section class="report"><header class="report__header"><h2>{analysis_type}</h2><div class="report__meta">Generated: {current_date}</div><div class="badge badge--{badge_class}">{rating}</div></header><article class="report__body"><p class="lead">This {analysis_type.lower()} reveals <strong>{tone}</strong> performance metrics that <strong>{comp}</strong> industry standards.</p><h3>Key Performance Metrics</h3><ul>{li_items(key_metrics_lines)}</ul>{f"<h3>Industry Benchmarks</h3><ul>{li_items(bench_lines)}</ul>" if bench_lines else ""}{tracking_html}{other_insights_html}<h3>Strategic Recommendations</h3><ol>{''.join(f'<li>{r}</li>' for r in recommendations)}</ol></article></section>"""
+                        other_insights.append(f"{label}: {v}")
+
+    business_report_text = None
+    if want_text:
+        rec_lines = [f"{i}. {r}" for i, r in enumerate(recommendations, 1)]
+
+        business_report_text = (
+            f"RESTAURANT CONSULTING REPORT — {analysis_type.upper()}\n"
+            f"Generated: {current_date}\n\n"
+            f"{exec_summary_text}\n\n"
+            "KEY PERFORMANCE METRICS\n"
+            + "\n".join(key_metrics_text) + ("\n\nINDUSTRY BENCHMARKS\n" + "\n".join(bench_text) if bench_text else "")
+            + ("\n\nADDITIONAL INSIGHTS\n" + "\n".join(add_text) if add_text else "")
+            + "\n\nSTRATEGIC RECOMMENDATIONS\n"
+            + "\n".join(rec_lines)
+            + "\n\nEND OF REPORT"
+        ).strip()
+
+    business_report_html = None
+    if want_html:
+        # HTML (for on-screen display)
+        # Wrap tracking sections if any exist
+        tracking_html = ""
+        if tracking_cards:
+            tracking_html = f'<div class="tracking-section"><h3>📊 Detailed Tracking & Analytics</h3><div class="tracking-grid">{"".join(tracking_cards)}</div></div>'
+
+        # Other insights section
+        other_insights_html = ""
+        if other_insights:
+            other_insights_html = f"<h3>Additional Insights</h3><ul>{_li_items(other_insights)}</ul>"
+
+        # Normalize badge class name
+        badge_class = _BADGE_CLASS.get(rating) or rating.lower().replace(' ', '-').replace('_', '-')
+
+        business_report_html = _REPORT_HTML_T.substitute(
+            analysis_type=analysis_type,
+            analysis_type_lower=analysis_type.lower(),
+            current_date=current_date,
+            badge_class=badge_class,
+            rating=rating,
+            tone=tone,
+            comp=comp,
+            key_metrics=_li_items(key_metrics_lines),
+            benchmarks_section=f"<h3>Industry Benchmarks</h3><ul>{_li_items(bench_lines)}</ul>" if bench_lines else "",
+            tracking_html=tracking_html,
+            other_insights_html=other_insights_html,
+            recommendations=_li_items([str(r) for r in recommendations]),
+        )
 
     return {
         "status": "success",
@@ -365,7 +812,24 @@ def format_business_report(analysis_type, metrics, performance, recommendations,
     }
 
 
-def calculate_labor_cost_analysis(total_sales, labor_cost, hours_worked, target_labor_percent=30.0, overtime_hours=None, covers=None):
+def _core_kpis(total_sales, labor_cost, food_cost):
+    """
+    Cost percentages shared by the KPI analyses, for validated inputs with positive sales
+
+    Returns:
+        tuple: (labor_percent, food_percent, prime_cost, prime_percent)
+    """
+    prime_cost = labor_cost + food_cost
+    return (
+        (labor_cost / total_sales) * 100,
+        (food_cost / total_sales) * 100,
+        prime_cost,
+        (prime_cost / total_sales) * 100,
+    )
+
+
+@_memoize_report(_report_day)
+def calculate_labor_cost_analysis(total_sales, labor_cost, hours_worked, target_labor_percent=30.0, overtime_hours=None, covers=None, output_formats=_REPORT_FORMATS):
     """
     Comprehensive Labor Cost Analysis with industry benchmarks and recommendations
 
@@ -376,6 +840,7 @@ def calculate_labor_cost_analysis(total_sales, labor_cost, hours_worked, target_
         target_labor_percent (float): Target labor percentage (default 30%)
         overtime_hours (float, optional): Actual overtime hours worked
         covers (int, optional): Number of guests served
+        output_formats (frozenset): Report formats to render, "text" and/or "html"
 
     Returns:
         dict: Labor cost analysis with recommendations
@@ -423,23 +888,12 @@ def calculate_labor_cost_analysis(total_sales, labor_cost, hours_worked, target_
     labor_cost_per_cover = labor_cost / actual_covers if actual_covers > 0 else 0
 
     # Industry benchmarks
-    excellent_labor_percent = 25.0
-    good_labor_percent = 30.0
-    acceptable_labor_percent = 35.0
+    excellent_labor_percent, good_labor_percent, acceptable_labor_percent = _LABOR_PERCENT_BANDS
 
     # Performance assessment
-    if labor_percent <= excellent_labor_percent:
-        performance = "Excellent"
-        performance_color = "green"
-    elif labor_percent <= good_labor_percent:
-        performance = "Good"
-        performance_color = "blue"
-    elif labor_percent <= acceptable_labor_percent:
-        performance = "Acceptable"
-        performance_color = "yellow"
-    else:
-        performance = "Needs Improvement"
-        performance_color = "red"
+    band = bisect.bisect_left(_LABOR_PERCENT_BANDS, labor_percent)
+    performance = _RATING_LABELS[band]
+    performance_color = _RATING_COLORS[band]
 
     # Calculate potential savings
     target_labor_cost = (target_labor_percent / 100) * total_sales
@@ -544,11 +998,13 @@ def calculate_labor_cost_analysis(total_sales, labor_cost, hours_worked, target_
         performance=performance_data,
         recommendations=recommendations,
         benchmarks=benchmarks,
-        additional_data=additional_insights
+        additional_data=additional_insights,
+        output_formats=output_formats
     )
 
 
-def calculate_food_cost_analysis(total_sales, food_cost, target_food_percent=30.0, waste_cost=None, covers=None, beginning_inventory=None, ending_inventory=None):
+@_memoize_report(_report_day)
+def calculate_food_cost_analysis(total_sales, food_cost, target_food_percent=30.0, waste_cost=None, covers=None, beginning_inventory=None, ending_inventory=None, output_formats=_REPORT_FORMATS):
     """
     Comprehensive Food Cost Analysis with industry benchmarks and recommendations
 
@@ -560,6 +1016,7 @@ def calculate_food_cost_analysis(total_sales, food_cost, target_food_percent=30.
         covers (int, optional): Number of guests served
         beginning_inventory (float, optional): Starting inventory value
         ending_inventory (float, optional): Ending inventory value
+        output_formats (frozenset): Report formats to render, "text" and/or "html"
 
     Returns:
         dict: Food cost analysis with recommendations
@@ -613,23 +1070,12 @@ def calculate_food_cost_analysis(total_sales, food_cost, target_food_percent=30.
     contribution_margin = gross_profit / actual_covers if actual_covers > 0 else 0  # Per cover
 
     # Industry benchmarks
-    excellent_food_percent = 25.0
-    good_food_percent = 30.0
-    acceptable_food_percent = 35.0
+    excellent_food_percent, good_food_percent, acceptable_food_percent = _FOOD_PERCENT_BANDS
 
     # Performance assessment
-    if food_percent <= excellent_food_percent:
-        performance = "Excellent"
-        performance_color = "green"
-    elif food_percent <= good_food_percent:
-        performance = "Good"
-        performance_color = "blue"
-    elif food_percent <= acceptable_food_percent:
-        performance = "Acceptable"
-        performance_color = "yellow"
-    else:
-        performance = "Needs Improvement"
-        performance_color = "red"
+    band = bisect.bisect_left(_FOOD_PERCENT_BANDS, food_percent)
+    performance = _RATING_LABELS[band]
+    performance_color = _RATING_COLORS[band]
 
     # Calculate potential savings
     target_food_cost = (target_food_percent / 100) * total_sales
@@ -744,11 +1190,13 @@ def calculate_food_cost_analysis(total_sales, food_cost, target_food_percent=30.
         performance=performance_data,
         recommendations=recommendations,
         benchmarks=benchmarks,
-        additional_data=additional_insights
+        additional_data=additional_insights,
+        output_formats=output_formats
     )
 
 
-def calculate_prime_cost_analysis(total_sales, labor_cost, food_cost, target_prime_percent=60.0, covers=None):
+@_memoize_report(_report_day)
+def calculate_prime_cost_analysis(total_sales, labor_cost, food_cost, target_prime_percent=60.0, covers=None, output_formats=_REPORT_FORMATS):
     """
     Comprehensive Prime Cost Analysis (Labor + Food costs)
 
@@ -758,6 +1206,7 @@ def calculate_prime_cost_analysis(total_sales, labor_cost, food_cost, target_pri
         food_cost (float): Total food costs
         target_prime_percent (float): Target prime cost percentage (default 60%)
         covers (int, optional): Number of guests served
+        output_formats (frozenset): Report formats to render, "text" and/or "html"
 
     Returns:
         dict: Prime cost analysis with recommendations
@@ -767,10 +1216,7 @@ def calculate_prime_cost_analysis(total_sales, labor_cost, food_cost, target_pri
         return {"status": "error", "message": "All inputs must be positive numbers"}
 
     # Calculate key metrics - Prime Cost Percentage
-    prime_cost = labor_cost + food_cost
-    prime_percent = (prime_cost / total_sales) * 100
-    labor_percent = (labor_cost / total_sales) * 100
-    food_percent = (food_cost / total_sales) * 100
+    labor_percent, food_percent, prime_cost, prime_percent = _core_kpis(total_sales, labor_cost, food_cost)
     gross_profit = total_sales - prime_cost
     gross_profit_margin = (gross_profit / total_sales) * 100
     
@@ -788,23 +1234,12 @@ def calculate_prime_cost_analysis(total_sales, labor_cost, food_cost, target_pri
     profit_per_cover = gross_profit / actual_covers if actual_covers > 0 else 0
 
     # Industry benchmarks
-    excellent_prime_percent = 55.0
-    good_prime_percent = 60.0
-    acceptable_prime_percent = 65.0
+    excellent_prime_percent, good_prime_percent, acceptable_prime_percent = _PRIME_PERCENT_BANDS
 
     # Performance assessment
-    if prime_percent <= excellent_prime_percent:
-        performance = "Excellent"
-        performance_color = "green"
-    elif prime_percent <= good_prime_percent:
-        performance = "Good"
-        performance_color = "blue"
-    elif prime_percent <= acceptable_prime_percent:
-        performance = "Acceptable"
-        performance_color = "yellow"
-    else:
-        performance = "Needs Improvement"
-        performance_color = "red"
+    band = bisect.bisect_left(_PRIME_PERCENT_BANDS, prime_percent)
+    performance = _RATING_LABELS[band]
+    performance_color = _RATING_COLORS[band]
 
     # Calculate potential savings
     target_prime_cost = (target_prime_percent / 100) * total_sales
@@ -817,13 +1252,6 @@ def calculate_prime_cost_analysis(total_sales, labor_cost, food_cost, target_pri
     }
     
     # Target Benchmarking
-    industry_benchmarks = {
-        "fine_dining": {"target": 65, "labor": 35, "food": 30},
-        "casual_dining": {"target": 60, "labor": 30, "food": 30},
-        "fast_casual": {"target": 55, "labor": 25, "food": 30},
-        "quick_service": {"target": 50, "labor": 22, "food": 28}
-    }
-    
     # Determine best fit segment based on labor/food ratio
     if labor_percent > food_percent + 5:
         segment_fit = "fine_dining"
@@ -834,7 +1262,7 @@ def calculate_prime_cost_analysis(total_sales, labor_cost, food_cost, target_pri
     else:
         segment_fit = "fast_casual"
     
-    segment_benchmark = industry_benchmarks[segment_fit]
+    segment_benchmark = _PRIME_SEGMENT_BENCHMARKS[segment_fit]
     vs_segment_target = prime_percent - segment_benchmark["target"]
     labor_vs_benchmark = labor_percent - segment_benchmark["labor"]
     food_vs_benchmark = food_percent - segment_benchmark["food"]
@@ -970,11 +1398,13 @@ def calculate_prime_cost_analysis(total_sales, labor_cost, food_cost, target_pri
         performance=performance_data,
         recommendations=recommendations,
         benchmarks=benchmarks,
-        additional_data=additional_insights
+        additional_data=additional_insights,
+        output_formats=output_formats
     )
 
 
-def calculate_sales_performance_analysis(total_sales, labor_cost, food_cost, hours_worked, previous_sales=None, covers=None, avg_check=None):
+@_memoize_report(_report_day)
+def calculate_sales_performance_analysis(total_sales, labor_cost, food_cost, hours_worked, previous_sales=None, covers=None, avg_check=None, output_formats=_REPORT_FORMATS):
     """
     Comprehensive Sales Performance Analysis
 
@@ -986,6 +1416,7 @@ def calculate_sales_performance_analysis(total_sales, labor_cost, food_cost, hou
         previous_sales (float, optional): Previous period sales for comparison
         covers (int, optional): Number of guests served
         avg_check (float, optional): Average check amount
+        output_formats (frozenset): Report formats to render, "text" and/or "html"
 
     Returns:
         dict: Sales performance analysis with insights
@@ -996,10 +1427,9 @@ def calculate_sales_performance_analysis(total_sales, labor_cost, food_cost, hou
 
     # Calculate key metrics - Sales Per Labor Hour
     sales_per_labor_hour = total_sales / hours_worked
-    labor_percent = (labor_cost / total_sales) * 100
-    food_percent = (food_cost / total_sales) * 100
+    labor_percent, food_percent, prime_cost, _ = _core_kpis(total_sales, labor_cost, food_cost)
     prime_percent = labor_percent + food_percent
-    gross_profit = total_sales - (labor_cost + food_cost)
+    gross_profit = total_sales - prime_cost
     gross_profit_margin = (gross_profit / total_sales) * 100
     
     # Calculate per-cover metrics - use provided values or estimate
@@ -1057,7 +1487,7 @@ def calculate_sales_performance_analysis(total_sales, labor_cost, food_cost, hou
     # Revenue mix analysis
     revenue_after_labor = total_sales - labor_cost
     revenue_after_food = total_sales - food_cost
-    net_revenue = total_sales - (labor_cost + food_cost)
+    net_revenue = total_sales - prime_cost
     revenue_retention_rate = (net_revenue / total_sales) * 100
 
     # Growth Analysis
@@ -1205,10 +1635,12 @@ def calculate_sales_performance_analysis(total_sales, labor_cost, food_cost, hou
         performance=performance_data,
         recommendations=recommendations,
         benchmarks=benchmarks,
-        additional_data=additional_insights
+        additional_data=additional_insights,
+        output_formats=output_formats
     )
 
 
+@_memoize_report(_report_minute)
 def calculate_kpi_summary(total_sales, labor_cost, food_cost, hours_worked):
     """
     Calculate comprehensive KPI summary with input validation
@@ -1225,41 +1657,23 @@ def calculate_kpi_summary(total_sales, labor_cost, food_cost, hours_worked):
     # Input validation
     inputs = {"total_sales": total_sales, "labor_cost": labor_cost, "food_cost": food_cost, "hours_worked": hours_worked}
 
-    # Check for None values
+    # Check each input for null, type, sign and, where division occurs, zero
     for name, value in inputs.items():
         if value is None:
             return {"status": "error", "message": f"{name} cannot be null"}
-
-    # Check for numeric types
-    for name, value in inputs.items():
         if not isinstance(value, (int, float)):
             return {"status": "error", "message": f"{name} must be a number, got {type(value).__name__}"}
-
-    # Check for negative values
-    for name, value in inputs.items():
         if value < 0:
             return {"status": "error", "message": f"{name} cannot be negative"}
-
-    # Check for zero values where division occurs
-    if total_sales == 0:
-        return {"status": "error", "message": "total_sales cannot be zero"}
-
-    if hours_worked == 0:
-        return {"status": "error", "message": "hours_worked cannot be zero"}
+        if value == 0 and name in _KPI_SUMMARY_DIVISORS:
+            return {"status": "error", "message": f"{name} cannot be zero"}
 
     # Perform calculations
-    prime_cost = labor_cost + food_cost
-    labor_percent = (labor_cost / total_sales) * 100
-    food_percent = (food_cost / total_sales) * 100
-    prime_percent = (prime_cost / total_sales) * 100
+    labor_percent, food_percent, prime_cost, prime_percent = _core_kpis(total_sales, labor_cost, food_cost)
     sales_per_labor_hour = total_sales / hours_worked
 
-    # Industry benchmarks for comparison
-    industry_benchmarks = {
-        "labor_percent": {"excellent": 25, "good": 30, "needs_improvement": 35},
-        "food_percent": {"excellent": 28, "good": 32, "needs_improvement": 38},
-        "prime_percent": {"excellent": 55, "good": 60, "needs_improvement": 65},
-    }
+    # Industry benchmarks for comparison, copied so callers cannot alter the shared table
+    industry_benchmarks = {key: dict(value) for key, value in _KPI_SUMMARY_BENCHMARKS.items()}
 
     # Performance assessment
     def assess_performance(value, benchmarks):
@@ -1270,9 +1684,9 @@ def calculate_kpi_summary(total_sales, labor_cost, food_cost, hours_worked):
         else:
             return "needs_improvement", "🔴"
 
-    labor_assessment, labor_icon = assess_performance(labor_percent, industry_benchmarks["labor_percent"])
-    food_assessment, food_icon = assess_performance(food_percent, industry_benchmarks["food_percent"])
-    prime_assessment, prime_icon = assess_performance(prime_percent, industry_benchmarks["prime_percent"])
+    labor_assessment, labor_icon = assess_performance(labor_percent, _KPI_SUMMARY_BENCHMARKS["labor_percent"])
+    food_assessment, food_icon = assess_performance(food_percent, _KPI_SUMMARY_BENCHMARKS["food_percent"])
+    prime_assessment, prime_icon = assess_performance(prime_percent, _KPI_SUMMARY_BENCHMARKS["prime_percent"])
 
     # Generate recommendations
     recommendations = []
@@ -1288,6 +1702,14 @@ def calculate_kpi_summary(total_sales, labor_cost, food_cost, hours_worked):
     if not recommendations:
         recommendations.append("Great job! Your KPIs are within industry standards")
 
+    # Sort recommendations into their KPI sections in one pass; a recommendation can land in several
+    rec_buckets = {key: [] for key in _KPI_REC_SECTION_WORDS}
+    for rec in recommendations:
+        rec_lower = rec.lower()
+        for key, words in _KPI_REC_SECTION_WORDS.items():
+            if any(word in rec_lower for word in words):
+                rec_buckets[key].append(rec)
+
     # Generate business report using the new formatter
     kpi_data = {
         "labor_percent": {
@@ -1295,28 +1717,28 @@ def calculate_kpi_summary(total_sales, labor_cost, food_cost, hours_worked):
             "calculation": "(Labor Cost / Total Sales) × 100",
             "example": f"(${labor_cost:,.2f} / ${total_sales:,.2f}) × 100 = {labor_percent:.1f}%",
             "interpretation": f"Your labor cost percentage of {labor_percent:.1f}% is {labor_assessment} compared to industry standards of 25-30%.",
-            "recommendations": [rec for rec in recommendations if "labor" in rec.lower() or "staff" in rec.lower() or "scheduling" in rec.lower()]
+            "recommendations": rec_buckets["labor_percent"]
         },
         "food_percent": {
             "title": "Food Cost Percentage",
             "calculation": "(Food Cost / Total Sales) × 100",
             "example": f"(${food_cost:,.2f} / ${total_sales:,.2f}) × 100 = {food_percent:.1f}%",
             "interpretation": f"Your food cost percentage of {food_percent:.1f}% is {food_assessment} compared to industry standards of 28-32%.",
-            "recommendations": [rec for rec in recommendations if "food" in rec.lower() or "menu" in rec.lower() or "pricing" in rec.lower()]
+            "recommendations": rec_buckets["food_percent"]
         },
         "prime_percent": {
             "title": "Prime Cost Percentage",
             "calculation": "((Labor Cost + Food Cost) / Total Sales) × 100",
             "example": f"(${prime_cost:,.2f} / ${total_sales:,.2f}) × 100 = {prime_percent:.1f}%",
             "interpretation": f"Your prime cost percentage of {prime_percent:.1f}% is {prime_assessment} compared to industry standards of 55-60%.",
-            "recommendations": [rec for rec in recommendations if "prime" in rec.lower() or "cost" in rec.lower()]
+            "recommendations": rec_buckets["prime_percent"]
         },
         "sales_per_labor_hour": {
             "title": "Sales per Labor Hour",
             "calculation": "Total Sales / Labor Hours",
             "example": f"${total_sales:,.2f} / {hours_worked:.0f} hours = ${sales_per_labor_hour:.2f} per hour",
             "interpretation": f"Your sales per labor hour of ${sales_per_labor_hour:.2f} is {'excellent' if sales_per_labor_hour > 50 else 'good' if sales_per_labor_hour > 40 else 'needs improvement'} compared to industry standards of $50+/hour.",
-            "recommendations": [rec for rec in recommendations if "productivity" in rec.lower() or "sales" in rec.lower() or "training" in rec.lower()]
+            "recommendations": rec_buckets["sales_per_labor_hour"]
         }
     }
 
@@ -1369,37 +1791,105 @@ def calculate_kpi_summary(total_sales, labor_cost, food_cost, hours_worked):
     }
 
 
+def _daily_kpi_frame(chunk, mapped_columns, date_col):
+    """
+    Compute daily KPI rows for one chunk of uploaded CSV data
+
+    Rows without positive sales and labor hours are skipped; rows with negative costs
+    are counted as errors.
+
+    Returns:
+        tuple: (kpi_df, error_count)
+    """
+    import pandas as pd
+
+    # Clean and process data - a narrow frame of numeric columns under their standardized names
+    df_clean = pd.DataFrame({
+        target: pd.to_numeric(chunk[source_col], errors="coerce").fillna(0).astype("float64")
+        for target, source_col in mapped_columns.items()
+    })
+
+    usable = (df_clean["sales"] > 0) & (df_clean["labor_hours"] > 0)
+    valid = usable & (df_clean["labor_cost"] >= 0) & (df_clean["food_cost"] >= 0)
+    error_count = int((usable & ~valid).sum())
+    d = df_clean[valid]
+    dates = chunk.loc[valid, date_col].astype(str) if date_col else [f"Day {idx + 1}" for idx in d.index]
+    labor_percent, food_percent, prime_percent, sales_per_hour = daily_kpi_arrays(
+        d["sales"].to_numpy(), d["labor_cost"].to_numpy(), d["food_cost"].to_numpy(), d["labor_hours"].to_numpy()
+    )
+    kpi_df = pd.DataFrame({
+        "date": dates,
+        "sales": d["sales"],
+        "labor_percent": labor_percent.round(2),
+        "food_percent": food_percent.round(2),
+        "prime_percent": prime_percent.round(2),
+        "sales_per_hour": sales_per_hour.round(2),
+    })
+    return kpi_df, error_count
+
+
+def _read_kpi_csv(csv_file, mapped_columns, date_col, numeric_dtype=True):
+    """
+    Stream the uploaded CSV in chunks, keeping only the daily KPI rows
+
+    Only the mapped columns and the date column are parsed, so peak memory is one chunk of
+    raw data plus the narrow KPI frame rather than the whole file.
+
+    Args:
+        csv_file: Uploaded file or path, read from the start
+        mapped_columns (dict): KPI field name to CSV column name
+        date_col (str, optional): CSV column holding the row date
+        numeric_dtype (bool): Parse the mapped columns straight to float64; raises ValueError on text
+
+    Returns:
+        tuple: (kpi_df, row_count, error_count, sample_row)
+    """
+    import pandas as pd
+
+    usecols = list(dict.fromkeys([*mapped_columns.values(), *([date_col] if date_col else [])]))
+    dtype = dict.fromkeys(mapped_columns.values(), "float64") if numeric_dtype else None
+    if hasattr(csv_file, "seek"):
+        csv_file.seek(0)
+
+    frames = []
+    row_count = error_count = 0
+    sample_row = {}
+    with pd.read_csv(csv_file, usecols=usecols, dtype=dtype, engine="c", chunksize=_KPI_CSV_CHUNK_ROWS) as reader:
+        for chunk in reader:
+            if not row_count and len(chunk):
+                sample_row = chunk.head(1).to_dict("records")[0]
+            row_count += len(chunk)
+            kpi_chunk, chunk_errors = _daily_kpi_frame(chunk, mapped_columns, date_col)
+            frames.append(kpi_chunk)
+            error_count += chunk_errors
+
+    kpi_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return kpi_df, row_count, error_count, sample_row
+
+
 def process_kpi_csv_data(csv_file) -> Dict[str, Any]:
     """
     Process uploaded CSV file for comprehensive KPI analysis
 
     Expected CSV columns: date, sales, labor_cost, food_cost, labor_hours
     """
+    # pandas is only needed for uploads; importing it here keeps it out of the import cost
+    # of every module that just formats reports
+    import pandas as pd
+
     try:
-        df = pd.read_csv(csv_file)
-        
-        # Debug: log original columns
-        original_columns = list(df.columns)
-
-        # Flexible column mapping
-        column_mapping = {
-            "sales": ["sales", "revenue", "total_sales", "daily_sales"],
-            "labor_cost": ["labor_cost", "labor", "wages", "payroll"],
-            "food_cost": ["food_cost", "cogs", "cost_of_goods", "food"],
-            "labor_hours": ["labor_hours", "hours", "hours_worked", "staff_hours", "labor_hour"],
-        }
+        # Read the header first so only the needed columns are parsed
+        original_columns = list(pd.read_csv(csv_file, nrows=0).columns)
 
-        # Find matching columns
+        # Find matching columns: the first column containing any variation of each target
         mapped_columns = {}
-        for target, variations in column_mapping.items():
-            for col in df.columns:
-                col_lower = col.lower().strip()
-                if any(var.lower() == col_lower or var.lower() in col_lower for var in variations):
-                    mapped_columns[target] = col
-                    break
+        for target, pattern in _KPI_COLUMN_PATTERNS.items():
+            col = next((c for c in original_columns if pattern.search(c)), None)
+            if col is not None:
+                mapped_columns[target] = col
 
         # Check for required columns
-        missing_columns = [col for col in column_mapping.keys() if col not in mapped_columns]
+        missing_columns = [col for col in _KPI_COLUMN_PATTERNS if col not in mapped_columns]
         if missing_columns:
             # Check if this looks like a different type of file
             file_type_hint = ""
@@ -1425,72 +1915,40 @@ def process_kpi_csv_data(csv_file) -> Dict[str, Any]:
 
         # Preserve date column if it exists
         date_col = None
-        for col in df.columns:
+        for col in original_columns:
             if 'date' in col.lower():
                 date_col = col
                 break
 
-        # Clean and process data - create new columns with standardized names
-        df_clean = df.copy()
-        for target, source_col in mapped_columns.items():
-            df_clean[target] = pd.to_numeric(df_clean[source_col], errors="coerce").fillna(0)
+        try:
+            kpi_df, row_count, error_count, sample_row = _read_kpi_csv(csv_file, mapped_columns, date_col)
+        except ValueError:
+            # Text in a numeric column; parse it as-is and let to_numeric coerce it
+            kpi_df, row_count, error_count, sample_row = _read_kpi_csv(csv_file, mapped_columns, date_col, numeric_dtype=False)
 
-        # Calculate daily KPIs
-        daily_kpis = []
-        error_count = 0
-        for idx, row in df_clean.iterrows():
-            try:
-                sales_val = float(row["sales"])
-                labor_cost_val = float(row["labor_cost"])
-                food_cost_val = float(row["food_cost"])
-                labor_hours_val = float(row["labor_hours"])
-                
-                # Skip rows with zero or negative values
-                if sales_val <= 0 or labor_hours_val <= 0:
-                    continue
-                    
-                daily_kpi = calculate_kpi_summary(sales_val, labor_cost_val, food_cost_val, labor_hours_val)
-                if daily_kpi.get("status") == "success":
-                    # Get date from original column or use index
-                    date_value = str(row[date_col]) if date_col and date_col in row.index else f"Day {idx + 1}"
-                    daily_kpis.append(
-                        {
-                            "date": date_value,
-                            "sales": sales_val,
-                            "labor_percent": daily_kpi["kpis"]["labor_percent"]["value"],
-                            "food_percent": daily_kpi["kpis"]["food_percent"]["value"],
-                            "prime_percent": daily_kpi["kpis"]["prime_percent"]["value"],
-                            "sales_per_hour": daily_kpi["kpis"]["sales_per_labor_hour"]["value"],
-                        }
-                    )
-                else:
-                    error_count += 1
-            except Exception as row_error:
-                error_count += 1
-                continue
-
-        if not daily_kpis:
+        if kpi_df.empty:
             return {
                 "status": "error",
-                "message": f"No valid data found in CSV. Processed {len(df)} rows, {error_count} had errors.",
+                "message": f"No valid data found in CSV. Processed {row_count} rows, {error_count} had errors.",
                 "found_columns": original_columns,
                 "mapped_columns": mapped_columns,
                 "help": "Please ensure your CSV has positive values for sales and labor_hours. Check that numeric columns don't contain text.",
-                "sample_row": df.head(1).to_dict('records')[0] if len(df) > 0 else {}
+                "sample_row": sample_row
             }
 
-        # Calculate averages and trends
-        avg_labor_percent = sum(kpi["labor_percent"] for kpi in daily_kpis) / len(daily_kpis)
-        avg_food_percent = sum(kpi["food_percent"] for kpi in daily_kpis) / len(daily_kpis)
-        avg_prime_percent = sum(kpi["prime_percent"] for kpi in daily_kpis) / len(daily_kpis)
-        avg_sales_per_hour = sum(kpi["sales_per_hour"] for kpi in daily_kpis) / len(daily_kpis)
-        total_sales = sum(kpi["sales"] for kpi in daily_kpis)
+        # Calculate averages and trends with column reductions
+        averages = kpi_df[["labor_percent", "food_percent", "prime_percent", "sales_per_hour"]].mean()
+        avg_labor_percent = float(averages["labor_percent"])
+        avg_food_percent = float(averages["food_percent"])
+        avg_prime_percent = float(averages["prime_percent"])
+        avg_sales_per_hour = float(averages["sales_per_hour"])
+        total_sales = float(kpi_df["sales"].sum())
 
         # Calculate trends (comparing first half vs second half)
-        mid_point = max(1, len(daily_kpis) // 2)  # Ensure at least 1 to avoid division by zero
-        first_half_avg = sum(kpi["prime_percent"] for kpi in daily_kpis[:mid_point]) / mid_point if mid_point > 0 else 0
-        second_half_count = len(daily_kpis) - mid_point
-        second_half_avg = sum(kpi["prime_percent"] for kpi in daily_kpis[mid_point:]) / second_half_count if second_half_count > 0 else 0
+        prime_percents = kpi_df["prime_percent"].to_numpy()
+        mid_point = max(1, len(prime_percents) // 2)  # Ensure at least 1 to avoid division by zero
+        first_half_avg = prime_percents[:mid_point].mean()
+        second_half_avg = prime_percents[mid_point:].mean() if len(prime_percents) > mid_point else 0
         trend = (
             "improving" if second_half_avg < first_half_avg else "declining" if second_half_avg > first_half_avg else "stable"
         )
@@ -1510,8 +1968,8 @@ def process_kpi_csv_data(csv_file) -> Dict[str, Any]:
                 avg_prime_percent=avg_prime_percent,
                 avg_sales_per_hour=avg_sales_per_hour,
                 trend=trend,
-                num_days=len(daily_kpis),
-                daily_data=daily_kpis[:10]  # Send first 10 days for pattern analysis
+                num_days=len(kpi_df),
+                daily_data=kpi_df.head(10).to_dict("records")  # Send first 10 days for pattern analysis
             )
         except Exception as e:
             ai_analysis = f"AI analysis unavailable: {str(e)}"
@@ -1519,7 +1977,7 @@ def process_kpi_csv_data(csv_file) -> Dict[str, Any]:
         return {
             "status": "success",
             "file_info": csv_file.name,
-            "period_analyzed": f"{len(daily_kpis)} days",
+            "period_analyzed": f"{len(kpi_df)} days",
             "summary": {
                 "total_sales": f"${total_sales:,.2f}",
                 "avg_labor_percent": f"{avg_labor_percent:.1f}%",
@@ -1528,93 +1986,233 @@ def process_kpi_csv_data(csv_file) -> Dict[str, Any]:
                 "avg_sales_per_hour": f"${avg_sales_per_hour:.2f}",
                 "trend": trend,
             },
-            "daily_kpis": daily_kpis[:30],  # Show last 30 days
+            "daily_kpis": kpi_df.head(30).to_dict("records"),  # Show last 30 days
             "recommendations": recommendations,
             "ai_analysis": ai_analysis,
         }
 
-    except Exception as e:
-        return {
-            "status": "error",
-            "message": f"CSV processing error: {str(e)}",
-            "help": "Please ensure your CSV has columns: date, sales, labor_cost, food_cost, labor_hours",
-        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"CSV processing error: {str(e)}",
+            "help": "Please ensure your CSV has columns: date, sales, labor_cost, food_cost, labor_hours",
+        }
+
+
+def _kpi_recommendation(template, excess):
+    """Copy one recommendation template, filling its impact with the excess over the threshold where it has a format."""
+    recommendation, impact = template
+    recommendation = recommendation.copy()
+    if impact is not None:
+        recommendation["impact"] = impact.format(excess)
+    return recommendation
+
+
+def generate_kpi_recommendations(labor_percent, food_percent, prime_percent, sales_per_hour):
+    """Generate actionable recommendations based on KPI analysis"""
+    triggered = (labor_percent > 30, food_percent > 32, sales_per_hour < 50, prime_percent > 60)
+    excesses = ((labor_percent - 30) * 1000, (food_percent - 32) * 1000, 0.0, 0.0)
+    recommendations = [
+        _kpi_recommendation(template, excess)
+        for template, hit, excess in zip(_KPI_REC_TEMPLATES, triggered, excesses)
+        if hit
+    ]
+
+    if not recommendations:
+        recommendations.append(_kpi_recommendation(_KPI_REC_ON_TARGET, 0.0))
+
+    return recommendations
+
+
+def _as_float_columns(*columns, dtype=np.float64):
+    """
+    Convert batch inputs to equal-length, one-dimensional float columns of the given dtype.
+
+    Scalars broadcast against the array inputs, so a shared value such as a target
+    percentage can be passed once for every row.
+
+    Raises:
+        ValueError: If an input is not numeric or the array lengths differ
+    """
+    try:
+        arrays = [np.asarray(column, dtype=dtype) for column in columns]
+    except (TypeError, ValueError):
+        raise ValueError("KPI inputs must contain only numbers")
+    try:
+        return [np.atleast_1d(array).copy() for array in np.broadcast_arrays(*arrays)]
+    except ValueError:
+        raise ValueError("KPI inputs must be single values or arrays of the same length")
+
+
+def generate_kpi_recommendations_batch(labor_percent, food_percent, prime_percent, sales_per_hour):
+    """
+    Generate KPI recommendations for many stores or days in one vectorized pass
+
+    Thresholds are compared as whole arrays and recommendation dicts are only built for the
+    rows that trigger them.
+
+    Args:
+        labor_percent, food_percent, prime_percent, sales_per_hour: Array-likes with one value
+            per row, or single values shared by every row
+
+    Returns:
+        list: One recommendation list per row, as generate_kpi_recommendations returns
+
+    Raises:
+        ValueError: If an input is not numeric or the array lengths differ
+    """
+    labor_percent, food_percent, prime_percent, sales_per_hour = _as_float_columns(
+        labor_percent, food_percent, prime_percent, sales_per_hour
+    )
+
+    zeros = np.zeros_like(labor_percent)
+    masks = np.stack([labor_percent > 30, food_percent > 32, sales_per_hour < 50, prime_percent > 60])
+    excesses = np.stack([(labor_percent - 30) * 1000, (food_percent - 32) * 1000, zeros, zeros])
+
+    batch = [[] for _ in range(labor_percent.shape[0])]
+    for template, mask, excess in zip(_KPI_REC_TEMPLATES, masks, excesses):
+        excess = excess.tolist()
+        for i in np.flatnonzero(mask).tolist():
+            batch[i].append(_kpi_recommendation(template, excess[i]))
+    for i in np.flatnonzero(~masks.any(axis=0)).tolist():
+        batch[i].append(_kpi_recommendation(_KPI_REC_ON_TARGET, 0.0))
+
+    return batch
+
+
+def calculate_labor_cost_analysis_batch(total_sales, labor_cost, hours_worked, target_labor_percent=30.0, dtype=np.float64):
+    """
+    Calculate labor cost metrics for many stores or periods in one vectorized pass.
+
+    Mirrors the key metrics, productivity figures and performance fields of
+    calculate_labor_cost_analysis, one array per field, without overtime and cover
+    tracking, recommendations or reports.
+
+    Args:
+        total_sales, labor_cost, hours_worked: Array-likes with one positive value per row
+        target_labor_percent: Array-like or single value
+        dtype: np.float64, or np.float32 to halve the memory traffic of very large batches;
+            single precision can rate rows that sit exactly on a threshold differently
+
+    Returns:
+        Dictionary of per-row arrays, unrounded
+
+    Raises:
+        ValueError: If an input is not a positive number or the array lengths differ
+    """
+    total_sales, labor_cost, hours_worked, target_labor_percent = _as_float_columns(
+        total_sales, labor_cost, hours_worked, target_labor_percent, dtype=dtype
+    )
+    if not ((total_sales > 0).all() and (labor_cost > 0).all() and (hours_worked > 0).all()):
+        raise ValueError("All inputs must be positive numbers")
+
+    (
+        labor_percent,
+        sales_per_labor_hour,
+        cost_per_labor_hour,
+        productivity_score,
+        labor_efficiency_ratio,
+        potential_savings,
+        vs_target,
+        band,
+    ) = labor_cost_arrays(total_sales, labor_cost, hours_worked, target_labor_percent, _LABOR_PERCENT_BANDS)
+
+    return {
+        "labor_percent": labor_percent,
+        "sales_per_labor_hour": sales_per_labor_hour,
+        "cost_per_labor_hour": cost_per_labor_hour,
+        "productivity_score": productivity_score,
+        "labor_efficiency_ratio": labor_efficiency_ratio,
+        "potential_savings": potential_savings,
+        "vs_target": vs_target,
+        "rating": _RATING_LABELS_NP[band],
+        "color": _RATING_COLORS_NP[band],
+    }
 
 
-def generate_kpi_recommendations(labor_percent, food_percent, prime_percent, sales_per_hour):
-    """Generate actionable recommendations based on KPI analysis"""
-    recommendations = []
+def calculate_food_cost_analysis_batch(total_sales, food_cost, target_food_percent=30.0, dtype=np.float64):
+    """
+    Calculate food cost metrics for many stores or periods in one vectorized pass.
 
-    if labor_percent > 30:
-        recommendations.append(
-            {
-                "category": "Labor Optimization",
-                "priority": "High",
-                "action": "Review staff scheduling and reduce overtime",
-                "impact": f"Could save ${(labor_percent - 30) * 1000:.0f} per $10k in sales",
-            }
-        )
+    Mirrors the key metrics and performance fields of calculate_food_cost_analysis, one
+    array per field, without waste, inventory and menu tracking, recommendations or reports.
 
-    if food_percent > 32:
-        recommendations.append(
-            {
-                "category": "Food Cost Control",
-                "priority": "High",
-                "action": "Audit portion sizes and supplier pricing",
-                "impact": f"Could save ${(food_percent - 32) * 1000:.0f} per $10k in sales",
-            }
-        )
+    Args:
+        total_sales, food_cost: Array-likes with one positive value per row
+        target_food_percent: Array-like or single value
+        dtype: np.float64, or np.float32 to halve the memory traffic of very large batches;
+            single precision can rate rows that sit exactly on a threshold differently
 
-    if sales_per_hour < 50:
-        recommendations.append(
-            {
-                "category": "Sales Performance",
-                "priority": "Medium",
-                "action": "Improve staff training and upselling techniques",
-                "impact": "Could increase revenue by 15-20%",
-            }
-        )
+    Returns:
+        Dictionary of per-row arrays, unrounded
 
-    if prime_percent > 60:
-        recommendations.append(
-            {
-                "category": "Overall Efficiency",
-                "priority": "Critical",
-                "action": "Focus on both labor and food cost optimization",
-                "impact": "Essential for profitability",
-            }
-        )
+    Raises:
+        ValueError: If an input is not a positive number or the array lengths differ
+    """
+    total_sales, food_cost, target_food_percent = _as_float_columns(
+        total_sales, food_cost, target_food_percent, dtype=dtype
+    )
+    if not ((total_sales > 0).all() and (food_cost > 0).all()):
+        raise ValueError("All inputs must be positive numbers")
 
-    if not recommendations:
-        recommendations.append(
-            {
-                "category": "Performance",
-                "priority": "Maintain",
-                "action": "Keep up the excellent work!",
-                "impact": "Your KPIs are within industry standards",
-            }
-        )
+    food_percent, gross_profit, gross_profit_margin, potential_savings, vs_target, band = food_cost_arrays(
+        total_sales, food_cost, target_food_percent, _FOOD_PERCENT_BANDS
+    )
 
-    return recommendations
+    return {
+        "food_percent": food_percent,
+        "gross_profit": gross_profit,
+        "gross_profit_margin": gross_profit_margin,
+        "potential_savings": potential_savings,
+        "vs_target": vs_target,
+        "rating": _RATING_LABELS_NP[band],
+        "color": _RATING_COLORS_NP[band],
+    }
 
 
-def calculate_liquor_cost_analysis(expected_oz, actual_oz, liquor_cost, total_sales, bottle_cost=0.0, bottle_size_oz=25.0, target_cost_percentage=20.0):
+def _is_no_data(*values):
     """
-    Calculate comprehensive liquor cost analysis with business report.
+    True when every primary input of a beverage analysis is a positive float zero.
 
-    Args:
-        expected_oz: Expected liquor usage in ounces
-        actual_oz: Actual liquor usage in ounces
-        liquor_cost: Total liquor cost
-        total_sales: Total sales revenue
-        bottle_cost: Cost per bottle
-        bottle_size_oz: Bottle size in ounces
-        target_cost_percentage: Target liquor cost percentage
+    Ints, negative zero and None fall through to the full analysis, so the shared result
+    always matches what it would have computed for the same arguments.
+    """
+    return all(type(value) is float and value == 0.0 and math.copysign(1.0, value) > 0 for value in values)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_no_data_result(analysis, settings_key, output_formats, report_day):
+    """
+    Memoized all-zero run of a beverage analysis.
+
+    report_day is part of the cache key only, so a cached report never carries a stale
+    generated date. The returned dict is shared between calls and must not be mutated.
+    """
+    return analysis(0.0, 0.0, 0.0, 0.0, *_thaw(settings_key), output_formats)
+
+
+def _no_data_result(analysis, settings, output_formats):
+    """
+    Result of a beverage analysis whose primary inputs are all zero, built once per settings.
+
+    The settings are keyed exactly, with their types, so only calls that would produce the
+    same result share it. Each call gets its own copies of the result's dicts and lists.
+    """
+    try:
+        result = _cached_no_data_result(analysis, _freeze(settings), output_formats, _report_day())
+    except TypeError:
+        return analysis(0.0, 0.0, 0.0, 0.0, *settings, output_formats)
+    return {key: value.copy() if isinstance(value, (dict, list)) else value for key, value in result.items()}
+
+
+def _liquor_core(expected_oz, actual_oz, liquor_cost, total_sales, target_cost_percentage):
+    """
+    Numeric core of the liquor cost analysis, kept free of report building.
 
     Returns:
-        Dictionary with analysis results and business report
+        tuple: (variance_oz, variance_percent, cost_per_oz, liquor_cost_percentage, theoretical_cost,
+        waste_cost, waste_percentage, rating_code, variance_status_code, cost_status_code)
     """
-    # Calculate key metrics
     variance_oz = actual_oz - expected_oz
     variance_percent = (variance_oz / expected_oz * 100) if expected_oz > 0 else 0
 
@@ -1626,15 +2224,78 @@ def calculate_liquor_cost_analysis(expected_oz, actual_oz, liquor_cost, total_sa
     waste_cost = liquor_cost - theoretical_cost
     waste_percentage = (waste_cost / liquor_cost * 100) if liquor_cost > 0 else 0
 
-    # Performance assessment
-    if abs(variance_percent) <= 5 and liquor_cost_percentage <= target_cost_percentage:
-        rating = "Excellent"
-    elif abs(variance_percent) <= 10 and liquor_cost_percentage <= target_cost_percentage + 2:
-        rating = "Good"
-    elif abs(variance_percent) <= 15 and liquor_cost_percentage <= target_cost_percentage + 5:
-        rating = "Acceptable"
+    # Performance assessment, as indexes into the label tuples
+    # Each band test is evaluated once and shared by the rating and the status codes
+    abs_variance = abs(variance_percent)
+    variance_within_5 = abs_variance <= 5
+    variance_within_10 = abs_variance <= 10
+    cost_on_target = liquor_cost_percentage <= target_cost_percentage
+    cost_within_2 = liquor_cost_percentage <= target_cost_percentage + 2
+    if variance_within_5 and cost_on_target:
+        rating_code = 0
+    elif variance_within_10 and cost_within_2:
+        rating_code = 1
+    elif abs_variance <= 15 and liquor_cost_percentage <= target_cost_percentage + 5:
+        rating_code = 2
     else:
-        rating = "Needs Improvement"
+        rating_code = 3
+    variance_status_code = 0 if variance_within_5 else 1 if variance_within_10 else 2
+    cost_status_code = 0 if cost_on_target else 1 if cost_within_2 else 2
+
+    return (
+        variance_oz,
+        variance_percent,
+        cost_per_oz,
+        liquor_cost_percentage,
+        theoretical_cost,
+        waste_cost,
+        waste_percentage,
+        rating_code,
+        variance_status_code,
+        cost_status_code,
+    )
+
+
+def calculate_liquor_cost_analysis(expected_oz, actual_oz, liquor_cost, total_sales, bottle_cost=0.0, bottle_size_oz=25.0, target_cost_percentage=20.0, output_formats=_REPORT_FORMATS):
+    """
+    Calculate comprehensive liquor cost analysis with business report.
+
+    Args:
+        expected_oz: Expected liquor usage in ounces
+        actual_oz: Actual liquor usage in ounces
+        liquor_cost: Total liquor cost
+        total_sales: Total sales revenue
+        bottle_cost: Cost per bottle
+        bottle_size_oz: Bottle size in ounces
+        target_cost_percentage: Target liquor cost percentage
+        output_formats: Report formats to render, "text" and/or "html"; the formatted insight
+            figures are only built when at least one is requested
+
+    Returns:
+        Dictionary with analysis results and business report
+    """
+    # "No data yet" calls, common for empty tenants, skip straight to the shared result
+    if _is_no_data(expected_oz, actual_oz, liquor_cost, total_sales):
+        return _no_data_result(_liquor_cost_analysis, (bottle_cost, bottle_size_oz, target_cost_percentage), output_formats)
+    return _liquor_cost_analysis(expected_oz, actual_oz, liquor_cost, total_sales, bottle_cost, bottle_size_oz, target_cost_percentage, output_formats)
+
+
+def _liquor_cost_analysis(expected_oz, actual_oz, liquor_cost, total_sales, bottle_cost=0.0, bottle_size_oz=25.0, target_cost_percentage=20.0, output_formats=_REPORT_FORMATS):
+    """Full liquor cost analysis behind calculate_liquor_cost_analysis."""
+    # Calculate key metrics and performance assessment
+    (
+        variance_oz,
+        variance_percent,
+        cost_per_oz,
+        liquor_cost_percentage,
+        theoretical_cost,
+        waste_cost,
+        waste_percentage,
+        rating_code,
+        variance_status_code,
+        cost_status_code,
+    ) = _liquor_core(expected_oz, actual_oz, liquor_cost, total_sales, target_cost_percentage)
+    rating = _RATING_LABELS[rating_code]
 
     # Metrics dictionary
     metrics = {
@@ -1652,32 +2313,40 @@ def calculate_liquor_cost_analysis(expected_oz, actual_oz, liquor_cost, total_sa
     # Performance dictionary
     performance = {
         "rating": rating,
-        "variance_status": "Within Target" if abs(variance_percent) <= 5 else "Needs Attention" if abs(variance_percent) <= 10 else "Critical",
-        "cost_status": "Optimal" if liquor_cost_percentage <= target_cost_percentage else "High" if liquor_cost_percentage <= target_cost_percentage + 2 else "Critical"
+        "variance_status": _VARIANCE_STATUS_LABELS[variance_status_code],
+        "cost_status": _COST_STATUS_LABELS[cost_status_code]
     }
 
     # Generate recommendations
     recommendations = []
 
-    if abs(variance_percent) > 10:
-        recommendations.append("Implement daily liquor inventory tracking to reduce variance")
-        recommendations.append("Train staff on proper pouring techniques and portion control")
+    if variance_status_code == 2:  # more than 10% variance either way
+        recommendations.extend((
+            "Implement daily liquor inventory tracking to reduce variance",
+            "Train staff on proper pouring techniques and portion control",
+        ))
 
     if liquor_cost_percentage > target_cost_percentage:
         recommendations.append(f"Review supplier pricing - target cost percentage is {target_cost_percentage}%")
         recommendations.append("Consider negotiating bulk purchase discounts")
 
     if waste_percentage > 5:
-        recommendations.append("Investigate waste sources - implement waste tracking system")
-        recommendations.append("Review storage and handling procedures")
+        recommendations.extend((
+            "Investigate waste sources - implement waste tracking system",
+            "Review storage and handling procedures",
+        ))
 
     if variance_percent < -10:
-        recommendations.append("Check for potential theft or unauthorized usage")
-        recommendations.append("Verify inventory counting procedures")
+        recommendations.extend((
+            "Check for potential theft or unauthorized usage",
+            "Verify inventory counting procedures",
+        ))
 
     if not recommendations:
-        recommendations.append("Maintain current liquor cost management practices")
-        recommendations.append("Continue monitoring variance trends")
+        recommendations.extend((
+            "Maintain current liquor cost management practices",
+            "Continue monitoring variance trends",
+        ))
 
     # Industry benchmarks
     benchmarks = {
@@ -1686,32 +2355,36 @@ def calculate_liquor_cost_analysis(expected_oz, actual_oz, liquor_cost, total_sa
         "industry_average_cost_percentage": "18-22%"
     }
 
-    # Additional insights
-    additional_data = {
-        "cost_efficiency": {
-            "theoretical_cost": f"${theoretical_cost:.2f}",
-            "actual_cost": f"${liquor_cost:.2f}",
-            "efficiency_ratio": f"{(theoretical_cost/liquor_cost*100):.1f}%" if liquor_cost > 0 else "N/A"
-        },
-        "waste_analysis": {
-            "waste_cost": f"${waste_cost:.2f}",
-            "waste_percentage": f"{waste_percentage:.1f}%",
-            "monthly_waste_impact": f"${waste_cost * 30:.2f}"
+    # The formatted insight figures only appear in the rendered report, so skip them without one
+    business_report_html = business_report = None
+    if output_formats:
+        # Additional insights
+        additional_data = {
+            "cost_efficiency": {
+                "theoretical_cost": f"${theoretical_cost:.2f}",
+                "actual_cost": f"${liquor_cost:.2f}",
+                "efficiency_ratio": f"{(theoretical_cost/liquor_cost*100):.1f}%" if liquor_cost > 0 else "N/A"
+            },
+            "waste_analysis": {
+                "waste_cost": f"${waste_cost:.2f}",
+                "waste_percentage": f"{waste_percentage:.1f}%",
+                "monthly_waste_impact": f"${waste_cost * 30:.2f}"
+            }
         }
-    }
 
-    # Generate business report
-    business_report_result = format_business_report(
-        "Liquor Cost Analysis",
-        metrics,
-        performance,
-        recommendations,
-        benchmarks,
-        additional_data
-    )
+        # Generate business report
+        business_report_result = format_business_report(
+            "Liquor Cost Analysis",
+            metrics,
+            performance,
+            recommendations,
+            benchmarks,
+            additional_data,
+            output_formats=output_formats
+        )
 
-    business_report_html = business_report_result.get("business_report_html", "")
-    business_report = business_report_result.get("business_report", "")
+        business_report_html = business_report_result.get("business_report_html", "")
+        business_report = business_report_result.get("business_report", "")
 
     return {
         "metrics": metrics,
@@ -1723,26 +2396,16 @@ def calculate_liquor_cost_analysis(expected_oz, actual_oz, liquor_cost, total_sa
     }
 
 
-def calculate_inventory_analysis(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days=7.0, safety_stock=0.0, item_cost=0.0, target_turnover=12.0):
+def _inventory_core(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days, safety_stock, target_turnover):
     """
-    Calculate comprehensive inventory analysis with business report.
-
-    Args:
-        current_stock: Current inventory level
-        reorder_point: Reorder point level
-        monthly_usage: Monthly usage rate
-        inventory_value: Total inventory value
-        lead_time_days: Lead time in days
-        safety_stock: Safety stock level
-        item_cost: Cost per item
-        target_turnover: Target inventory turnover rate
+    Numeric core of the inventory analysis, kept free of report building.
 
     Returns:
-        Dictionary with analysis results and business report
+        tuple: (days_of_stock, optimal_reorder_point, turnover_rate, annual_carrying_cost,
+        rating_code, stock_status_code, turnover_status_code)
     """
-    # Calculate key metrics
     days_of_stock = (current_stock / monthly_usage * 30) if monthly_usage > 0 else 0
-    reorder_status = "Order Now" if current_stock <= reorder_point else "Adequate Stock"
+    stock_status_code = 0 if current_stock <= reorder_point else 1
 
     # Calculate optimal reorder point
     daily_usage = monthly_usage / 30
@@ -1756,15 +2419,66 @@ def calculate_inventory_analysis(current_stock, reorder_point, monthly_usage, in
     carrying_cost_percentage = 25.0  # Industry standard
     annual_carrying_cost = inventory_value * (carrying_cost_percentage / 100)
 
-    # Performance assessment
+    # Performance assessment, as indexes into the label tuples
     if turnover_rate >= target_turnover and current_stock > reorder_point:
-        rating = "Excellent"
+        rating_code = 0
     elif turnover_rate >= target_turnover * 0.8 and current_stock > reorder_point * 0.8:
-        rating = "Good"
+        rating_code = 1
     elif turnover_rate >= target_turnover * 0.6 and current_stock > reorder_point * 0.6:
-        rating = "Acceptable"
+        rating_code = 2
     else:
-        rating = "Needs Improvement"
+        rating_code = 3
+    turnover_status_code = 0 if turnover_rate >= target_turnover else 1 if turnover_rate >= target_turnover * 0.8 else 2
+
+    return (
+        days_of_stock,
+        optimal_reorder_point,
+        turnover_rate,
+        annual_carrying_cost,
+        rating_code,
+        stock_status_code,
+        turnover_status_code,
+    )
+
+
+def calculate_inventory_analysis(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days=7.0, safety_stock=0.0, item_cost=0.0, target_turnover=12.0, output_formats=_REPORT_FORMATS):
+    """
+    Calculate comprehensive inventory analysis with business report.
+
+    Args:
+        current_stock: Current inventory level
+        reorder_point: Reorder point level
+        monthly_usage: Monthly usage rate
+        inventory_value: Total inventory value
+        lead_time_days: Lead time in days
+        safety_stock: Safety stock level
+        item_cost: Cost per item
+        target_turnover: Target inventory turnover rate
+        output_formats: Report formats to render, "text" and/or "html"; the formatted insight
+            figures are only built when at least one is requested
+
+    Returns:
+        Dictionary with analysis results and business report
+    """
+    # "No data yet" calls, common for empty tenants, skip straight to the shared result
+    if _is_no_data(current_stock, reorder_point, monthly_usage, inventory_value):
+        return _no_data_result(_inventory_analysis, (lead_time_days, safety_stock, item_cost, target_turnover), output_formats)
+    return _inventory_analysis(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days, safety_stock, item_cost, target_turnover, output_formats)
+
+
+def _inventory_analysis(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days=7.0, safety_stock=0.0, item_cost=0.0, target_turnover=12.0, output_formats=_REPORT_FORMATS):
+    """Full inventory analysis behind calculate_inventory_analysis."""
+    # Calculate key metrics and performance assessment
+    (
+        days_of_stock,
+        optimal_reorder_point,
+        turnover_rate,
+        annual_carrying_cost,
+        rating_code,
+        stock_status_code,
+        turnover_status_code,
+    ) = _inventory_core(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days, safety_stock, target_turnover)
+    rating = _RATING_LABELS[rating_code]
 
     # Metrics dictionary
     metrics = {
@@ -1781,32 +2495,40 @@ def calculate_inventory_analysis(current_stock, reorder_point, monthly_usage, in
     # Performance dictionary
     performance = {
         "rating": rating,
-        "stock_status": reorder_status,
-        "turnover_status": "Optimal" if turnover_rate >= target_turnover else "Low" if turnover_rate >= target_turnover * 0.8 else "Critical"
+        "stock_status": _STOCK_STATUS_LABELS[stock_status_code],
+        "turnover_status": _LEVEL_STATUS_LABELS[turnover_status_code]
     }
 
     # Generate recommendations
     recommendations = []
 
     if current_stock <= reorder_point:
-        recommendations.append("Place immediate reorder to avoid stockout")
-        recommendations.append("Consider increasing safety stock levels")
+        recommendations.extend((
+            "Place immediate reorder to avoid stockout",
+            "Consider increasing safety stock levels",
+        ))
 
     if turnover_rate < target_turnover * 0.8:
-        recommendations.append("Review slow-moving inventory and consider promotions")
-        recommendations.append("Optimize reorder quantities to reduce carrying costs")
+        recommendations.extend((
+            "Review slow-moving inventory and consider promotions",
+            "Optimize reorder quantities to reduce carrying costs",
+        ))
 
     if days_of_stock > 45:
-        recommendations.append("Reduce order quantities to improve cash flow")
-        recommendations.append("Implement just-in-time inventory management")
+        recommendations.extend((
+            "Reduce order quantities to improve cash flow",
+            "Implement just-in-time inventory management",
+        ))
 
     if abs(optimal_reorder_point - reorder_point) > reorder_point * 0.2:
         recommendations.append(f"Update reorder point to {optimal_reorder_point:.0f} units")
         recommendations.append("Review lead time assumptions with suppliers")
 
     if not recommendations:
-        recommendations.append("Maintain current inventory management practices")
-        recommendations.append("Continue monitoring turnover trends")
+        recommendations.extend((
+            "Maintain current inventory management practices",
+            "Continue monitoring turnover trends",
+        ))
 
     # Industry benchmarks
     benchmarks = {
@@ -1815,32 +2537,36 @@ def calculate_inventory_analysis(current_stock, reorder_point, monthly_usage, in
         "industry_carrying_cost": "20-30%"
     }
 
-    # Additional insights
-    additional_data = {
-        "efficiency_metrics": {
-            "stockout_risk": "Low" if current_stock > reorder_point * 1.5 else "Medium" if current_stock > reorder_point else "High",
-            "cash_flow_impact": f"${inventory_value * 0.25:.2f} annual carrying cost",
-            "reorder_frequency": f"{30/days_of_stock:.1f} times per month" if days_of_stock > 0 else "N/A"
-        },
-        "optimization_potential": {
-            "potential_savings": f"${annual_carrying_cost * 0.2:.2f}",
-            "improvement_area": "Turnover Rate" if turnover_rate < target_turnover else "Carrying Cost",
-            "next_review_date": "30 days"
+    # The formatted insight figures only appear in the rendered report, so skip them without one
+    business_report_html = business_report = None
+    if output_formats:
+        # Additional insights
+        additional_data = {
+            "efficiency_metrics": {
+                "stockout_risk": "Low" if current_stock > reorder_point * 1.5 else "Medium" if current_stock > reorder_point else "High",
+                "cash_flow_impact": f"${inventory_value * 0.25:.2f} annual carrying cost",
+                "reorder_frequency": f"{30/days_of_stock:.1f} times per month" if days_of_stock > 0 else "N/A"
+            },
+            "optimization_potential": {
+                "potential_savings": f"${annual_carrying_cost * 0.2:.2f}",
+                "improvement_area": "Turnover Rate" if turnover_rate < target_turnover else "Carrying Cost",
+                "next_review_date": "30 days"
+            }
         }
-    }
 
-    # Generate business report
-    business_report_result = format_business_report(
-        "Bar Inventory Analysis",
-        metrics,
-        performance,
-        recommendations,
-        benchmarks,
-        additional_data
-    )
+        # Generate business report
+        business_report_result = format_business_report(
+            "Bar Inventory Analysis",
+            metrics,
+            performance,
+            recommendations,
+            benchmarks,
+            additional_data,
+            output_formats=output_formats
+        )
 
-    business_report_html = business_report_result.get("business_report_html", "")
-    business_report = business_report_result.get("business_report", "")
+        business_report_html = business_report_result.get("business_report_html", "")
+        business_report = business_report_result.get("business_report", "")
 
     return {
         "metrics": metrics,
@@ -1852,23 +2578,14 @@ def calculate_inventory_analysis(current_stock, reorder_point, monthly_usage, in
     }
 
 
-def calculate_pricing_analysis(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin=75.0, market_position="premium", elasticity_factor=1.5):
+def _pricing_core(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin, elasticity_factor):
     """
-    Calculate comprehensive pricing analysis with business report.
-
-    Args:
-        drink_price: Current drink price
-        cost_per_drink: Cost per drink
-        sales_volume: Monthly sales volume
-        competitor_price: Competitor's price
-        target_margin: Target margin percentage
-        market_position: Market position (premium, standard, value)
-        elasticity_factor: Price elasticity factor
+    Numeric core of the beverage pricing analysis, kept free of report building.
 
     Returns:
-        Dictionary with analysis results and business report
+        tuple: (current_margin, margin_difference, optimal_price, price_vs_competitor, current_revenue,
+        optimal_revenue, elasticity_revenue, rating_code, margin_status_code, competitive_status_code)
     """
-    # Calculate key metrics
     current_margin = ((drink_price - cost_per_drink) / drink_price * 100) if drink_price > 0 else 0
     margin_difference = current_margin - target_margin
 
@@ -1888,15 +2605,77 @@ def calculate_pricing_analysis(drink_price, cost_per_drink, sales_volume, compet
     new_volume = sales_volume * (1 + volume_change_percent / 100)
     elasticity_revenue = optimal_price * new_volume
 
-    # Performance assessment
-    if current_margin >= target_margin and abs(price_vs_competitor) <= 10:
-        rating = "Excellent"
-    elif current_margin >= target_margin * 0.9 and abs(price_vs_competitor) <= 20:
-        rating = "Good"
-    elif current_margin >= target_margin * 0.8 and abs(price_vs_competitor) <= 30:
-        rating = "Acceptable"
+    # Performance assessment, as indexes into the label tuples
+    # Each band test is evaluated once and shared by the rating and the status codes
+    abs_price_gap = abs(price_vs_competitor)
+    gap_within_10 = abs_price_gap <= 10
+    margin_on_target = current_margin >= target_margin
+    margin_within_80 = current_margin >= target_margin * 0.8
+    if margin_on_target and gap_within_10:
+        rating_code = 0
+    elif current_margin >= target_margin * 0.9 and abs_price_gap <= 20:
+        rating_code = 1
+    elif margin_within_80 and abs_price_gap <= 30:
+        rating_code = 2
     else:
-        rating = "Needs Improvement"
+        rating_code = 3
+    margin_status_code = 0 if margin_on_target else 1 if margin_within_80 else 2
+    competitive_status_code = 0 if gap_within_10 else 1 if price_vs_competitor > 10 else 2
+
+    return (
+        current_margin,
+        margin_difference,
+        optimal_price,
+        price_vs_competitor,
+        current_revenue,
+        optimal_revenue,
+        elasticity_revenue,
+        rating_code,
+        margin_status_code,
+        competitive_status_code,
+    )
+
+
+def calculate_pricing_analysis(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin=75.0, market_position="premium", elasticity_factor=1.5, output_formats=_REPORT_FORMATS):
+    """
+    Calculate comprehensive pricing analysis with business report.
+
+    Args:
+        drink_price: Current drink price
+        cost_per_drink: Cost per drink
+        sales_volume: Monthly sales volume
+        competitor_price: Competitor's price
+        target_margin: Target margin percentage
+        market_position: Market position (premium, standard, value)
+        elasticity_factor: Price elasticity factor
+        output_formats: Report formats to render, "text" and/or "html"; the formatted insight
+            figures are only built when at least one is requested
+
+    Returns:
+        Dictionary with analysis results and business report
+    """
+    # "No data yet" calls, common for empty tenants, skip straight to the shared result
+    if _is_no_data(drink_price, cost_per_drink, sales_volume, competitor_price):
+        return _no_data_result(_pricing_analysis, (target_margin, market_position, elasticity_factor), output_formats)
+    return _pricing_analysis(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin, market_position, elasticity_factor, output_formats)
+
+
+def _pricing_analysis(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin=75.0, market_position="premium", elasticity_factor=1.5, output_formats=_REPORT_FORMATS):
+    """Full pricing analysis behind calculate_pricing_analysis."""
+    # Calculate key metrics and performance assessment
+    (
+        current_margin,
+        margin_difference,
+        optimal_price,
+        price_vs_competitor,
+        current_revenue,
+        optimal_revenue,
+        elasticity_revenue,
+        rating_code,
+        margin_status_code,
+        competitive_status_code,
+    ) = _pricing_core(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin, elasticity_factor)
+    rating = _RATING_LABELS[rating_code]
 
     # Metrics dictionary
     metrics = {
@@ -1917,8 +2696,8 @@ def calculate_pricing_analysis(drink_price, cost_per_drink, sales_volume, compet
     # Performance dictionary
     performance = {
         "rating": rating,
-        "margin_status": "Optimal" if current_margin >= target_margin else "Low" if current_margin >= target_margin * 0.8 else "Critical",
-        "competitive_status": "Competitive" if abs(price_vs_competitor) <= 10 else "Premium" if price_vs_competitor > 10 else "Value"
+        "margin_status": _LEVEL_STATUS_LABELS[margin_status_code],
+        "competitive_status": _COMPETITIVE_STATUS_LABELS[competitive_status_code]
     }
 
     # Generate recommendations
@@ -1929,24 +2708,34 @@ def calculate_pricing_analysis(drink_price, cost_per_drink, sales_volume, compet
         recommendations.append("Review cost structure and supplier negotiations")
 
     if price_vs_competitor > 20:
-        recommendations.append("Consider price reduction to remain competitive")
-        recommendations.append("Focus on value proposition and quality differentiation")
+        recommendations.extend((
+            "Consider price reduction to remain competitive",
+            "Focus on value proposition and quality differentiation",
+        ))
 
     if price_vs_competitor < -20:
-        recommendations.append("Opportunity to increase prices while maintaining competitive advantage")
-        recommendations.append("Invest in marketing to justify premium positioning")
+        recommendations.extend((
+            "Opportunity to increase prices while maintaining competitive advantage",
+            "Invest in marketing to justify premium positioning",
+        ))
 
     if elasticity_revenue > current_revenue * 1.1:
-        recommendations.append("Price optimization could increase revenue by 10%+")
-        recommendations.append("Test price changes in small increments")
+        recommendations.extend((
+            "Price optimization could increase revenue by 10%+",
+            "Test price changes in small increments",
+        ))
 
     if market_position == "premium" and price_vs_competitor < 0:
-        recommendations.append("Align pricing with premium market positioning")
-        recommendations.append("Enhance product presentation and service quality")
+        recommendations.extend((
+            "Align pricing with premium market positioning",
+            "Enhance product presentation and service quality",
+        ))
 
     if not recommendations:
-        recommendations.append("Maintain current pricing strategy")
-        recommendations.append("Continue monitoring competitive landscape")
+        recommendations.extend((
+            "Maintain current pricing strategy",
+            "Continue monitoring competitive landscape",
+        ))
 
     # Industry benchmarks
     benchmarks = {
@@ -1955,32 +2744,36 @@ def calculate_pricing_analysis(drink_price, cost_per_drink, sales_volume, compet
         "competitive_tolerance": "±10%"
     }
 
-    # Additional insights
-    additional_data = {
-        "pricing_strategy": {
-            "market_position": market_position.title(),
-            "elasticity_factor": elasticity_factor,
-            "recommended_action": "Maintain" if rating == "Excellent" else "Optimize" if rating == "Good" else "Review"
-        },
-        "revenue_optimization": {
-            "current_monthly_revenue": f"${current_revenue:,.2f}",
-            "potential_increase": f"${max(optimal_revenue, elasticity_revenue) - current_revenue:,.2f}",
-            "roi_timeline": "Immediate"
+    # The formatted insight figures only appear in the rendered report, so skip them without one
+    business_report_html = business_report = None
+    if output_formats:
+        # Additional insights
+        additional_data = {
+            "pricing_strategy": {
+                "market_position": market_position.title(),
+                "elasticity_factor": elasticity_factor,
+                "recommended_action": "Maintain" if rating == "Excellent" else "Optimize" if rating == "Good" else "Review"
+            },
+            "revenue_optimization": {
+                "current_monthly_revenue": f"${current_revenue:,.2f}",
+                "potential_increase": f"${max(optimal_revenue, elasticity_revenue) - current_revenue:,.2f}",
+                "roi_timeline": "Immediate"
+            }
         }
-    }
 
-    # Generate business report
-    business_report_result = format_business_report(
-        "Beverage Pricing Analysis",
-        metrics,
-        performance,
-        recommendations,
-        benchmarks,
-        additional_data
-    )
+        # Generate business report
+        business_report_result = format_business_report(
+            "Beverage Pricing Analysis",
+            metrics,
+            performance,
+            recommendations,
+            benchmarks,
+            additional_data,
+            output_formats=output_formats
+        )
 
-    business_report_html = business_report_result.get("business_report_html", "")
-    business_report = business_report_result.get("business_report", "")
+        business_report_html = business_report_result.get("business_report_html", "")
+        business_report = business_report_result.get("business_report", "")
 
     return {
         "metrics": metrics,
@@ -1990,3 +2783,341 @@ def calculate_pricing_analysis(drink_price, cost_per_drink, sales_volume, compet
         "business_report_html": business_report_html,
         "business_report": business_report
     }
+
+
+class LiquorCostFigures(NamedTuple):
+    """Liquor cost metrics and performance for one item; lighter than the report dicts for callers processing many items"""
+
+    expected_oz: float
+    actual_oz: float
+    variance_oz: float
+    variance_percent: float
+    liquor_cost: float
+    cost_per_oz: float
+    liquor_cost_percentage: float
+    waste_cost: float
+    waste_percentage: float
+    rating: str
+    variance_status: str
+    cost_status: str
+
+
+class InventoryFigures(NamedTuple):
+    """Inventory metrics and performance for one item; lighter than the report dicts for callers processing many items"""
+
+    current_stock: float
+    reorder_point: float
+    monthly_usage: float
+    inventory_value: float
+    days_of_stock: float
+    turnover_rate: float
+    optimal_reorder_point: float
+    carrying_cost: float
+    rating: str
+    stock_status: str
+    turnover_status: str
+
+
+class PricingFigures(NamedTuple):
+    """Beverage pricing metrics and performance for one drink; lighter than the report dicts for callers processing many drinks"""
+
+    drink_price: float
+    cost_per_drink: float
+    current_margin: float
+    target_margin: float
+    margin_difference: float
+    optimal_price: float
+    competitor_price: float
+    price_vs_competitor: float
+    sales_volume: float
+    current_revenue: float
+    optimal_revenue: float
+    elasticity_revenue: float
+    rating: str
+    margin_status: str
+    competitive_status: str
+
+
+def calculate_liquor_cost_figures(expected_oz, actual_oz, liquor_cost, total_sales, target_cost_percentage=20.0):
+    """
+    Calculate the liquor cost metrics and performance fields without recommendations or reports.
+
+    Args:
+        expected_oz, actual_oz, liquor_cost, total_sales, target_cost_percentage: As for calculate_liquor_cost_analysis
+
+    Returns:
+        LiquorCostFigures: The same values as the analysis "metrics" and "performance" dicts;
+        use ._asdict() where a mapping is needed
+    """
+    (
+        variance_oz,
+        variance_percent,
+        cost_per_oz,
+        liquor_cost_percentage,
+        _theoretical_cost,
+        waste_cost,
+        waste_percentage,
+        rating_code,
+        variance_status_code,
+        cost_status_code,
+    ) = _liquor_core(expected_oz, actual_oz, liquor_cost, total_sales, target_cost_percentage)
+    return LiquorCostFigures(
+        expected_oz,
+        actual_oz,
+        variance_oz,
+        variance_percent,
+        liquor_cost,
+        cost_per_oz,
+        liquor_cost_percentage,
+        waste_cost,
+        waste_percentage,
+        _RATING_LABELS[rating_code],
+        _VARIANCE_STATUS_LABELS[variance_status_code],
+        _COST_STATUS_LABELS[cost_status_code],
+    )
+
+
+def calculate_inventory_figures(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days=7.0, safety_stock=0.0, target_turnover=12.0):
+    """
+    Calculate the inventory metrics and performance fields without recommendations or reports.
+
+    Args:
+        current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days, safety_stock,
+        target_turnover: As for calculate_inventory_analysis
+
+    Returns:
+        InventoryFigures: The same values as the analysis "metrics" and "performance" dicts;
+        use ._asdict() where a mapping is needed
+    """
+    (
+        days_of_stock,
+        optimal_reorder_point,
+        turnover_rate,
+        annual_carrying_cost,
+        rating_code,
+        stock_status_code,
+        turnover_status_code,
+    ) = _inventory_core(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days, safety_stock, target_turnover)
+    return InventoryFigures(
+        current_stock,
+        reorder_point,
+        monthly_usage,
+        inventory_value,
+        days_of_stock,
+        turnover_rate,
+        optimal_reorder_point,
+        annual_carrying_cost,
+        _RATING_LABELS[rating_code],
+        _STOCK_STATUS_LABELS[stock_status_code],
+        _LEVEL_STATUS_LABELS[turnover_status_code],
+    )
+
+
+def calculate_pricing_figures(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin=75.0, elasticity_factor=1.5):
+    """
+    Calculate the beverage pricing metrics and performance fields without recommendations or reports.
+
+    Args:
+        drink_price, cost_per_drink, sales_volume, competitor_price, target_margin, elasticity_factor:
+            As for calculate_pricing_analysis
+
+    Returns:
+        PricingFigures: The same values as the analysis "metrics" and "performance" dicts;
+        use ._asdict() where a mapping is needed
+    """
+    (
+        current_margin,
+        margin_difference,
+        optimal_price,
+        price_vs_competitor,
+        current_revenue,
+        optimal_revenue,
+        elasticity_revenue,
+        rating_code,
+        margin_status_code,
+        competitive_status_code,
+    ) = _pricing_core(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin, elasticity_factor)
+    return PricingFigures(
+        drink_price,
+        cost_per_drink,
+        current_margin,
+        target_margin,
+        margin_difference,
+        optimal_price,
+        competitor_price,
+        price_vs_competitor,
+        sales_volume,
+        current_revenue,
+        optimal_revenue,
+        elasticity_revenue,
+        _RATING_LABELS[rating_code],
+        _LEVEL_STATUS_LABELS[margin_status_code],
+        _COMPETITIVE_STATUS_LABELS[competitive_status_code],
+    )
+
+
+def calculate_liquor_cost_analysis_batch(expected_oz, actual_oz, liquor_cost, total_sales, target_cost_percentage=20.0, dtype=np.float64):
+    """
+    Calculate liquor cost metrics for many bars or periods in one vectorized pass.
+
+    Mirrors the metrics and performance fields of calculate_liquor_cost_analysis, one
+    array per field, without building per-row recommendations or reports.
+
+    Args:
+        expected_oz, actual_oz, liquor_cost, total_sales: Array-likes with one value per row
+        target_cost_percentage: Array-like or single value
+        dtype: np.float64, or np.float32 to halve the memory traffic of very large batches;
+            single precision can rate rows that sit exactly on a threshold differently
+
+    Returns:
+        Dictionary of per-row arrays
+
+    Raises:
+        ValueError: If an input is not numeric or the array lengths differ
+    """
+    expected_oz, actual_oz, liquor_cost, total_sales, target_cost_percentage = _as_float_columns(
+        expected_oz, actual_oz, liquor_cost, total_sales, target_cost_percentage, dtype=dtype
+    )
+
+    (
+        variance_oz,
+        variance_percent,
+        cost_per_oz,
+        liquor_cost_percentage,
+        waste_cost,
+        waste_percentage,
+        rating_code,
+        variance_status_code,
+        cost_status_code,
+    ) = liquor_cost_arrays(expected_oz, actual_oz, liquor_cost, total_sales, target_cost_percentage)
+
+    return {
+        "expected_oz": expected_oz,
+        "actual_oz": actual_oz,
+        "variance_oz": variance_oz,
+        "variance_percent": variance_percent,
+        "liquor_cost": liquor_cost,
+        "cost_per_oz": cost_per_oz,
+        "liquor_cost_percentage": liquor_cost_percentage,
+        "waste_cost": waste_cost,
+        "waste_percentage": waste_percentage,
+        "rating": _RATING_LABELS_NP[rating_code],
+        "variance_status": _VARIANCE_STATUS_LABELS_NP[variance_status_code],
+        "cost_status": _COST_STATUS_LABELS_NP[cost_status_code],
+    }
+
+
+def calculate_inventory_analysis_batch(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days=7.0, safety_stock=0.0, target_turnover=12.0, dtype=np.float64):
+    """
+    Calculate inventory metrics for many items in one vectorized pass.
+
+    Mirrors the metrics and performance fields of calculate_inventory_analysis, one
+    array per field, without building per-row recommendations or reports.
+
+    Args:
+        current_stock, reorder_point, monthly_usage, inventory_value: Array-likes with one value per item
+        lead_time_days, safety_stock, target_turnover: Array-likes or single values
+        dtype: np.float64, or np.float32 to halve the memory traffic of very large batches;
+            single precision can rate rows that sit exactly on a threshold differently
+
+    Returns:
+        Dictionary of per-item arrays
+
+    Raises:
+        ValueError: If an input is not numeric or the array lengths differ
+    """
+    (
+        current_stock,
+        reorder_point,
+        monthly_usage,
+        inventory_value,
+        lead_time_days,
+        safety_stock,
+        target_turnover,
+    ) = _as_float_columns(
+        current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days, safety_stock, target_turnover, dtype=dtype
+    )
+
+    (
+        days_of_stock,
+        optimal_reorder_point,
+        turnover_rate,
+        annual_carrying_cost,
+        rating_code,
+        stock_status_code,
+        turnover_status_code,
+    ) = inventory_arrays(current_stock, reorder_point, monthly_usage, inventory_value, lead_time_days, safety_stock, target_turnover)
+
+    return {
+        "current_stock": current_stock,
+        "reorder_point": reorder_point,
+        "monthly_usage": monthly_usage,
+        "inventory_value": inventory_value,
+        "days_of_stock": days_of_stock,
+        "turnover_rate": turnover_rate,
+        "optimal_reorder_point": optimal_reorder_point,
+        "carrying_cost": annual_carrying_cost,
+        "rating": _RATING_LABELS_NP[rating_code],
+        "stock_status": _STOCK_STATUS_LABELS_NP[stock_status_code],
+        "turnover_status": _LEVEL_STATUS_LABELS_NP[turnover_status_code],
+    }
+
+
+def calculate_pricing_analysis_batch(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin=75.0, elasticity_factor=1.5, dtype=np.float64):
+    """
+    Calculate beverage pricing metrics for many drinks in one vectorized pass.
+
+    Mirrors the metrics and performance fields of calculate_pricing_analysis, one
+    array per field, without building per-row recommendations or reports.
+
+    Args:
+        drink_price, cost_per_drink, sales_volume, competitor_price: Array-likes with one value per drink
+        target_margin, elasticity_factor: Array-likes or single values
+        dtype: np.float64, or np.float32 to halve the memory traffic of very large batches;
+            single precision can rate rows that sit exactly on a threshold differently
+
+    Returns:
+        Dictionary of per-drink arrays
+
+    Raises:
+        ValueError: If an input is not numeric or the array lengths differ
+    """
+    (
+        drink_price,
+        cost_per_drink,
+        sales_volume,
+        competitor_price,
+        target_margin,
+        elasticity_factor,
+    ) = _as_float_columns(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin, elasticity_factor, dtype=dtype)
+
+    (
+        current_margin,
+        margin_difference,
+        optimal_price,
+        price_vs_competitor,
+        current_revenue,
+        optimal_revenue,
+        elasticity_revenue,
+        rating_code,
+        margin_status_code,
+        competitive_status_code,
+    ) = pricing_arrays(drink_price, cost_per_drink, sales_volume, competitor_price, target_margin, elasticity_factor)
+
+    return {
+        "drink_price": drink_price,
+        "cost_per_drink": cost_per_drink,
+        "current_margin": current_margin,
+        "target_margin": target_margin,
+        "margin_difference": margin_difference,
+        "optimal_price": optimal_price,
+        "competitor_price": competitor_price,
+        "price_vs_competitor": price_vs_competitor,
+        "sales_volume": sales_volume,
+        "current_revenue": current_revenue,
+        "optimal_revenue": optimal_revenue,
+        "elasticity_revenue": elasticity_revenue,
+        "rating": _RATING_LABELS_NP[rating_code],
+        "margin_status": _LEVEL_STATUS_LABELS_NP[margin_status_code],
+        "competitive_status": _COMPETITIVE_STATUS_LABELS_NP[competitive_status_code],
+    }
@@ -3,9 +3,24 @@ Comprehensive Analysis Task
 Analyzes multiple performance metrics with industry benchmarking and detailed reporting.
 """
 
-from backend.shared.utils.common import success_payload, error_payload, require, validate_positive_numbers
+import functools
+from datetime import date
+
+from backend.shared.utils.common import success_payload, error_payload
 from backend.consulting_services.kpi.dashboard_analysis import calculate_comprehensive_analysis
 
+# Accepted inputs and their defaults, in calculate_comprehensive_analysis() argument order
+_CA_FIELDS = (
+    ("total_sales", 0.0),
+    ("labor_cost", 0.0),
+    ("food_cost", 0.0),
+    ("prime_cost", 0.0),
+    ("hours_worked", 0.0),
+    ("hourly_rate", 0.0),
+    ("previous_sales", 0.0),
+    ("target_margin", 70.0),
+)
+
 
 def run(params: dict, file_bytes: bytes | None = None) -> tuple[dict, int]:
     """
@@ -25,49 +40,22 @@ def run(params: dict, file_bytes: bytes | None = None) -> tuple[dict, int]:
         if not any(key in params for key in ["total_sales", "labor_cost", "food_cost", "prime_cost"]):
             return error_payload(service, subtask, "At least one comprehensive analysis metric is required")
 
-        # Extract and convert values with defaults
-        total_sales = float(params.get("total_sales", 0.0))
-        labor_cost = float(params.get("labor_cost", 0.0))
-        food_cost = float(params.get("food_cost", 0.0))
-        prime_cost = float(params.get("prime_cost", 0.0))
-
-        # Optional parameters
-        hours_worked = float(params.get("hours_worked", 0.0))
-        hourly_rate = float(params.get("hourly_rate", 0.0))
-        previous_sales = float(params.get("previous_sales", 0.0))
-        target_margin = float(params.get("target_margin", 70.0))
-
-        # Validate positive numbers
-        try:
-            validate_positive_numbers({
-                "total_sales": total_sales,
-                "labor_cost": labor_cost,
-                "food_cost": food_cost,
-                "prime_cost": prime_cost,
-                "hours_worked": hours_worked,
-                "hourly_rate": hourly_rate,
-                "previous_sales": previous_sales,
-                "target_margin": target_margin
-            }, [
-                "total_sales", "labor_cost", "food_cost", "prime_cost",
-                "hours_worked", "hourly_rate", "previous_sales", "target_margin"
-            ])
-        except ValueError as e:
-            return error_payload(service, subtask, str(e))
-
-        # Call the comprehensive analysis function
-        result = calculate_comprehensive_analysis(
-            total_sales=total_sales,
-            labor_cost=labor_cost,
-            food_cost=food_cost,
-            prime_cost=prime_cost,
-            hours_worked=hours_worked,
-            hourly_rate=hourly_rate,
-            previous_sales=previous_sales,
-            target_margin=target_margin
-        )
-
-        # Extract business reports from result
+        # Extract, convert and validate values with defaults in a single pass
+        values = {}
+        for name, default in _CA_FIELDS:
+            value = float(params.get(name, default))
+            if value < 0:
+                return error_payload(service, subtask, f"{name} must be >= 0")
+            values[name] = value
+
+        # Call the comprehensive analysis function, reusing the report for repeated inputs.
+        # The cache is keyed on the exact floats, so only identical requests share a report.
+        result = _cached_ca(tuple(values.values()), date.today())
+
+        # Extract result fields once, copying the shared cached containers
+        recommendations = list(result.get("recommendations") or [])
+        metrics = dict(result.get("metrics") or {})
+        performance = dict(result.get("performance") or {})
         business_report_html = result.get("business_report_html", "")
         business_report = result.get("business_report", "")
 
@@ -76,11 +64,29 @@ def run(params: dict, file_bytes: bytes | None = None) -> tuple[dict, int]:
                 "analysis_type": "Comprehensive Analysis",
                 "business_report_html": business_report_html,
                 "business_report": business_report,
-                "metrics": result.get("metrics", {}),
-                "performance": result.get("performance", {}),
-                "recommendations": result.get("recommendations", [])
-            }, result.get("recommendations", [])
+                "metrics": metrics,
+                "performance": performance,
+                "recommendations": recommendations
+            }, recommendations
         ), 200
 
     except Exception as e:
         return error_payload(service, subtask, f"Analysis failed: {str(e)}")
+
+
+def _cached_ca(values: tuple[float, ...], report_date: date) -> dict:
+    """
+    calculate_comprehensive_analysis over the exact inputs in _CA_FIELDS order, memoized per report date.
+
+    Returns a copy of the memoized report, so callers may replace its top-level fields freely.
+    """
+    return dict(_ca_report(values, report_date))
+
+
+@functools.lru_cache(maxsize=512)
+def _ca_report(values: tuple[float, ...], report_date: date) -> dict:
+    """
+    Memoized calculate_comprehensive_analysis; report_date is part of the cache key only,
+    so cached reports never carry a stale "generated" date.
+    """
+    return calculate_comprehensive_analysis(*values)
@@ -7,6 +7,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+import numpy as np
+
 
 def success_payload(service: str, subtask: str, params: dict, data: dict, insights: Optional[List[str]] = None) -> Dict[str, Any]:
     """Create a standardized success response payload."""
@@ -41,14 +43,21 @@ def require(body: dict, fields: List[str]) -> None:
 
 def validate_positive_numbers(data: dict, fields: List[str]) -> None:
     """Validate that specified fields contain positive numbers."""
-    for field in fields:
-        if field in data:
-            try:
-                value = float(data[field])
-                if value < 0:
-                    raise ValueError(f"{field} must be >= 0")
-            except (ValueError, TypeError):
-                raise ValueError(f"{field} must be a valid number")
+    names = [field for field in fields if field in data]
+    if not names:
+        return
+
+    values = []
+    for field in names:
+        try:
+            values.append(float(data[field]))
+        except (ValueError, TypeError):
+            raise ValueError(f"{field} must be a valid number")
+
+    # Check every value for sign in one vectorized comparison
+    negative = np.asarray(values) < 0
+    if negative.any():
+        raise ValueError(f"{names[int(negative.argmax())]} must be >= 0")
 
 
 def safe_float(value: Any, field_name: str) -> float:
@@ -57,3 +66,22 @@ def safe_float(value: Any, field_name: str) -> float:
         return float(value)
     except (ValueError, TypeError):
         raise ValueError(f"{field_name} must be a valid number")
+
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "n", "off", ""})
+
+
+def safe_bool(value: Any, field_name: str, default: bool = False) -> bool:
+    """Safely convert a flag to bool, treating strings like "false", "0" and "no" as False and None as the default."""
+    if value is None:
+        return default
+    if isinstance(value, (bool, int, float)):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE_STRINGS:
+            return True
+        if text in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"{field_name} must be true or false")
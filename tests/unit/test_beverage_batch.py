@@ -0,0 +1,147 @@
+"""Tests for the vectorized beverage analyses."""
+
+from __future__ import annotations
+
+import itertools
+from unittest import TestCase
+
+import numpy as np
+
+from backend.consulting_services.kpi.beverage_kernel import NUMBA_MIN_ROWS, _ladder_codes
+from backend.consulting_services.kpi.kpi_utils import (
+    calculate_inventory_analysis,
+    calculate_inventory_analysis_batch,
+    calculate_inventory_figures,
+    calculate_liquor_cost_analysis,
+    calculate_liquor_cost_analysis_batch,
+    calculate_liquor_cost_figures,
+    calculate_pricing_analysis,
+    calculate_pricing_analysis_batch,
+    calculate_pricing_figures,
+)
+
+_REPORT_ONLY = frozenset()
+
+
+class BeverageBatchTests(TestCase):
+    """Each batch row should match the scalar analysis for the same inputs."""
+
+    def assert_rows_match(self, batch, scalars, performance_fields) -> None:
+        for i, (metrics, performance) in enumerate(scalars):
+            for name, value in metrics.items():
+                self.assertAlmostEqual(batch[name][i], value, places=9, msg=f"row {i} {name}")
+            for name in performance_fields:
+                self.assertEqual(batch[name][i], performance[name], msg=f"row {i} {name}")
+
+    def test_liquor_batch_matches_scalar(self) -> None:
+        """Covers zero guards and every rating, variance and cost status."""
+
+        rows = list(itertools.product([0.0, 100.0], [0.0, 95.0, 108.0, 130.0], [0.0, 480.0], [0.0, 1500.0, 2400.0]))
+        batch = calculate_liquor_cost_analysis_batch(*zip(*rows), target_cost_percentage=20.0)
+        scalars = []
+        for row in rows:
+            result = calculate_liquor_cost_analysis(*row, target_cost_percentage=20.0, output_formats=_REPORT_ONLY)
+            scalars.append((result["metrics"], result["performance"]))
+        self.assert_rows_match(batch, scalars, ("rating", "variance_status", "cost_status"))
+
+    def test_inventory_batch_matches_scalar(self) -> None:
+        """Covers zero usage and stock, and both sides of the reorder point."""
+
+        rows = list(itertools.product([0.0, 20.0, 60.0], [0.0, 15.0, 25.0], [0.0, 30.0, 100.0], [1500.0]))
+        batch = calculate_inventory_analysis_batch(*zip(*rows), lead_time_days=7.0, safety_stock=5.0, target_turnover=12.0)
+        scalars = []
+        for row in rows:
+            result = calculate_inventory_analysis(
+                *row, lead_time_days=7.0, safety_stock=5.0, target_turnover=12.0, output_formats=_REPORT_ONLY
+            )
+            scalars.append((result["metrics"], result["performance"]))
+        self.assert_rows_match(batch, scalars, ("rating", "stock_status", "turnover_status"))
+
+    def test_pricing_batch_matches_scalar(self) -> None:
+        """Covers a 100% target margin and every competitive position."""
+
+        rows = list(itertools.product([0.0, 9.5, 12.0], [2.4, 3.0], [400.0], [0.0, 8.0, 10.0, 14.0], [70.0, 75.0, 100.0]))
+        batch = calculate_pricing_analysis_batch(*zip(*rows), elasticity_factor=1.5)
+        scalars = []
+        for drink_price, cost, volume, competitor, margin in rows:
+            result = calculate_pricing_analysis(
+                drink_price, cost, volume, competitor, target_margin=margin, output_formats=_REPORT_ONLY
+            )
+            scalars.append((result["metrics"], result["performance"]))
+        self.assert_rows_match(batch, scalars, ("rating", "margin_status", "competitive_status"))
+
+    def test_bad_input_raises(self) -> None:
+        """Non-numeric values and mismatched lengths raise ValueError."""
+
+        with self.assertRaises(ValueError):
+            calculate_liquor_cost_analysis_batch(["a"], [1.0], [1.0], [1.0])
+        with self.assertRaises(ValueError):
+            calculate_pricing_analysis_batch([1.0, 2.0], [1.0, 2.0, 3.0], 1.0, 1.0)
+
+    def test_ladder_codes_match_select(self) -> None:
+        """The arithmetic ladder picks the first true rung like np.select, for any mask pattern."""
+
+        masks = [np.array(bits, dtype=bool) for bits in zip(*itertools.product([False, True], repeat=3))]
+        expected = np.select(masks, [0, 1, 2], 3)
+        self.assertEqual(_ladder_codes(*masks).tolist(), expected.tolist())
+
+    def test_figures_match_analysis_dicts(self) -> None:
+        """The NamedTuple figures carry the same values as the metrics and performance dicts."""
+
+        liquor = calculate_liquor_cost_analysis(100.0, 108.0, 480.0, 2400.0, output_formats=_REPORT_ONLY)
+        figures = calculate_liquor_cost_figures(100.0, 108.0, 480.0, 2400.0)
+        self.assertEqual(figures._asdict(), {**liquor["metrics"], **liquor["performance"]})
+        inventory = calculate_inventory_analysis(20.0, 25.0, 30.0, 1500.0, safety_stock=5.0)
+        figures = calculate_inventory_figures(20.0, 25.0, 30.0, 1500.0, safety_stock=5.0)
+        self.assertEqual(figures._asdict(), {**inventory["metrics"], **inventory["performance"]})
+        pricing = calculate_pricing_analysis(12.0, 3.0, 400.0, 10.0)
+        figures = calculate_pricing_figures(12.0, 3.0, 400.0, 10.0)
+        self.assertEqual(figures._asdict(), {**pricing["metrics"], **pricing["performance"]})
+
+    def test_no_data_calls_match_the_full_analysis(self) -> None:
+        """All-zero calls take the fast exit yet return the full analysis's result, in fresh dicts."""
+
+        cases = [
+            (calculate_liquor_cost_analysis, {"target_cost_percentage": 22}),
+            (calculate_inventory_analysis, {"target_turnover": 10.0}),
+            (calculate_pricing_analysis, {"market_position": "value"}),
+        ]
+        for analysis, settings in cases:
+            with self.subTest(analysis=analysis.__name__):
+                first = analysis(0.0, 0.0, 0.0, 0.0, **settings)
+                second = analysis(0.0, 0.0, 0.0, 0.0, **settings)
+                self.assertEqual(first, second)
+                self.assertIsNot(first["metrics"], second["metrics"])
+                self.assertIsNot(first["recommendations"], second["recommendations"])
+                # Integer zeros are not taken as no data, and a tiny non-zero input runs the full analysis
+                self.assertEqual(analysis(0, 0, 0, 0, **settings)["performance"], first["performance"])
+                first_input = next(iter(first["metrics"]))
+                self.assertEqual(analysis(1e-9, 0.0, 0.0, 0.0, **settings)["metrics"][first_input], 1e-9)
+
+    def test_large_batches_match_small_batches(self) -> None:
+        """Batches large enough for the compiled kernels give the same figures as the NumPy path."""
+
+        base = list(itertools.product([0.0, 12.0, 100.0], [0.0, 9.5, 108.0, 130.0], [0.0, 2.4, 480.0], [0.0, 14.0, 2400.0]))
+        columns = list(zip(*(base * (NUMBA_MIN_ROWS // len(base) + 1))))
+        small = len(base)
+        for batch_fn, extra in (
+            (calculate_liquor_cost_analysis_batch, (20.0,)),
+            (calculate_inventory_analysis_batch, (7.0, 5.0, 12.0)),
+            (calculate_pricing_analysis_batch, (75.0, 1.5)),
+        ):
+            with self.subTest(batch=batch_fn.__name__):
+                large = batch_fn(*columns, *extra)
+                reference = batch_fn(*(column[:small] for column in columns), *extra)
+                for name, values in reference.items():
+                    self.assertEqual(large[name][:small].tolist(), values.tolist(), msg=name)
+
+    def test_float32_batches_stay_single_precision(self) -> None:
+        """dtype=np.float32 keeps every figure in single precision, large batches included."""
+
+        rows = list(itertools.product([0.0, 9.5, 12.0], [2.4, 3.0], [400.0], [0.0, 8.0, 10.0, 14.0]))
+        columns = list(zip(*(rows * (NUMBA_MIN_ROWS // len(rows) + 1))))
+        single = calculate_pricing_analysis_batch(*columns, dtype=np.float32)
+        double = calculate_pricing_analysis_batch(*columns)
+        self.assertEqual(single["optimal_price"].dtype, np.float32)
+        np.testing.assert_allclose(single["elasticity_revenue"], double["elasticity_revenue"], rtol=1e-5)
+        self.assertEqual(single["rating"][: len(rows)].tolist(), double["rating"][: len(rows)].tolist())
@@ -0,0 +1,77 @@
+"""Tests for the vectorized labor and food cost analyses."""
+
+from __future__ import annotations
+
+from unittest import TestCase
+
+import numpy as np
+
+from backend.consulting_services.kpi.cost_kernel import NUMBA_MIN_ROWS
+from backend.consulting_services.kpi.kpi_utils import (
+    calculate_food_cost_analysis,
+    calculate_food_cost_analysis_batch,
+    calculate_labor_cost_analysis,
+    calculate_labor_cost_analysis_batch,
+)
+
+_REPORT_ONLY = frozenset()
+
+# Cost percents of 20, 25, 28, 30, 33, 35 and 41, so every rating and both band edges are covered
+_SALES = [10000.0, 8000.0, 12500.0, 5000.0, 9000.0, 20000.0, 7000.0]
+_COSTS = [2000.0, 2000.0, 3500.0, 1500.0, 2970.0, 7000.0, 2870.0]
+
+
+class CostBatchTests(TestCase):
+    """Each batch row should match the scalar analysis for the same inputs."""
+
+    def assert_rows_match(self, batch, results, metric_names) -> None:
+        for i, result in enumerate(results):
+            for name in metric_names:
+                self.assertAlmostEqual(batch[name][i], result["key_metrics"][name], places=2, msg=f"row {i} {name}")
+            self.assertEqual(batch["rating"][i], result["performance_rating"], msg=f"row {i}")
+            self.assertEqual(batch["color"][i], result["performance_color"], msg=f"row {i}")
+
+    def test_labor_batch_matches_scalar(self) -> None:
+        """Percent, productivity and rating fields agree row by row."""
+
+        hours = [400.0] * len(_SALES)
+        batch = calculate_labor_cost_analysis_batch(_SALES, _COSTS, hours, target_labor_percent=28.0)
+        results = [
+            calculate_labor_cost_analysis(*row, target_labor_percent=28.0, output_formats=_REPORT_ONLY)
+            for row in zip(_SALES, _COSTS, hours)
+        ]
+        self.assert_rows_match(batch, results, ("labor_percent", "sales_per_labor_hour", "cost_per_labor_hour"))
+        np.testing.assert_allclose(batch["potential_savings"], np.array(_COSTS) - 0.28 * np.array(_SALES))
+
+    def test_food_batch_matches_scalar(self) -> None:
+        """Percent, gross profit and rating fields agree row by row."""
+
+        batch = calculate_food_cost_analysis_batch(_SALES, _COSTS)
+        results = [calculate_food_cost_analysis(*row, output_formats=_REPORT_ONLY) for row in zip(_SALES, _COSTS)]
+        self.assert_rows_match(batch, results, ("food_percent", "gross_profit", "gross_profit_margin"))
+
+    def test_large_batch_matches_small_batch_math(self) -> None:
+        """Batches large enough for the compiled kernels give the same numbers and ratings."""
+
+        repeats = NUMBA_MIN_ROWS // len(_SALES) + 1
+        sales, costs = np.tile(_SALES, repeats), np.tile(_COSTS, repeats)
+        hours = np.full_like(sales, 400.0)
+        small_labor = calculate_labor_cost_analysis_batch(_SALES, _COSTS, 400.0)
+        small_food = calculate_food_cost_analysis_batch(_SALES, _COSTS)
+        for large, small in (
+            (calculate_labor_cost_analysis_batch(sales, costs, hours), small_labor),
+            (calculate_food_cost_analysis_batch(sales, costs), small_food),
+        ):
+            for name, column in small.items():
+                with self.subTest(field=name):
+                    np.testing.assert_array_equal(large[name], np.tile(column, repeats))
+
+    def test_batch_rejects_bad_input(self) -> None:
+        """Non-positive figures and mismatched lengths raise, as the scalar path reports an error."""
+
+        with self.assertRaises(ValueError):
+            calculate_labor_cost_analysis_batch([1000.0, 0.0], [300.0, 300.0], [40.0, 40.0])
+        with self.assertRaises(ValueError):
+            calculate_labor_cost_analysis_batch([1000.0], [300.0], [-1.0])
+        with self.assertRaises(ValueError):
+            calculate_food_cost_analysis_batch([1000.0, 2000.0, 3000.0], [300.0, 600.0])
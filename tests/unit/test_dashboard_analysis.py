@@ -0,0 +1,152 @@
+"""Tests for the KPI dashboard analysis calculations."""
+
+from __future__ import annotations
+
+from itertools import product
+from unittest import TestCase
+from unittest.mock import patch
+
+from backend.consulting_services.kpi.dashboard_analysis import (
+    calculate_comprehensive_analysis,
+    calculate_comprehensive_analysis_batch,
+    calculate_performance_optimization,
+    calculate_performance_optimization_batch,
+)
+
+
+class DashboardBatchTests(TestCase):
+    """The batch entry points should agree with the per-period functions."""
+
+    def test_comprehensive_batch_matches_scalar(self) -> None:
+        """Every metric and status should match row by row, including zero denominators."""
+
+        rows = [
+            (1000.0, 300.0, 280.0, 580.0, 40.0, 15.0, 900.0, 70.0),
+            (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 70.0),
+            (5000.0, 1200.0, 1600.0, 2800.0, 0.0, 0.0, 4000.0, 0.0),
+            (8000.0, 2000.0, 2400.0, 4400.0, 60.0, 18.0, 6500.0, 70.0),
+        ]
+        batch = calculate_comprehensive_analysis_batch(*zip(*rows))
+        for i, row in enumerate(rows):
+            result = calculate_comprehensive_analysis(*row)
+            for name, value in result["metrics"].items():
+                self.assertAlmostEqual(batch[name][i], value, msg=name)
+            for name, value in result["performance"].items():
+                self.assertEqual(batch[name][i], value, msg=name)
+
+    def test_performance_optimization_batch_matches_scalar(self) -> None:
+        """Every metric and status should match row by row, including zero denominators."""
+
+        rows = [
+            (80.0, 90.0, 20.0, 8.0, 0.0, 10.0, 90.0, 8.0),
+            (0.0, 0.0, 0.0, 0.0, 0.0, 10.0, 90.0, 8.0),
+            (95.0, 90.0, 50.0, 9.5, 1.0, 2.0, 3.0, 4.0),
+            (70.0, 85.0, 90.0, 9.0, 0.0, 10.0, 60.0, 9.0),
+        ]
+        batch = calculate_performance_optimization_batch(*zip(*rows))
+        for i, row in enumerate(rows):
+            result = calculate_performance_optimization(*row)
+            for name, value in result["metrics"].items():
+                self.assertAlmostEqual(batch[name][i], value, msg=name)
+            for name, value in result["performance"].items():
+                self.assertEqual(batch[name][i], value, msg=name)
+
+    def test_ratings_match_across_tiers(self) -> None:
+        """Batch ratings should match the scalar ratings on every tier boundary of the grid."""
+
+        rows = [(1000.0, cost * 0.5, cost * 0.5, cost, 10.0, 15.0, previous, margin) for cost, previous, margin in product((550.0, 600.0, 640.0, 700.0, 760.0), (850.0, 900.0, 950.0, 1000.0, 1100.0), (70.0, 100.0, 400.0))]
+        batch = calculate_comprehensive_analysis_batch(*zip(*rows))
+        ratings = [calculate_comprehensive_analysis(*row)["performance"]["rating"] for row in rows]
+        self.assertEqual(list(batch["rating"]), ratings)
+        self.assertEqual(set(ratings), {"Excellent", "Good", "Acceptable", "Needs Improvement"})
+
+        rows = [(current, 100.0, 90.0, score, 0.0, 10.0, 90.0, score) for current, score in product((70.0, 80.0, 86.0, 90.0, 95.0), (8.0, 9.8, 11.5, 13.0))]
+        batch = calculate_performance_optimization_batch(*zip(*rows))
+        ratings = [calculate_performance_optimization(*row)["performance"]["rating"] for row in rows]
+        self.assertEqual(list(batch["rating"]), ratings)
+        self.assertEqual(set(ratings), {"Good", "Acceptable", "Needs Improvement"})
+
+    def test_batch_broadcasts_and_rejects_bad_input(self) -> None:
+        """Single values apply to every period; mismatched or non-numeric input raises."""
+
+        batch = calculate_comprehensive_analysis_batch([1000.0, 2000.0], [300.0, 500.0], [280.0, 600.0], [580.0, 1100.0], target_margin=65.0)
+        self.assertEqual(list(batch["target_margin"]), [65.0, 65.0])
+        with self.assertRaises(ValueError):
+            calculate_comprehensive_analysis_batch([1000.0, 2000.0], [300.0], [280.0, 600.0, 1.0], [580.0])
+        with self.assertRaises(ValueError):
+            calculate_performance_optimization_batch(["a"], [90.0], [20.0], [8.0])
+
+
+class DashboardThresholdTests(TestCase):
+    """Percentages that land exactly on a status threshold keep the baseline rating."""
+
+    def test_exact_threshold_values(self) -> None:
+        """Divide-then-scale keeps 60%, 35%, 80% and 10% exact in both the scalar and batch paths."""
+
+        prime = calculate_comprehensive_analysis(9100.0, 2730.0, 2730.0, 5460.0)
+        self.assertEqual(prime["metrics"]["prime_cost_percentage"], 60.0)
+        self.assertEqual(prime["performance"]["cost_status"], "Optimal")
+        labor = calculate_comprehensive_analysis(12300.0, 4305.0, 100.0, 0.0)
+        self.assertEqual(labor["metrics"]["labor_percentage"], 35.0)
+        self.assertFalse(any("labor" in rec.lower() for rec in labor["recommendations"]))
+        batch = calculate_comprehensive_analysis_batch([9100.0, 12300.0], [2730.0, 4305.0], [2730.0, 100.0], [5460.0, 0.0])
+        self.assertEqual(batch["prime_cost_percentage"][0], 60.0)
+        self.assertEqual(batch["cost_status"][0], "Optimal")
+        self.assertEqual(batch["labor_percentage"][1], 35.0)
+
+        goal = calculate_performance_optimization(308.0, 385.0, 20.0, 8.0)
+        self.assertEqual(goal["metrics"]["goal_achievement_rate"], 80.0)
+        gap = calculate_performance_optimization(770.0, 847.0, 20.0, 8.0)
+        self.assertEqual(gap["metrics"]["improvement_potential"], 10.0)
+        batch = calculate_performance_optimization_batch([308.0, 770.0], [385.0, 847.0], [20.0, 20.0], [8.0, 8.0])
+        self.assertEqual(batch["goal_achievement_rate"][0], 80.0)
+        self.assertEqual(batch["improvement_potential"][1], 10.0)
+
+    def test_zero_denominators_report_zero(self) -> None:
+        """Guarded percentages stay the integer 0 the reports have always printed."""
+
+        self.assertIn("Labor Percentage: 0\n", calculate_comprehensive_analysis(0, 0, 0, 0)["business_report"])
+        self.assertIn("Goal Achievement Rate: 0\n", calculate_performance_optimization(0, 0, 0, 0)["business_report"])
+
+
+class DashboardBenchmarkTests(TestCase):
+    """Each result carries its own copy of the industry benchmarks."""
+
+    def test_benchmarks_are_copied_per_result(self) -> None:
+        """Editing one result's benchmarks must not change the module defaults."""
+
+        for analysis, args in (
+            (calculate_comprehensive_analysis, (1000.0, 300.0, 280.0, 580.0)),
+            (calculate_performance_optimization, (80.0, 90.0, 20.0, 8.0)),
+        ):
+            with self.subTest(analysis=analysis.__name__):
+                expected = dict(analysis(*args)["industry_benchmarks"])
+                analysis(*args)["industry_benchmarks"].clear()
+                self.assertEqual(analysis(*args)["industry_benchmarks"], expected)
+
+
+class DashboardFieldSelectionTests(TestCase):
+    """Callers can ask for specific fields instead of the full result."""
+
+    def test_selected_fields_skip_the_report(self) -> None:
+        """Figures-only selections should match the full result without rendering a report."""
+
+        args = (1000.0, 300.0, 280.0, 580.0, 40.0, 15.0, 900.0, 70.0)
+        full = calculate_comprehensive_analysis(*args)
+        with patch("backend.consulting_services.kpi.dashboard_analysis.format_business_report") as report:
+            selected = calculate_comprehensive_analysis(*args, fields={"rating", "prime_cost_percentage", "recommendations"})
+        report.assert_not_called()
+        self.assertEqual(selected, {
+            "rating": full["performance"]["rating"],
+            "prime_cost_percentage": full["metrics"]["prime_cost_percentage"],
+            "recommendations": full["recommendations"],
+        })
+
+    def test_report_fields_and_unknown_names(self) -> None:
+        """Report keys are still available on request; unknown names raise."""
+
+        selected = calculate_performance_optimization(80.0, 90.0, 20.0, 8.0, fields=["business_report", "goal_status"])
+        self.assertEqual(set(selected), {"business_report", "goal_status"})
+        self.assertIn("PERFORMANCE OPTIMIZATION ANALYSIS", selected["business_report"])
+        with self.assertRaises(ValueError):
+            calculate_performance_optimization(80.0, 90.0, 20.0, 8.0, fields={"no_such_metric"})
@@ -0,0 +1,44 @@
+"""Tests for the KPI dashboard task wrappers."""
+
+from __future__ import annotations
+
+from unittest import TestCase
+
+from backend.consulting_services.hr import performance_optimization
+from backend.consulting_services.kpi.dashboard_analysis import (
+    calculate_comprehensive_analysis,
+    calculate_performance_optimization,
+)
+from backend.consulting_services.strategy import comprehensive
+
+
+class DashboardTaskCacheTests(TestCase):
+    """The task wrappers memoize reports without merging distinct requests."""
+
+    def test_nearby_inputs_are_computed_from_their_own_values(self) -> None:
+        """Inputs that agree to four decimals should still get their own figures."""
+
+        for task, fields, params, other, metric, expected in (
+            (comprehensive, comprehensive._CA_FIELDS, {"total_sales": 3.0, "labor_cost": 1.0},
+             {"labor_cost": 1.00004}, "labor_percentage", calculate_comprehensive_analysis),
+            (performance_optimization, performance_optimization._PO_FIELDS,
+             {"current_performance": 3.0, "target_performance": 7.0}, {"current_performance": 3.00004},
+             "performance_gap", calculate_performance_optimization),
+        ):
+            with self.subTest(task=task.__name__):
+                first, _ = task.run(params)
+                second, _ = task.run({**params, **other})
+                self.assertNotEqual(first["data"]["metrics"], second["data"]["metrics"])
+                values = tuple(float({**params, **other}.get(name, default)) for name, default in fields)
+                self.assertEqual(second["data"]["metrics"][metric], expected(*values)["metrics"][metric])
+
+    def test_cached_report_is_returned_as_a_copy(self) -> None:
+        """Replacing fields on one response must not leak into the next."""
+
+        for cached, values in (
+            (comprehensive._cached_ca, (1000.0, 300.0, 280.0, 580.0, 40.0, 15.0, 900.0, 70.0)),
+            (performance_optimization._cached_po, (80.0, 90.0, 20.0, 8.0, 0.0, 10.0, 90.0, 8.0)),
+        ):
+            with self.subTest(cached=cached.__name__):
+                cached(values, None)["metrics"] = {}
+                self.assertTrue(cached(values, None)["metrics"])
@@ -0,0 +1,64 @@
+"""Tests for the include_html / include_text_report flags on the HR report tasks."""
+
+from __future__ import annotations
+
+from unittest import TestCase
+
+from backend.consulting_services.hr import labor_scheduling, performance_management
+from backend.shared.utils.common import safe_bool
+
+_TASKS = (
+    (labor_scheduling, {"total_sales": 10000.0, "labor_hours": 200.0, "hourly_rate": 15.0}),
+    (performance_management, {"customer_satisfaction": 80.0}),
+)
+
+
+class ReportFlagTests(TestCase):
+    """String flags from query strings and forms should be parsed, not just truth-tested."""
+
+    def test_false_strings_skip_the_reports(self) -> None:
+        """"false", "0" and "no" should skip the report just like a real False."""
+
+        for task, params in _TASKS:
+            for flag in (False, "false", "False", "0", "no", 0):
+                with self.subTest(task=task.__name__, flag=flag):
+                    payload, status = task.run({**params, "include_html": flag, "include_text_report": flag})
+                    self.assertEqual(status, 200)
+                    self.assertEqual(payload["data"]["business_report_html"], "")
+                    self.assertEqual(payload["data"]["business_report"], "")
+
+    def test_true_strings_and_default_build_the_reports(self) -> None:
+        """Truthy strings and a missing flag should keep both reports."""
+
+        for task, params in _TASKS:
+            for extra in (
+                {},
+                {"include_html": "true", "include_text_report": "1"},
+                {"include_html": True, "include_text_report": "yes"},
+            ):
+                with self.subTest(task=task.__name__, extra=extra):
+                    data = task.run({**params, **extra})[0]["data"]
+                    self.assertTrue(data["business_report_html"])
+                    self.assertTrue(data["business_report"])
+
+    def test_null_flags_use_the_default(self) -> None:
+        """A JSON null is treated as an omitted flag rather than a client error."""
+
+        for task, params in _TASKS:
+            with self.subTest(task=task.__name__):
+                payload, status = task.run({**params, "include_html": None, "include_text_report": None})
+                self.assertEqual(status, 200)
+                self.assertTrue(payload["data"]["business_report_html"])
+                self.assertTrue(payload["data"]["business_report"])
+        self.assertFalse(safe_bool(None, "include_html"))
+
+    def test_unrecognised_flag_is_rejected(self) -> None:
+        """Anything that is not a recognisable boolean should be a client error."""
+
+        for task, params in _TASKS:
+            with self.subTest(task=task.__name__):
+                payload, status = task.run({**params, "include_html": "maybe"})
+                self.assertEqual(status, 400)
+                self.assertIn("include_html", payload["error"])
+        with self.assertRaises(ValueError):
+            safe_bool([], "include_html")
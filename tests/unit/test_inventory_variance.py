@@ -0,0 +1,82 @@
+"""Tests for the inventory and liquor variance calculations."""
+
+from __future__ import annotations
+
+import math
+from unittest import TestCase
+
+from backend.consulting_services.inventory.liquor import calculate_liquor_variance, calculate_liquor_variance_batch
+from backend.consulting_services.inventory.tracking import (
+    calculate_inventory_variance,
+    calculate_inventory_variance_batch,
+)
+from backend.consulting_services.inventory.variance_kernel import NUMBA_MIN_BATCH
+
+
+class VarianceBatchTests(TestCase):
+    """The batch entry points should agree with the scalar functions."""
+
+    def test_inventory_batch_matches_scalar(self) -> None:
+        """Each batch element should equal the scalar result for the same pair."""
+
+        expected = [100.0, 40.0, 12.5]
+        actual = [104.0, 30.0, 12.5]
+        batch = calculate_inventory_variance_batch(expected, actual)
+        self.assertEqual(batch["status"], "success")
+        for i, (exp, act) in enumerate(zip(expected, actual)):
+            scalar = calculate_inventory_variance(exp, act)
+            self.assertAlmostEqual(batch["variance"][i], scalar["variance"], places=2)
+            self.assertAlmostEqual(batch["variance_percent"][i], scalar["variance_percent"], places=2)
+
+    def test_liquor_batch_matches_scalar(self) -> None:
+        """Each batch element should equal the scalar result for the same pair."""
+
+        expected = [25.0, 8.0]
+        actual = [27.5, 6.0]
+        batch = calculate_liquor_variance_batch(expected, actual)
+        self.assertEqual(batch["status"], "success")
+        for i, (exp, act) in enumerate(zip(expected, actual)):
+            scalar = calculate_liquor_variance(exp, act)
+            self.assertAlmostEqual(batch["variance_oz"][i], scalar["variance_oz"], places=2)
+            self.assertAlmostEqual(batch["variance_percent"][i], scalar["variance_percent"], places=2)
+
+    def test_zero_expected_gives_nan_percent(self) -> None:
+        """A zero expected value should not fail the rest of the batch."""
+
+        batch = calculate_inventory_variance_batch([0.0, 10.0], [5.0, 11.0])
+        self.assertEqual(batch["status"], "success")
+        self.assertTrue(math.isnan(batch["variance_percent"][0]))
+        self.assertAlmostEqual(batch["variance_percent"][1], 10.0)
+
+    def test_batch_rejects_bad_input(self) -> None:
+        """Negative values and mismatched lengths should return an error response."""
+
+        self.assertEqual(calculate_liquor_variance_batch([-1.0], [1.0])["status"], "error")
+        self.assertEqual(calculate_liquor_variance_batch([1.0, 2.0], [1.0])["status"], "error")
+        self.assertEqual(calculate_inventory_variance_batch(["a"], [1.0])["status"], "error")
+
+    def test_large_batch_matches_small_batch_math(self) -> None:
+        """Batches large enough for the compiled kernel should give the same numbers."""
+
+        size = NUMBA_MIN_BATCH + 5
+        expected = [float(i % 50) for i in range(size)]
+        actual = [float(i % 37) for i in range(size)]
+        batch = calculate_inventory_variance_batch(expected, actual)
+        for i in (0, 1, 49, size - 1):
+            self.assertAlmostEqual(batch["variance"][i], actual[i] - expected[i])
+            if expected[i] == 0:
+                self.assertTrue(math.isnan(batch["variance_percent"][i]))
+            else:
+                self.assertAlmostEqual(batch["variance_percent"][i], (actual[i] - expected[i]) / expected[i] * 100)
+
+
+class VarianceValidationTests(TestCase):
+    """Scalar variance validation should reject non-numeric quantities."""
+
+    def test_booleans_are_rejected(self) -> None:
+        """bool subclasses int but is never a valid quantity."""
+
+        result = calculate_inventory_variance(True, 3.0)
+        self.assertEqual(result["status"], "error")
+        self.assertIn("got bool", result["message"])
+        self.assertEqual(calculate_liquor_variance(4.0, False)["status"], "error")
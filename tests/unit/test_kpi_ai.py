@@ -0,0 +1,132 @@
+"""Tests for the AI-generated KPI analysis."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from backend.consulting_services.kpi import kpi_utils
+
+
+def _fake_client(content: str) -> MagicMock:
+    client = MagicMock()
+    client.chat.completions.create.return_value.choices = [MagicMock(message=MagicMock(content=content))]
+    return client
+
+
+@patch.object(kpi_utils, "_load_env")
+@patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test"})
+class AIKpiAnalysisCacheTests(TestCase):
+    """Repeated prompts should be answered from the completion cache."""
+
+    def setUp(self) -> None:
+        kpi_utils._kpi_ai_completion.cache_clear()
+
+    def test_identical_inputs_reuse_the_completion(self, _load_env) -> None:
+        """A re-rendered period makes one API call; changed figures make another."""
+
+        client = _fake_client("analysis")
+        with patch.object(kpi_utils, "_openai_client", return_value=client):
+            first = kpi_utils.generate_ai_kpi_analysis(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7)
+            second = kpi_utils.generate_ai_kpi_analysis(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7)
+            kpi_utils.generate_ai_kpi_analysis(10000.0, 35.0, 31.0, 66.0, 55.0, "stable", 7)
+        self.assertEqual(first, "analysis")
+        self.assertEqual(second, first)
+        self.assertEqual(client.chat.completions.create.call_count, 2)
+
+    def test_routine_and_deep_analyses_pick_their_model(self, _load_env) -> None:
+        """Routine analyses default to the small model; deep ones use gpt-4o and are cached apart."""
+
+        client = _fake_client("analysis")
+        with patch.object(kpi_utils, "_openai_client", return_value=client):
+            kpi_utils.generate_ai_kpi_analysis(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7)
+            routine = client.chat.completions.create.call_args.kwargs
+            kpi_utils.generate_ai_kpi_analysis(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7, deep_analysis=True)
+            deep = client.chat.completions.create.call_args.kwargs
+            with patch.dict("os.environ", {"OPENAI_KPI_MODEL": "gpt-test", "OPENAI_KPI_MAX_TOKENS": "800"}):
+                kpi_utils.generate_ai_kpi_analysis(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7)
+            overridden = client.chat.completions.create.call_args.kwargs
+        self.assertEqual((routine["model"], routine["max_tokens"]), ("gpt-4o-mini", 1200))
+        self.assertEqual((deep["model"], deep["max_tokens"]), ("gpt-4o", 2000))
+        self.assertEqual((overridden["model"], overridden["max_tokens"]), ("gpt-test", 800))
+
+    def test_truncated_analysis_is_retried_once_with_a_larger_cap(self, _load_env) -> None:
+        """A completion stopped by max_tokens is re-requested with twice the cap."""
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = [
+            MagicMock(choices=[MagicMock(finish_reason="length", message=MagicMock(content="Executive Sum"))]),
+            MagicMock(choices=[MagicMock(finish_reason="stop", message=MagicMock(content="  Executive Summary\n"))]),
+        ]
+        with patch.object(kpi_utils, "_openai_client", return_value=client):
+            analysis = kpi_utils.generate_ai_kpi_analysis(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7)
+        self.assertEqual(analysis, "Executive Summary")
+        caps = [call.kwargs["max_tokens"] for call in client.chat.completions.create.call_args_list]
+        self.assertEqual(caps, [1200, 2400])
+
+    def test_failures_are_not_cached(self, _load_env) -> None:
+        """An API error is reported and the next call retries."""
+
+        client = _fake_client("analysis")
+        client.chat.completions.create.side_effect = [RuntimeError("timeout"), client.chat.completions.create.return_value]
+        with patch.object(kpi_utils, "_openai_client", return_value=client):
+            failed = kpi_utils.generate_ai_kpi_analysis(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7)
+            retried = kpi_utils.generate_ai_kpi_analysis(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7)
+        self.assertEqual(failed, "AI analysis unavailable: timeout")
+        self.assertEqual(retried, "analysis")
+
+    def test_gathered_analyses_overlap(self, _load_env) -> None:
+        """Awaited analyses run concurrently and still share the completion cache."""
+
+        both_started = threading.Barrier(2, timeout=5)
+
+        def create(**kwargs):
+            both_started.wait()
+            return _fake_client(kwargs["messages"][1]["content"][-30:]).chat.completions.create()
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = create
+
+        async def gather():
+            return await asyncio.gather(
+                kpi_utils.generate_ai_kpi_analysis_async(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7),
+                kpi_utils.generate_ai_kpi_analysis_async(10000.0, 35.0, 31.0, 66.0, 55.0, "declining", 7),
+            )
+
+        with patch.object(kpi_utils, "_openai_client", return_value=client):
+            stable, declining = asyncio.run(gather())
+            again = kpi_utils.generate_ai_kpi_analysis(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7)
+        self.assertTrue(stable.endswith("stable"))
+        self.assertTrue(declining.endswith("declining"))
+        self.assertEqual(again, stable)
+        self.assertEqual(client.chat.completions.create.call_count, 2)
+
+
+@patch.object(kpi_utils, "_load_env")
+@patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test"})
+class AIKpiAnalysisStreamTests(TestCase):
+    """Streaming callers should receive the analysis fragment by fragment."""
+
+    def test_fragments_are_yielded_as_they_arrive(self, _load_env) -> None:
+        """Empty deltas are skipped and the request is made with stream=True."""
+
+        client = MagicMock()
+        client.chat.completions.create.return_value = iter(
+            [MagicMock(choices=[MagicMock(delta=MagicMock(content=text))]) for text in ("Labor ", None, "is high")]
+        )
+        with patch.object(kpi_utils, "_openai_client", return_value=client):
+            fragments = kpi_utils.generate_ai_kpi_analysis(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7, stream=True)
+            client.chat.completions.create.assert_not_called()
+            self.assertEqual(list(fragments), ["Labor ", "is high"])
+        self.assertTrue(client.chat.completions.create.call_args.kwargs["stream"])
+
+    def test_errors_are_reported_in_the_stream(self, _load_env) -> None:
+        """A failed request yields the same message as the blocking call returns."""
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = RuntimeError("timeout")
+        with patch.object(kpi_utils, "_openai_client", return_value=client):
+            fragments = kpi_utils.generate_ai_kpi_analysis(10000.0, 29.0, 31.0, 60.0, 55.0, "stable", 7, stream=True)
+            self.assertEqual(list(fragments), ["AI analysis unavailable: timeout"])
@@ -0,0 +1,95 @@
+"""Tests for KPI CSV processing."""
+
+from __future__ import annotations
+
+import io
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from backend.consulting_services.kpi.kpi_kernel import NUMBA_MIN_ROWS, daily_kpi_arrays
+from backend.consulting_services.kpi.kpi_utils import process_kpi_csv_data
+
+
+def _csv(text: str, name: str = "kpi.csv") -> io.BytesIO:
+    handle = io.BytesIO(text.encode())
+    handle.name = name
+    return handle
+
+
+@patch("backend.consulting_services.kpi.kpi_utils.generate_ai_kpi_analysis", return_value=None)
+class ProcessKpiCsvTests(TestCase):
+    """Daily KPIs should be computed per row with unusable rows skipped."""
+
+    def test_daily_kpis_and_summary(self, _ai) -> None:
+        """Percentages are per row; zero-sales and negative-cost rows are left out."""
+
+        result = process_kpi_csv_data(_csv(
+            "date,sales,labor_cost,food_cost,labor_hours\n"
+            "2025-01-01,5000,1500,1600,80\n"
+            "2025-01-02,0,100,100,10\n"
+            "2025-01-03,4000,-1,1000,50\n"
+            "2025-01-04,6000,1700,1900,90\n"
+        ))
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["period_analyzed"], "2 days")
+        self.assertEqual(result["daily_kpis"][0], {
+            "date": "2025-01-01",
+            "sales": 5000.0,
+            "labor_percent": 30.0,
+            "food_percent": 32.0,
+            "prime_percent": 62.0,
+            "sales_per_hour": 62.5,
+        })
+        self.assertEqual(result["daily_kpis"][1]["date"], "2025-01-04")
+        self.assertEqual(result["summary"]["total_sales"], "$11,000.00")
+
+    def test_mapped_columns_without_dates(self, _ai) -> None:
+        """Alternative column names map to the KPI fields and rows are labelled by position."""
+
+        result = process_kpi_csv_data(_csv("Revenue,Wages,COGS,Staff_Hours\n5000,1500,1600,80\nabc,1,1,1\n7000,2000,2100,100\n"))
+        self.assertEqual([kpi["date"] for kpi in result["daily_kpis"]], ["Day 1", "Day 3"])
+
+    def test_chunked_read_matches_single_read(self, _ai) -> None:
+        """Streaming in small chunks, with text in a later chunk, should give the same result."""
+
+        text = (
+            "date,sales,labor_cost,food_cost,labor_hours\n"
+            "2025-01-01,5000,1500,1600,80\n"
+            "2025-01-02,4000,1300,1250,60\n"
+            "2025-01-03,n/a,100,100,10\n"
+            "2025-01-04,6000,1700,1900,90\n"
+            "2025-01-05,5500,1600,1800,85\n"
+        )
+        whole = process_kpi_csv_data(_csv(text))
+        with patch("backend.consulting_services.kpi.kpi_utils._KPI_CSV_CHUNK_ROWS", 2):
+            chunked = process_kpi_csv_data(_csv(text))
+        self.assertEqual(chunked, whole)
+        self.assertEqual(whole["period_analyzed"], "4 days")
+
+    def test_no_usable_rows(self, _ai) -> None:
+        """Rows with negative costs are reported as errors when nothing is usable."""
+
+        result = process_kpi_csv_data(_csv("sales,labor_cost,food_cost,labor_hours\n1000,-5,200,10\n0,0,0,0\n"))
+        self.assertEqual(result["status"], "error")
+        self.assertIn("Processed 2 rows, 1 had errors", result["message"])
+
+
+class DailyKpiKernelTests(TestCase):
+    """Large uploads may use the compiled kernel; results must not change."""
+
+    def test_large_input_matches_small_input_math(self) -> None:
+        """Each row of a kernel-sized batch should equal the same row computed alone."""
+
+        rng = np.random.default_rng(7)
+        size = NUMBA_MIN_ROWS + 3
+        sales = rng.uniform(500.0, 9000.0, size)
+        labor = rng.uniform(0.0, 3000.0, size)
+        food = rng.uniform(0.0, 3000.0, size)
+        hours = rng.uniform(10.0, 120.0, size)
+        large = daily_kpi_arrays(sales, labor, food, hours)
+        for i in (0, 1, size // 2, size - 1):
+            small = daily_kpi_arrays(sales[i:i + 1], labor[i:i + 1], food[i:i + 1], hours[i:i + 1])
+            for large_column, small_column in zip(large, small):
+                self.assertEqual(large_column[i], small_column[0])
@@ -0,0 +1,40 @@
+"""Tests for KPI recommendation generation."""
+
+from __future__ import annotations
+
+from unittest import TestCase
+
+from backend.consulting_services.kpi.kpi_utils import generate_kpi_recommendations, generate_kpi_recommendations_batch
+
+
+class RecommendationBatchTests(TestCase):
+    """generate_kpi_recommendations_batch should agree with the per-row function."""
+
+    def test_batch_matches_scalar(self) -> None:
+        """Each row, including threshold boundaries and on-target rows, matches the scalar result."""
+
+        labor = [25.0, 30.0, 30.01, 36.4, 28.0]
+        food = [28.0, 32.0, 35.5, 32.01, 29.0]
+        prime = [53.0, 62.0, 65.51, 60.0, 57.0]
+        sph = [60.0, 50.0, 49.99, 42.0, 55.0]
+        batch = generate_kpi_recommendations_batch(labor, food, prime, sph)
+        self.assertEqual(len(batch), len(labor))
+        for i, row in enumerate(zip(labor, food, prime, sph)):
+            self.assertEqual(batch[i], generate_kpi_recommendations(*row))
+        self.assertEqual(batch[0][0]["priority"], "Maintain")
+
+    def test_scalars_broadcast(self) -> None:
+        """A single value applies to every row; all-scalar input is a one-row batch."""
+
+        batch = generate_kpi_recommendations_batch([25.0, 35.0], 28.0, 55.0, 60.0)
+        self.assertEqual([len(row) for row in batch], [1, 1])
+        self.assertEqual(batch[1][0]["impact"], "Could save $5000 per $10k in sales")
+        self.assertEqual(len(generate_kpi_recommendations_batch(25.0, 28.0, 55.0, 60.0)), 1)
+
+    def test_bad_input_raises(self) -> None:
+        """Non-numeric values and mismatched lengths raise ValueError."""
+
+        with self.assertRaises(ValueError):
+            generate_kpi_recommendations_batch(["a"], 1.0, 1.0, 1.0)
+        with self.assertRaises(ValueError):
+            generate_kpi_recommendations_batch([1.0, 2.0], [1.0, 2.0, 3.0], 1.0, 1.0)
@@ -0,0 +1,182 @@
+"""Tests for the KPI business report formatter."""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+from unittest import TestCase
+
+from backend.consulting_services.kpi.kpi_utils import (
+    calculate_food_cost_analysis,
+    calculate_kpi_summary,
+    calculate_labor_cost_analysis,
+    calculate_prime_cost_analysis,
+    calculate_sales_performance_analysis,
+    format_business_report,
+    render_business_report,
+)
+
+
+class _Point(NamedTuple):
+    x: float
+    y: float
+
+
+class ReportFormatTests(TestCase):
+    """Only the requested report representations should be rendered."""
+
+    def test_formats_are_rendered_on_request(self) -> None:
+        """Skipped formats come back as None while the JSON fields are unchanged."""
+
+        full = calculate_labor_cost_analysis(50000.0, 15000.0, 800.0)
+        html_only = calculate_labor_cost_analysis(50000.0, 15000.0, 800.0, output_formats=frozenset({"html"}))
+        bare = calculate_labor_cost_analysis(50000.0, 15000.0, 800.0, output_formats=frozenset())
+
+        self.assertIn("END OF REPORT", full["business_report"])
+        self.assertIsNone(html_only["business_report"])
+        self.assertEqual(html_only["business_report_html"], full["business_report_html"])
+        self.assertIsNone(bare["business_report"])
+        self.assertIsNone(bare["business_report_html"])
+        self.assertEqual(bare["key_metrics"], full["key_metrics"])
+        self.assertEqual(bare["performance_rating"], full["performance_rating"])
+
+    def test_deferred_render_matches_eager_render(self) -> None:
+        """Rendering a bare result later gives the same reports as rendering up front."""
+
+        cases = [
+            (calculate_labor_cost_analysis, (50000.0, 15000.0, 800.0), {"overtime_hours": 20.0, "covers": 1200}),
+            (calculate_food_cost_analysis, (50000.0, 16000.0), {"waste_cost": 900.0}),
+            (calculate_prime_cost_analysis, (50000.0, 15000.0, 16000.0), {}),
+            (calculate_sales_performance_analysis, (50000.0, 15000.0, 16000.0, 800.0), {"previous_sales": 45000.0}),
+        ]
+        for analysis, args, kwargs in cases:
+            with self.subTest(analysis=analysis.__name__):
+                bare = analysis(*args, output_formats=frozenset(), **kwargs)
+                self.assertEqual(render_business_report(bare), analysis(*args, **kwargs))
+
+    def test_tracking_sections_take_their_heading_from_the_key(self) -> None:
+        """Dict insights render as tracking cards; the first matching key word picks the heading."""
+
+        report = format_business_report(
+            "Test Analysis",
+            {"sales": 1000.0},
+            {"rating": "Good", "color": "green"},
+            ["Keep it up"],
+            additional_data={
+                "overtime_tracking": {"overtime_hours": 4.0, "data_source": "Actual"},
+                "menu_cost_breakdown": {"plate_cost": 3.5},
+                "custom_notes": {"count": 2},
+            },
+            output_formats=frozenset({"html"}),
+        )
+        html = report["business_report_html"]
+        self.assertIn('<span class="tracking-icon">⏰</span>', html)
+        self.assertIn('<span class="tracking-title">Overtime Tracking</span>', html)
+        self.assertIn('<span class="tracking-title">Menu Costing</span>', html)
+        self.assertIn('<span class="tracking-title">Custom Notes</span>', html)
+        self.assertIn("✓ Actual Data", html)
+
+    def test_explicit_report_date_is_used(self) -> None:
+        """A supplied report date replaces today's in the result and both reports."""
+
+        report = format_business_report(
+            "Test Analysis", {"sales": 1000.0}, {"rating": "Good", "color": "green"}, ["Keep it up"],
+            report_date="January 05, 2026",
+        )
+        self.assertEqual(report["report_date"], "January 05, 2026")
+        self.assertIn("Generated: January 05, 2026", report["business_report"])
+        self.assertIn("Generated: January 05, 2026", report["business_report_html"])
+        self.assertEqual(render_business_report({**report, "business_report": None})["business_report"], report["business_report"])
+
+
+class ReportMemoizationTests(TestCase):
+    """Repeated analyses should be served from the cache without sharing the top-level dict."""
+
+    def setUp(self) -> None:
+        calculate_kpi_summary.cache_clear()
+
+    def test_identical_inputs_share_a_cache_entry(self) -> None:
+        """Repeating the exact inputs reuses the cached report in a fresh dict."""
+
+        first = calculate_kpi_summary(10000.0, 2800.0, 3200.0, 200.0)
+        second = calculate_kpi_summary(10000.0, 2800.0, 3200.0, 200.0)
+        self.assertEqual(second, first)
+        self.assertIsNot(second, first)
+        self.assertEqual(calculate_kpi_summary.cache_info().hits, 1)
+
+    def test_nearby_inputs_are_computed_from_their_own_values(self) -> None:
+        """Inputs that differ past the 4th decimal neither share an entry nor get rounded."""
+
+        calculate_labor_cost_analysis.cache_clear()
+        first = calculate_labor_cost_analysis(50000.0, 15000.0, 800.0)
+        second = calculate_labor_cost_analysis(50000.00004, 15000.0, 800.0)
+        self.assertEqual(calculate_labor_cost_analysis.cache_info().hits, 0)
+        self.assertEqual(first["key_metrics"]["total_sales"], 50000.0)
+        self.assertEqual(second["key_metrics"]["total_sales"], 50000.00004)
+
+    def test_benchmarks_are_copied_per_result(self) -> None:
+        """Editing one summary's benchmarks must not change how later summaries are rated."""
+
+        first = calculate_kpi_summary(10000.0, 2800.0, 3000.0, 200.0)
+        expected = {key: dict(value) for key, value in first["industry_benchmarks"].items()}
+        first["industry_benchmarks"]["labor_percent"]["good"] = 10
+        later = calculate_kpi_summary(10000.0, 2800.0, 3100.0, 200.0)
+        self.assertEqual(later["kpis"]["labor_percent"]["assessment"], "good")
+        self.assertEqual(later["industry_benchmarks"], expected)
+
+    def test_errors_are_still_reported(self) -> None:
+        """Invalid inputs, including unhashable ones, return the usual error responses."""
+
+        self.assertEqual(calculate_kpi_summary(0.0, 2800.0, 3200.0, 200.0)["message"], "total_sales cannot be zero")
+        self.assertEqual(calculate_kpi_summary([1.0], 2800.0, 3200.0, 200.0)["message"], "total_sales must be a number, got list")
+
+
+class BusinessReportCacheTests(TestCase):
+    """format_business_report should reuse rendered reports only for identical inputs."""
+
+    def setUp(self) -> None:
+        format_business_report.cache_clear()
+
+    def test_cached_report_echoes_caller_inputs(self) -> None:
+        """A hit returns the same report text but the caller's own metrics dict."""
+
+        first_metrics = {"labor_percent": 31.5}
+        second_metrics = {"labor_percent": 31.5}
+        first = format_business_report("Labor Cost Analysis", first_metrics, {"rating": "Good"}, ["Trim overtime"])
+        second = format_business_report("Labor Cost Analysis", second_metrics, {"rating": "Good"}, ["Trim overtime"])
+        self.assertEqual(format_business_report.cache_info().hits, 1)
+        self.assertEqual(second["business_report_html"], first["business_report_html"])
+        self.assertIs(second["key_metrics"], second_metrics)
+
+    def test_equal_numbers_of_different_types_are_not_shared(self) -> None:
+        """1 and 1.0 compare equal but are formatted differently."""
+
+        as_int = format_business_report("Report", {"covers": 1}, {"rating": "Good"}, [])
+        as_float = format_business_report("Report", {"covers": 1.0}, {"rating": "Good"}, [])
+        self.assertIn("Covers: 1\n", as_int["business_report"])
+        self.assertIn("Covers: 1.00", as_float["business_report"])
+
+    def test_tuple_subclasses_are_rendered_without_the_cache(self) -> None:
+        """NamedTuples cannot be rebuilt from a cache key, so they are rendered as given."""
+
+        point = _Point(1.0, 2.0)
+        report = format_business_report("Report", {"covers": 1.0}, {"rating": "Good"}, [], None, {"figures": {"point": point}})
+        self.assertIn(f"Point: {point}\n", report["business_report"])
+        self.assertEqual(format_business_report.cache_info().currsize, 0)
+
+
+class RatingBandTests(TestCase):
+    """Cost percents on a band edge should take the better rating."""
+
+    def test_band_edges_are_inclusive(self) -> None:
+        """25/30/35% labor and food costs rate Excellent/Good/Acceptable; just above 35% needs improvement."""
+
+        cases = [(25.0, "Excellent", "green"), (30.0, "Good", "blue"), (35.0, "Acceptable", "yellow"), (35.5, "Needs Improvement", "red")]
+        for percent, rating, color in cases:
+            cost = 10000.0 * percent / 100
+            for result in (
+                calculate_labor_cost_analysis(10000.0, cost, 400.0, output_formats=frozenset()),
+                calculate_food_cost_analysis(10000.0, cost, output_formats=frozenset()),
+            ):
+                with self.subTest(percent=percent, analysis=result["analysis_type"]):
+                    self.assertEqual(result["performance_rating"], rating)
+                    self.assertEqual(result["performance_color"], color)
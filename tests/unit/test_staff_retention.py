@@ -0,0 +1,39 @@
+"""Tests for the HR staff retention task."""
+
+from __future__ import annotations
+
+from unittest import TestCase
+
+from backend.consulting_services.hr.staff_retention import run, run_batch
+
+
+class StaffRetentionBatchTests(TestCase):
+    """run_batch should agree with the single-location run()."""
+
+    def test_batch_matches_run(self) -> None:
+        """Ratings, risk levels and costs should match row by row, including bucket boundaries."""
+
+        rates = [20.0, 30.0, 30.5, 50.0, 71.0, 150.0]
+        averages = [70.0, 70.0, 10.0, 40.0, 70.0, 60.0]
+        batch = run_batch(rates, averages)
+        for i, (rate, avg) in enumerate(zip(rates, averages)):
+            data = run({"turnover_rate": rate, "industry_average": avg})[0]["data"]
+            self.assertEqual(batch["performance_rating"][i], data["performance_rating"])
+            self.assertEqual(batch["risk_level"][i], data["risk_level"])
+            self.assertAlmostEqual(batch["retention_rate"][i], data["retention_rate"])
+            self.assertAlmostEqual(batch["estimated_annual_cost"][i], data["estimated_annual_cost"])
+
+    def test_scalar_industry_average_broadcasts(self) -> None:
+        """A single industry average should apply to every location."""
+
+        batch = run_batch([40.0, 95.0], 70.0)
+        self.assertEqual(list(batch["industry_average"]), [70.0, 70.0])
+        self.assertEqual(list(batch["risk_level"]), ["Low", "High"])
+
+    def test_batch_rejects_out_of_range_rates(self) -> None:
+        """Negative and >200% turnover rates should raise like run() reports them."""
+
+        with self.assertRaises(ValueError):
+            run_batch([10.0, -1.0])
+        with self.assertRaises(ValueError):
+            run_batch([250.0])